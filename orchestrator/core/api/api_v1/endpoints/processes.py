@@ -31,7 +31,6 @@ from more_itertools import chunked, first, last
 from sentry_sdk.tracing import trace
 from sqlalchemy import CompoundSelect, Select, select
 from sqlalchemy.orm import defer, joinedload
-from sqlalchemy.sql.functions import count
 from starlette.responses import Response
 
 from oauth2_lib.fastapi import OIDCUserModel
@@ -63,11 +62,13 @@ from orchestrator.core.security import authenticate
 from orchestrator.core.services.process_broadcast_thread import api_broadcast_process_data
 from orchestrator.core.services.processes import (
     SYSTEM_USER,
+    ProcessProgress,
     _async_resume_processes,
     _get_process,
     abort_process,
     can_be_resumed,
     continue_awaiting_process,
+    get_process_status_counts,
     load_process,
     resume_process,
     start_process,
@@ -78,6 +79,7 @@ from orchestrator.core.settings import app_settings
 from orchestrator.core.utils.auth import AuthContext, Authorizer
 from orchestrator.core.utils.enrich_process import enrich_process
 from orchestrator.core.utils.errors import StartPredicateError
+from orchestrator.core.utils.response_cache import cached_response
 from orchestrator.core.websocket import (
     WS_CHANNELS,
     broadcast_invalidate_status_counts,
@@ -122,6 +124,14 @@ def get_steps_to_evaluate_for_rbac(pstat: ProcessStat) -> StepList:
     return StepList(past_steps >> first(remaining_steps))
 
 
+def get_steps_to_evaluate_for_rbac_by_progress(workflow: Workflow, progress: ProcessProgress) -> StepList:
+    """Same as `get_steps_to_evaluate_for_rbac`, for when only the progress of the process is known."""
+    if progress.is_complete or progress.cleared_steps >= len(workflow.steps):
+        return workflow.steps
+
+    return StepList(workflow.steps[: progress.cleared_steps + 1])
+
+
 def get_auth_callbacks(steps: StepList, workflow: Workflow | None) -> tuple[Authorizer | None, Authorizer | None]:
     """Iterate over workflow and prior steps to determine correct authorization callbacks for the current step.
 
@@ -446,16 +456,9 @@ def status_counts() -> ProcessStatusCounts:
 
     Cheap dashboard-style summary; use before listing to gauge system state.
     """
-
-    stmt = (
-        select(ProcessTable)
-        .with_only_columns(ProcessTable.is_task, ProcessTable.last_status, count(ProcessTable.last_status))
-        .group_by(ProcessTable.is_task, ProcessTable.last_status)
-    )
-    rows = db.session.execute(stmt).all()
-    return ProcessStatusCounts(
-        process_counts={status: num_processes for is_task, status, num_processes in rows if not is_task},
-        task_counts={status: num_processes for is_task, status, num_processes in rows if is_task},
+    # Starting, suspending and completing a process only send `processes` events
+    return ProcessStatusCounts.model_validate(
+        cached_response(["processStatusCounts", "processes"], "process-status-counts", get_process_status_counts)
     )
 
 
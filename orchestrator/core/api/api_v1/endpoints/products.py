@@ -29,6 +29,7 @@ from orchestrator.core.schemas.product import ProductPatchSchema
 from orchestrator.core.search.core.types import EntityType
 from orchestrator.core.search.indexing import run_indexing_for_entity
 from orchestrator.core.types import SubscriptionLifecycle
+from orchestrator.core.utils.response_cache import invalidate_response_cache_async
 
 router = APIRouter()
 
@@ -141,4 +142,5 @@ async def _patch_product(
         product.status = new_status
 
     db.session.commit()
+    await invalidate_response_cache_async({"type": "products"})
     return product
@@ -44,7 +44,6 @@ from orchestrator.core.schemas.subscription import SubscriptionDomainModelSchema
 from orchestrator.core.security import authenticate
 from orchestrator.core.services.subscriptions import (
     format_extended_domain_model,
-    format_special_types,
     get_subscription,
     subscription_workflows,
 )
@@ -96,8 +95,13 @@ def _apply_auth_reason(workflow_dict: dict[str, Any], current_user: OIDCUserMode
 def _authorized_subscription_workflows(
     subscription: SubscriptionTable, current_user: OIDCUserModel | None
 ) -> dict[str, list[dict[str, list[Any] | str]]]:
-    subscription_workflows_dict = subscription_workflows(subscription)
+    return authorize_subscription_workflows(subscription_workflows(subscription), current_user)
 
+
+def authorize_subscription_workflows(
+    subscription_workflows_dict: dict[str, Any], current_user: OIDCUserModel | None
+) -> dict[str, Any]:
+    """Stamp the workflows the user is not allowed to start with an insufficient-permissions reason."""
     all_workflow_dicts = itertools.chain.from_iterable(
         subscription_workflows_dict[target.lower()] for target in Target.values()
     )
@@ -129,8 +133,7 @@ async def subscription_details_by_id_with_domain_model(
             response.status_code = HTTPStatus.NOT_MODIFIED
             return None
         response.headers["ETag"] = etag
-        filtered = format_extended_domain_model(model, filter_owner_relations=filter_owner_relations)
-        return format_special_types(filtered)
+        return format_extended_domain_model(model, filter_owner_relations=filter_owner_relations)
 
     try:
         subscription, etag = await get_subscription_dict(subscription_id)
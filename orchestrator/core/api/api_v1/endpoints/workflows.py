@@ -22,6 +22,7 @@ from orchestrator.core.db import db
 from orchestrator.core.db.models import WorkflowTable
 from orchestrator.core.mcp.server import AGENT_EXPOSED_TAG, READONLY_TOOL
 from orchestrator.core.schemas.workflow import WorkflowPatchSchema, WorkflowSchema
+from orchestrator.core.utils.response_cache import invalidate_response_cache_async
 
 router = APIRouter()
 
@@ -59,4 +60,5 @@ async def _patch_workflow_description(
     description = updated_properties.get("description", workflow.description)
     workflow.description = description
     db.session.commit()
+    await invalidate_response_cache_async({"type": "workflows"})
     return workflow
@@ -17,7 +17,7 @@ provides the ability to run the CLI.
 """
 
 import inspect
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Iterable
 from contextlib import asynccontextmanager
 from typing import Any, cast
 
@@ -47,12 +47,13 @@ from orchestrator.core.api.error_handling import ProblemDetailException
 from orchestrator.core.cli.main import app as cli_app
 from orchestrator.core.db import db, init_database, warn_db_uri_scheme
 from orchestrator.core.db.database import BaseModel, DBSessionMiddleware
-from orchestrator.core.db.listeners import monitor_sqlalchemy_queries
+from orchestrator.core.db.listeners import add_query_observer, monitor_sqlalchemy_queries
 from orchestrator.core.db.loaders import init_model_loaders
 from orchestrator.core.distlock import init_distlock_manager
 from orchestrator.core.domain import SUBSCRIPTION_MODEL_REGISTRY, SubscriptionModel
 from orchestrator.core.exception_handlers import problem_detail_handler, query_validation_handler
 from orchestrator.core.graphql import Mutation, Query, create_graphql_router
+from orchestrator.core.graphql.extensions.resolver_stats import record_resolver_query
 from orchestrator.core.graphql.schema import ContextGetterFactory
 from orchestrator.core.graphql.schemas.subscription import SubscriptionInterface
 from orchestrator.core.graphql.types import ScalarOverrideType, StrawberryModelType
@@ -65,8 +66,9 @@ from orchestrator.core.services.process_broadcast_thread import ProcessDataBroad
 from orchestrator.core.services.worker_status_monitor import get_worker_status_monitor
 from orchestrator.core.settings import AppSettings, ExecutorType, app_settings, get_authorizers
 from orchestrator.core.utils.auth import Authorizer
+from orchestrator.core.utils.response_cache import init_response_cache
 from orchestrator.core.version import GIT_COMMIT_HASH
-from orchestrator.core.websocket import init_websocket_manager
+from orchestrator.core.websocket import broadcast_bridge, init_websocket_manager
 from pydantic_forms.exception_handlers.fastapi import form_error_handler
 from pydantic_forms.exceptions import FormException
 
@@ -151,19 +153,24 @@ class OrchestratorCore(FastAPI):
         """
         initialise_logging(LOGGER_OVERRIDES)
         init_model_loaders()
-        if base_settings.ENABLE_GRAPHQL_STATS_EXTENSION:
+        if base_settings.ENABLE_GRAPHQL_STATS_EXTENSION or base_settings.ENABLE_GRAPHQL_RESOLVER_STATS_EXTENSION:
             monitor_sqlalchemy_queries()
+        if base_settings.ENABLE_GRAPHQL_RESOLVER_STATS_EXTENSION:
+            add_query_observer(record_resolver_query)
 
         self.auth_manager = AuthManager()
         self.base_settings = base_settings
         websocket_manager = init_websocket_manager(base_settings)
         distlock_manager = init_distlock_manager(base_settings)
+        init_response_cache(base_settings)
 
         startup_functions: list[Callable] = [distlock_manager.connect_redis]
         shutdown_functions: list[Callable] = [distlock_manager.disconnect_redis]
         if websocket_manager.enabled:
             startup_functions.append(websocket_manager.connect_redis)
-            shutdown_functions.extend([websocket_manager.disconnect_all, websocket_manager.disconnect_redis])
+            shutdown_functions.extend(
+                [broadcast_bridge.stop, websocket_manager.disconnect_all, websocket_manager.disconnect_redis]
+            )
 
         # Initialize worker status monitor for accurate running process counts
         self.worker_status_monitor = get_worker_status_monitor()
@@ -328,7 +335,29 @@ class OrchestratorCore(FastAPI):
         scalar_overrides: ScalarOverrideType | None = None,
         extensions: list | None = None,
         custom_context_getter: ContextGetterFactory | None = None,
+        query_cache_size: int = 0,
+        persisted_queries: Iterable[str] | None = None,
+        only_persisted_queries: bool = False,
     ) -> None:
+        """Register the GraphQL router, or replace the schema of the registered router.
+
+        Args:
+            query: The GraphQL query type.
+            mutation: The GraphQL mutation type.
+            register_models: Register GraphQL types for the domain models in the SUBSCRIPTION_MODEL_REGISTRY.
+            subscription_interface: The interface implemented by the subscription types.
+            graphql_models: Existing GraphQL types, defaults to the types of orchestrator-core.
+            scalar_overrides: Scalar type overrides for the schema.
+            extensions: Schema extensions, defaults to the extensions enabled in the app settings.
+            custom_context_getter: Factory for the GraphQL context getter.
+            query_cache_size: Number of parsed and validated query documents to keep in an LRU cache, 0 to disable.
+            persisted_queries: Query documents that clients can send by their sha256 hash instead of in full, see
+                `orchestrator.core.graphql.extensions.persisted_queries`.
+            only_persisted_queries: Reject query documents that are not in `persisted_queries`.
+
+        Returns:
+            None
+        """
         new_router = create_graphql_router(
             self.auth_manager,
             query,
@@ -340,6 +369,9 @@ class OrchestratorCore(FastAPI):
             scalar_overrides,
             extensions=extensions,
             custom_context_getter=custom_context_getter,
+            query_cache_size=query_cache_size,
+            persisted_queries=persisted_queries,
+            only_persisted_queries=only_persisted_queries,
         )
         if not self.graphql_router:
             self.graphql_router = new_router
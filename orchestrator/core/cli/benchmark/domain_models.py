@@ -0,0 +1,214 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure loading and saving domain models of synthetic product block hierarchies."""
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+from uuid import UUID, uuid4
+
+import structlog
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from orchestrator.core.cli.benchmark.hierarchy import HierarchySpec, build_subscription, create_product
+from orchestrator.core.db import db, init_database
+from orchestrator.core.db.listeners import disable_listeners, monitor_sqlalchemy_queries
+from orchestrator.core.domain import SubscriptionModel
+from orchestrator.core.settings import SubscriptionSaveStrategy, app_settings
+from orchestrator.core.types import SubscriptionLifecycle
+from orchestrator.core.utils.get_subscription_dict import get_subscription_dict
+
+logger = structlog.get_logger(__name__)
+console = Console()
+
+app: typer.Typer = typer.Typer()
+
+
+@dataclass
+class OperationResult:
+    """Measurements of one domain model operation, one per subscription."""
+
+    operation: str
+    durations: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    peak_memory: int = 0
+
+    @property
+    def p95(self) -> float:
+        return statistics.quantiles(self.durations, n=20)[-1] if len(self.durations) > 1 else self.durations[0]
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.results: dict[str, OperationResult] = {}
+
+    def _queries_completed(self) -> int:
+        return db.session.connection().info.get("queries_completed", 0)
+
+    def warm_up(self, operation: str, func: Callable[[], Any]) -> Any:
+        """Run `func` once without timing it and record the peak memory it allocated."""
+        tracemalloc.start()
+        try:
+            result = func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.results.setdefault(operation, OperationResult(operation)).peak_memory = peak
+        return result
+
+    def measure(self, operation: str, func: Callable[[], Any]) -> Any:
+        """Run `func` and record its duration and the number of queries it executed."""
+        queries_before = self._queries_completed()
+        start = time.perf_counter()
+        result = func()
+        duration = time.perf_counter() - start
+
+        operation_result = self.results.setdefault(operation, OperationResult(operation))
+        operation_result.durations.append(duration)
+        operation_result.queries.append(self._queries_completed() - queries_before)
+        return result
+
+
+def run_domain_model_benchmark(
+    spec: HierarchySpec, subscriptions: int, strategy: SubscriptionSaveStrategy | None = None
+) -> list[OperationResult]:
+    """Measure saving and loading subscriptions of a synthetic product block hierarchy.
+
+    Every operation is run once before it is measured, this run records the peak memory. The products and
+    subscriptions are created in the current database transaction, the caller commits or rolls back.
+
+    Args:
+        spec: Shape of the product block hierarchy.
+        subscriptions: Number of subscriptions to measure every operation with.
+        strategy: Save strategy, defaults to `app_settings.SUBSCRIPTION_SAVE_STRATEGY`.
+
+    Returns:
+        The measurements of `save`, `from_subscription`, `from_other_lifecycle` and `get_subscription_dict`.
+    """
+    recorder = _Recorder()
+    customer_id = str(uuid4())
+
+    def save(subscription: SubscriptionModel) -> UUID:
+        subscription.save(strategy=strategy)
+        db.session.flush()
+        return subscription.subscription_id
+
+    def load(subscription_id: UUID) -> SubscriptionModel:
+        # Make sure the subscription is read from the database instead of the session
+        db.session.expunge_all()
+        return SubscriptionModel.from_subscription(subscription_id)
+
+    def to_active(subscription: SubscriptionModel) -> SubscriptionModel:
+        return SubscriptionModel.from_other_lifecycle(subscription, SubscriptionLifecycle.ACTIVE)
+
+    def to_dict(subscription_id: UUID) -> dict:
+        db.session.expunge_all()
+        subscription, _ = asyncio.run(get_subscription_dict(subscription_id))
+        return subscription
+
+    monitor_sqlalchemy_queries()
+    try:
+        product = create_product(spec)
+        shared_with = None
+        if spec.shared:
+            shared_with = build_subscription(product, customer_id)
+            save(shared_with)
+
+        recorder.warm_up("save", lambda: save(build_subscription(product, customer_id, shared_with)))
+        subscription_ids = []
+        for _ in range(subscriptions):
+            subscription = build_subscription(product, customer_id, shared_with)
+            subscription_ids.append(recorder.measure("save", partial(save, subscription)))
+
+        recorder.warm_up("from_subscription", lambda: load(subscription_ids[0]))
+        recorder.warm_up("from_other_lifecycle", lambda: to_active(load(subscription_ids[0])))
+        recorder.warm_up("get_subscription_dict", lambda: to_dict(subscription_ids[0]))
+        for subscription_id in subscription_ids:
+            db.session.expunge_all()
+            loaded = recorder.measure(
+                "from_subscription", partial(SubscriptionModel.from_subscription, subscription_id)
+            )
+            recorder.measure("from_other_lifecycle", partial(to_active, loaded))
+            recorder.measure("get_subscription_dict", partial(to_dict, subscription_id))
+    finally:
+        disable_listeners()
+
+    return list(recorder.results.values())
+
+
+def _print_results(spec: HierarchySpec, subscriptions: int, results: list[OperationResult]) -> None:
+    console.print(
+        f"[bold blue]Domain model benchmark[/bold blue] - {subscriptions} subscriptions of {spec.block_count} "
+        f"product blocks (depth {spec.depth}, fan-out {spec.fan_out}, list size {spec.list_size}, "
+        f"shared {spec.shared})"
+    )
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Operation", style="dim")
+    table.add_column("Mean", justify="right", style="cyan")
+    table.add_column("P95", justify="right", style="cyan")
+    table.add_column("Queries", justify="right", style="yellow")
+    table.add_column("Peak memory", justify="right", style="green")
+
+    for result in results:
+        table.add_row(
+            result.operation,
+            f"{statistics.mean(result.durations) * 1000:.1f}ms",
+            f"{result.p95 * 1000:.1f}ms",
+            f"{statistics.mean(result.queries):.1f}",
+            f"{result.peak_memory / 1024:.0f}KiB",
+        )
+
+    console.print(table)
+
+
+@app.command(name="domain-models")
+def domain_models(
+    depth: int = typer.Option(3, help="Number of nested product block levels"),
+    fan_out: int = typer.Option(2, help="Number of child product blocks of every product block"),
+    list_size: int = typer.Option(5, help="Number of leaf product blocks in the list of every product block"),
+    shared: int = typer.Option(0, help="Number of leaf product blocks used from another subscription"),
+    subscriptions: int = typer.Option(10, min=1, help="Number of subscriptions to measure"),
+    strategy: SubscriptionSaveStrategy | None = typer.Option(None, help="Save strategy, defaults to the setting"),
+    keep: bool = typer.Option(False, help="Commit the generated products and subscriptions instead of removing them"),
+) -> None:
+    """Measure loading and saving the domain models of a synthetic product block hierarchy.
+
+    Generates a product with the given hierarchy of product blocks and reports the latency, number of queries and
+    peak memory of `save`, `SubscriptionModel.from_subscription`, `SubscriptionModel.from_other_lifecycle` and
+    `get_subscription_dict`.
+    """
+    try:
+        spec = HierarchySpec(depth=depth, fan_out=fan_out, list_size=list_size, shared=shared)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+    if not app_settings.TESTING:
+        init_database(app_settings)
+
+    with db.database_scope():
+        try:
+            results = run_domain_model_benchmark(spec, subscriptions, strategy)
+            if keep:
+                db.session.commit()
+        finally:
+            db.session.rollback()
+
+    _print_results(spec, subscriptions, results)
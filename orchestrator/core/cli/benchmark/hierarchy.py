@@ -0,0 +1,213 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Generate synthetic product block hierarchies to benchmark the domain models.
+
+Every block of the hierarchy has two resource types, `fan_out` child blocks of the next level and a list of
+`list_size` leaf blocks, up to `depth` levels. The root block can also use `shared` leaf blocks of another
+subscription, which gives the leaf blocks of that subscription in use by relations.
+"""
+
+import types
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+from orchestrator.core.db import ProductBlockTable, ProductTable, ResourceTypeTable, db
+from orchestrator.core.domain import SUBSCRIPTION_MODEL_REGISTRY
+from orchestrator.core.domain.base import ProductBlockModel, SubscriptionModel
+from orchestrator.core.types import SubscriptionLifecycle
+
+RESOURCE_TYPES = {"benchmark_int": int, "benchmark_str": str}
+
+
+@dataclass(frozen=True)
+class HierarchySpec:
+    """The shape of a synthetic product block hierarchy."""
+
+    depth: int = 3
+    fan_out: int = 2
+    list_size: int = 5
+    shared: int = 0
+
+    def __post_init__(self) -> None:
+        if self.depth < 1 or self.fan_out < 0 or self.list_size < 0 or self.shared < 0:
+            raise ValueError("Depth must be at least 1, fan-out, list size and shared can't be negative")
+        if self.shared > self.list_size:
+            raise ValueError("Can't share more leaf blocks than the list size")
+
+    @property
+    def name(self) -> str:
+        """Product name, the product blocks are named after it."""
+        return f"Benchmark_d{self.depth}_f{self.fan_out}_l{self.list_size}_s{self.shared}"
+
+    @property
+    def block_count(self) -> int:
+        """Number of product blocks owned by a subscription of this hierarchy."""
+        blocks_per_level = [self.fan_out**level for level in range(self.depth)]
+        return sum(blocks * (1 + self.list_size) for blocks in blocks_per_level)
+
+
+class BenchmarkProduct(NamedTuple):
+    spec: HierarchySpec
+    product_id: UUID
+    model: type[SubscriptionModel]
+    levels: list[type[ProductBlockModel]]
+    leaf: type[ProductBlockModel]
+
+
+def _new_class(name: str, base: type, fields: dict[str, Any], **kwargs: Any) -> Any:
+    """Create a domain model class, `fields` maps the field names to their type or a tuple of type and default."""
+    annotations = {key: value[0] if isinstance(value, tuple) else value for key, value in fields.items()}
+    defaults = {key: value[1] for key, value in fields.items() if isinstance(value, tuple)}
+
+    def fill_namespace(namespace: dict[str, Any]) -> None:
+        namespace.update({"__annotations__": annotations, "__module__": __name__} | defaults)
+
+    return types.new_class(name, (base,), kwargs, fill_namespace)
+
+
+def _new_block_classes(name: str, child_fields: dict[str, Any]) -> tuple[Any, Any]:
+    """Create the inactive and active domain model of a product block.
+
+    Args:
+        name: Name of the product block.
+        child_fields: Maps the names of the product block fields to the inactive and active model they refer to, in a
+            list if the field is a list of product blocks.
+
+    Returns:
+        The inactive and active model.
+    """
+    inactive_fields: dict[str, Any] = {name: (type_ | None, None) for name, type_ in RESOURCE_TYPES.items()}
+    active_fields: dict[str, Any] = dict(RESOURCE_TYPES)
+    for field_name, (inactive, active) in child_fields.items():
+        if isinstance(inactive, list):
+            inactive_fields[field_name] = (types.GenericAlias(list, inactive[0]), [])
+            active_fields[field_name] = types.GenericAlias(list, active[0])
+        else:
+            inactive_fields[field_name] = (inactive | None, None)
+            active_fields[field_name] = active
+
+    inactive_model = _new_class(name, ProductBlockModel, inactive_fields, product_block_name=name)
+    active_model = _new_class(f"{name}_active", inactive_model, active_fields, lifecycle=[SubscriptionLifecycle.ACTIVE])
+    return inactive_model, active_model
+
+
+def _get_or_create_resource_types() -> list[ResourceTypeTable]:
+    stmt = select(ResourceTypeTable).where(ResourceTypeTable.resource_type.in_(RESOURCE_TYPES))
+    existing = {resource_type.resource_type: resource_type for resource_type in db.session.scalars(stmt)}
+    return [
+        existing.get(name) or ResourceTypeTable(resource_type=name, description=f"Benchmark {name}")
+        for name in RESOURCE_TYPES
+    ]
+
+
+def _get_or_create_block(
+    name: str, resource_types: list[ResourceTypeTable], depends_on: list[ProductBlockTable]
+) -> ProductBlockTable:
+    if block := db.session.scalars(select(ProductBlockTable).where(ProductBlockTable.name == name)).one_or_none():
+        return block
+
+    block = ProductBlockTable(name=name, description=f"Benchmark block {name}", tag="BENCH", status="active")
+    block.resource_types = resource_types
+    block.depends_on = depends_on
+    db.session.add(block)
+    return block
+
+
+def create_product(spec: HierarchySpec) -> BenchmarkProduct:
+    """Create the product and product blocks of the hierarchy in the database and their domain models.
+
+    Existing product blocks and products with the same name are reused. The domain models are created on every call
+    and registered in the `SUBSCRIPTION_MODEL_REGISTRY`, so a subscription can be loaded with `SubscriptionModel`.
+    """
+    resource_types = _get_or_create_resource_types()
+
+    leaf_name = f"{spec.name}_leaf"
+    leaf_db = _get_or_create_block(leaf_name, resource_types, [])
+    leaf = _new_block_classes(leaf_name, {})
+
+    # Build from the bottom level up, every level refers to the next one
+    levels: list[tuple[Any, Any]] = []
+    child_db: ProductBlockTable | None = None
+    for level in reversed(range(spec.depth)):
+        level_name = f"{spec.name}_level_{level}"
+        child_fields: dict[str, Any] = {"leaves": ([leaf[0]], [leaf[1]])}
+        if levels:
+            child_fields |= {f"child_{n}": levels[0] for n in range(spec.fan_out)}
+        if level == 0 and spec.shared:
+            child_fields["shared_leaves"] = ([leaf[0]], [leaf[1]])
+
+        depends_on = [leaf_db] + ([child_db] if child_db and spec.fan_out else [])
+        child_db = _get_or_create_block(level_name, resource_types, depends_on)
+        levels.insert(0, _new_block_classes(level_name, child_fields))
+
+    product_db = db.session.scalars(select(ProductTable).where(ProductTable.name == spec.name)).one_or_none()
+    if not product_db:
+        product_db = ProductTable(
+            name=spec.name,
+            description=f"Benchmark product {spec.name}",
+            product_type="Benchmark",
+            tag="BENCH",
+            status="active",
+        )
+        product_db.product_blocks = [child_db]
+        db.session.add(product_db)
+    db.session.flush()
+
+    model = _new_class(spec.name, SubscriptionModel, {"block": (levels[0][0] | None, None)}, is_base=True)
+    active_model = _new_class(
+        f"{spec.name}_active", model, {"block": levels[0][1]}, lifecycle=[SubscriptionLifecycle.ACTIVE]
+    )
+    SUBSCRIPTION_MODEL_REGISTRY[spec.name] = active_model
+    return BenchmarkProduct(spec, product_db.product_id, model, [inactive for inactive, _ in levels], leaf[0])
+
+
+def _new_block(
+    product: BenchmarkProduct, level: int, subscription_id: UUID, shared_leaves: list[ProductBlockModel]
+) -> ProductBlockModel:
+    spec = product.spec
+    fields: dict[str, Any] = {
+        "benchmark_int": level,
+        "benchmark_str": f"level {level}",
+        "leaves": [
+            product.leaf.new(subscription_id, benchmark_int=n, benchmark_str=f"leaf {n}") for n in range(spec.list_size)
+        ],
+    }
+    if level + 1 < spec.depth:
+        fields |= {f"child_{n}": _new_block(product, level + 1, subscription_id, []) for n in range(spec.fan_out)}
+    if level == 0 and spec.shared:
+        fields["shared_leaves"] = shared_leaves
+    return product.levels[level].new(subscription_id, **fields)
+
+
+def build_subscription(
+    product: BenchmarkProduct, customer_id: str, shared_with: SubscriptionModel | None = None
+) -> SubscriptionModel:
+    """Build a subscription with a complete hierarchy, the caller saves it.
+
+    Args:
+        product: The product created by `create_product`.
+        customer_id: Customer of the subscription.
+        shared_with: Subscription of the same product to use `spec.shared` leaf blocks of. Without it the
+            subscription uses no blocks of another subscription.
+
+    Returns:
+        The subscription in lifecycle initial.
+    """
+    subscription = product.model.from_product_id(product.product_id, customer_id, insync=True)
+    shared_leaves = shared_with.block.leaves[: product.spec.shared] if shared_with else []  # type: ignore[attr-defined]
+    block = _new_block(product, 0, subscription.subscription_id, shared_leaves)
+    subscription.block = block  # type: ignore[attr-defined]
+    return subscription
@@ -18,6 +18,7 @@ from orchestrator.core.cli import (
     generate,
     scheduler,
 )
+from orchestrator.core.cli.benchmark import domain_models
 from orchestrator.core.cli.search import index_llm, resize_embedding, search_explore, speedtest
 
 app = typer.Typer()
@@ -36,6 +37,7 @@ app.add_typer(
     name="speedtest",
     help="Search performance testing and analysis.",
 )
+app.add_typer(domain_models.app, name="benchmark", help="Benchmark the domain models.")
 
 
 if __name__ == "__main__":
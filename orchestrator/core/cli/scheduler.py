@@ -20,6 +20,7 @@ from apscheduler.job import Job
 from redis import Redis
 
 from orchestrator.core.db import db
+from orchestrator.core.schedules.leader import SchedulerLeaderLock
 from orchestrator.core.schedules.scheduler import (
     get_all_scheduler_tasks,
     get_scheduler,
@@ -38,6 +39,39 @@ from orchestrator.core.utils.redis_client import create_redis_client
 app: typer.Typer = typer.Typer()
 
 
+def _get_scheduled_task_item_from_queue(redis_conn: Redis) -> tuple[str, bytes] | None:
+    """Get an item from the Redis Queue for scheduler tasks."""
+    try:
+        return redis_conn.brpop(SCHEDULER_QUEUE, timeout=1)
+    except ConnectionError as e:
+        typer.echo(f"There was a connection error with Redis. Retrying in 3 seconds... {e}")
+        time.sleep(3)
+    except Exception as e:
+        typer.echo(f"There was an unexpected error with Redis. Retrying in 1 second... {e}")
+        time.sleep(1)
+
+    return None
+
+
+def _run_as_leader(leader_lock: SchedulerLeaderLock, redis_connection: Redis) -> None:
+    """Run the scheduler until this instance is no longer the leader."""
+    with get_scheduler() as scheduler_connection:
+        next_check = time.monotonic() + app_settings.SCHEDULER_LEADER_CHECK_INTERVAL
+        while True:
+            if time.monotonic() >= next_check:
+                if not leader_lock.check():
+                    typer.echo("Lost the scheduler leader lock, stopping the scheduler")
+                    return
+                next_check = time.monotonic() + app_settings.SCHEDULER_LEADER_CHECK_INTERVAL
+
+            item = _get_scheduled_task_item_from_queue(redis_connection)
+            if not item:
+                continue
+
+            with db.database_scope():
+                workflow_scheduler_queue(item, scheduler_connection)
+
+
 @app.command()
 def run() -> None:
     """Starts the scheduler in the foreground.
@@ -46,30 +80,26 @@ def run() -> None:
 
       * Periodically wake up when the next schedule is due for execution, and run it
       * Process schedule changes made through the schedule API
-    """
 
-    def _get_scheduled_task_item_from_queue(redis_conn: Redis) -> tuple[str, bytes] | None:
-        """Get an item from the Redis Queue for scheduler tasks."""
-        try:
-            return redis_conn.brpop(SCHEDULER_QUEUE, timeout=1)
-        except ConnectionError as e:
-            typer.echo(f"There was a connection error with Redis. Retrying in 3 seconds... {e}")
-            time.sleep(3)
-        except Exception as e:
-            typer.echo(f"There was an unexpected error with Redis. Retrying in 1 second... {e}")
-            time.sleep(1)
-
-        return None
-
-    with get_scheduler() as scheduler_connection:
-        redis_connection = create_redis_client(app_settings.CACHE_URI.get_secret_value())
+    Several schedulers can be started for high availability. One of them is elected as leader and runs the scheduled
+    tasks, the others stand by until the leader stops.
+    """
+    leader_lock = SchedulerLeaderLock(db.engine)
+    redis_connection = create_redis_client(app_settings.CACHE_URI.get_secret_value())
+    standby_reported = False
+    try:
         while True:
-            item = _get_scheduled_task_item_from_queue(redis_connection)
-            if not item:
+            if not leader_lock.acquire():
+                if not standby_reported:
+                    typer.echo("Another scheduler is the leader, standing by")
+                    standby_reported = True
+                time.sleep(app_settings.SCHEDULER_LEADER_CHECK_INTERVAL)
                 continue
 
-            with db.database_scope():
-                workflow_scheduler_queue(item, scheduler_connection)
+            standby_reported = False
+            _run_as_leader(leader_lock, redis_connection)
+    finally:
+        leader_lock.release()
 
 
 def _to_schedule_row(task: Job, *, api_managed_ids: set[str], verbose: bool) -> list[str]:
@@ -23,6 +23,7 @@ from orchestrator.core.db.models import (  # noqa: F401
     EngineSettingsTable,
     FixedInputTable,
     InputStateTable,
+    ProcessStatusCountsTable,
     ProcessStepTable,
     ProcessSubscriptionTable,
     ProcessTable,
@@ -36,6 +37,7 @@ from orchestrator.core.db.models import (  # noqa: F401
     SubscriptionInstanceValueTable,
     SubscriptionMetadataTable,
     SubscriptionTable,
+    SubscriptionValidationResultTable,
     UtcTimestamp,
     UtcTimestampError,
     WorkflowTable,
@@ -116,6 +118,7 @@ __all__ = [
     "SubscriptionTable",
     "ProcessSubscriptionTable",
     "ProcessTable",
+    "ProcessStatusCountsTable",
     "ProcessStepTable",
     "ProductTable",
     "ProductBlockTable",
@@ -123,6 +126,7 @@ __all__ = [
     "SubscriptionInstanceTable",
     "SubscriptionInstanceValueTable",
     "SubscriptionMetadataTable",
+    "SubscriptionValidationResultTable",
     "ResourceTypeTable",
     "FixedInputTable",
     "InputStateTable",
@@ -142,6 +146,7 @@ ALL_DB_MODELS: list[type[DbBaseModel]] = [
     EngineSettingsTable,
     FixedInputTable,
     InputStateTable,
+    ProcessStatusCountsTable,
     ProcessStepTable,
     ProcessSubscriptionTable,
     ProcessTable,
@@ -155,5 +160,6 @@ ALL_DB_MODELS: list[type[DbBaseModel]] = [
     SubscriptionInstanceValueTable,
     SubscriptionMetadataTable,
     SubscriptionTable,
+    SubscriptionValidationResultTable,
     WorkflowTable,
 ]
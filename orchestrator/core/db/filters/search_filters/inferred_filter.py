@@ -17,8 +17,7 @@ from typing import Any, Callable
 import pytz
 import sqlalchemy
 from dateutil.parser import parse
-from sqlalchemy import BinaryExpression, Cast, ColumnClause, ColumnElement, String, cast
-from sqlalchemy.sql.functions import coalesce
+from sqlalchemy import BinaryExpression, Cast, ColumnClause, ColumnElement, String, and_, cast
 from sqlalchemy.sql.operators import eq
 
 from orchestrator.core.settings import app_settings
@@ -51,24 +50,32 @@ def _phrase_to_ilike_str(phrase_node: Node) -> str:
     return " ".join(to_str(w) for w in phrase_node[1])
 
 
-def _coalesce_if_nullable(field: ColumnElement, default_value: Any = "") -> ColumnElement:
+def _is_nullable(field: ColumnElement) -> bool:
     if isinstance(field, Cast):
-        is_nullable = field.wrapped_column_expression.nullable
-    else:
-        is_nullable = getattr(field, "nullable", False)
-    return coalesce(field, default_value) if is_nullable else field
+        return field.wrapped_column_expression.nullable
+    return getattr(field, "nullable", False)
 
 
 def _filter_string(field: ColumnElement) -> WhereCondGenerator:
-    field = _coalesce_if_nullable(field)
+    """Match a string column with ILIKE.
 
-    def _clause_gen(node: Node) -> BinaryExpression:
+    The column is compared as is, so the trigram indexes on the filterable columns can be used. For nullable columns
+    NULL is excluded explicitly instead of coalescing it to an empty string, which keeps a negated filter matching the
+    rows without a value.
+    """
+    is_nullable = _is_nullable(field)
+
+    def _match(clause: ColumnElement[bool]) -> ColumnElement[bool]:
+        return and_(field.is_not(None), clause) if is_nullable else clause
+
+    def _clause_gen(node: Node) -> ColumnElement[bool]:
         if node[0] == "Phrase":
-            return field.ilike(_phrase_to_ilike_str(node))
+            return _match(field.ilike(_phrase_to_ilike_str(node)))
         if node[0] == "ValueGroup":
             vals = [w[1] for w in node[1] if w[0] in ["Word", "PrefixWord"]]  # Only works for (Prefix)Words atm
-            return field.in_(vals)
-        return field.ilike(f"{node[1]}") if app_settings.FILTER_BY_MODE == "exact" else field.ilike(f"%{node[1]}%")
+            return _match(field.in_(vals))
+        pattern = f"{node[1]}" if app_settings.FILTER_BY_MODE == "exact" else f"%{node[1]}%"
+        return _match(field.ilike(pattern))
 
     return _clause_gen
 
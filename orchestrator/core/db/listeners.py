@@ -19,9 +19,26 @@ from sqlalchemy import Connection, event
 from sqlalchemy.engine import Engine
 
 _listener_registry: list[tuple[Any, str, Callable[..., None]]] = []
+_query_observers: list[Callable[[float], None]] = []
+
+
+def add_query_observer(observer: Callable[[float], None]) -> None:
+    """Call `observer` with the duration of every query that completes while the queries are monitored.
+
+    The observer is called in the thread (and context) that executed the query. Adding the same observer again has
+    no effect.
+    """
+    if observer not in _query_observers:
+        _query_observers.append(observer)
 
 
 def monitor_sqlalchemy_queries() -> None:
+    """Monitor the queries of all engines, until `disable_listeners()` is called.
+
+    Calling this again while the queries are monitored has no effect, so every query is counted once.
+    """
+    if _listener_registry:
+        return
 
     @event.listens_for(Engine, "before_cursor_execute")
     def before_cursor_execute(conn: Connection, *_args: Any) -> None:
@@ -35,6 +52,8 @@ def monitor_sqlalchemy_queries() -> None:
         conn.info["queries_completed"] = conn.info.get("queries_completed", 0) + 1
         total = time.time() - conn.info["query_start_time"].pop(-1)
         conn.info["query_time_spent"] = conn.info.get("query_time_spent", 0.0) + total
+        for observer in _query_observers:
+            observer(total)
 
     _listener_registry.append((Engine, "after_cursor_execute", after_cursor_execute))
 
@@ -43,3 +62,4 @@ def disable_listeners() -> None:
     while _listener_registry:
         listener = _listener_registry.pop()
         event.remove(*listener)
+    _query_observers.clear()
@@ -171,6 +171,18 @@ class ProcessTable(BaseModel):
         return self.workflow.name
 
 
+class ProcessStatusCountsTable(BaseModel):
+    """Number of processes per status, maintained by a trigger on the processes table."""
+
+    __tablename__ = "process_status_counts"
+
+    is_task = mapped_column(Boolean, nullable=False)
+    last_status = mapped_column(String(50), nullable=False)
+    process_count = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (PrimaryKeyConstraint("is_task", "last_status", name="pk_process_status_counts"),)
+
+
 class ProcessStepTable(BaseModel):
     __tablename__ = "process_steps"
 
@@ -703,6 +715,23 @@ class SubscriptionMetadataTable(BaseModel):
         return db.session.get(cls, subscription_id)
 
 
+class SubscriptionValidationResultTable(BaseModel):
+    """Outcome of the last run of a validation workflow for a subscription by the validation runner."""
+
+    __tablename__ = "subscription_validation_results"
+
+    subscription_id = mapped_column(
+        UUIDType, ForeignKey("subscriptions.subscription_id", ondelete="CASCADE"), nullable=False
+    )
+    workflow_name = mapped_column(String(), nullable=False)
+    passed = mapped_column(Boolean(), nullable=False)
+    validated_at = mapped_column(UtcTimestamp, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("subscription_id", "workflow_name", name="pk_subscription_validation_results"),
+    )
+
+
 class SubscriptionSearchView(BaseModel):
     __tablename__ = "subscriptions_search"
     __table_args__ = {"info": {"materialized_view": True}}
@@ -880,7 +909,7 @@ class APSchedulerJobStoreModel(BaseModel):
     __tablename__ = "apscheduler_jobs"
 
     id = mapped_column(String(191), primary_key=True)
-    next_run_time = mapped_column(Float, nullable=True)
+    next_run_time = mapped_column(Float, nullable=True, index=True)
     job_state = mapped_column(LargeBinary, nullable=False)
 
 
@@ -10,11 +10,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, cast
 
 from structlog import get_logger
 
-from orchestrator.core.distlock.distlock_manager import DistLockManager
+from orchestrator.core.distlock.distlock_manager import DistLockManager, Lease
 from orchestrator.core.settings import AppSettings
 
 logger = get_logger(__name__)
@@ -24,6 +26,11 @@ async def empty_fn(*args: tuple, **kwargs: dict[str, Any]) -> None:
     return
 
 
+@asynccontextmanager
+async def empty_lease(*args: tuple, **kwargs: dict[str, Any]) -> AsyncIterator[None]:
+    yield None
+
+
 class WrappedDistLockManager:
     def __init__(self, wrappee: DistLockManager | None = None) -> None:
         self.wrapped_distlock_manager = wrappee
@@ -43,7 +50,7 @@ class WrappedDistLockManager:
             )
         if attr != "enabled" and not self.wrapped_distlock_manager.enabled:
             logger.warning("Distributed Locking is disabled, unable to access class methods")
-            return empty_fn
+            return empty_lease if attr == "lease" else empty_fn
 
         return getattr(self.wrapped_distlock_manager, attr)
 
@@ -63,6 +70,7 @@ def init_distlock_manager(settings: AppSettings) -> DistLockManager:
 
 
 __all__ = [
+    "Lease",
     "distlock_manager",
     "init_distlock_manager",
 ]
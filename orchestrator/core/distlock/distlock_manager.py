@@ -10,24 +10,53 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import random
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from time import monotonic
 from typing import Union
 
 from pydantic import RedisDsn
+from structlog import get_logger
 
 from orchestrator.core.distlock.managers.memory_distlock_manager import Lock as MemoryLock
 from orchestrator.core.distlock.managers.memory_distlock_manager import MemoryDistLockManager
 from orchestrator.core.distlock.managers.redis_distlock_manager import Lock as RedisLock
 from orchestrator.core.distlock.managers.redis_distlock_manager import RedisDistLockManager
 
+logger = get_logger(__name__)
+
 DistLock = Union[MemoryLock, RedisLock]
 
+# Initial upper bound of the random wait between attempts to acquire a lock, doubled after every attempt
+ACQUIRE_BACKOFF_SECONDS = 0.05
+
+
+@dataclass
+class Lease:
+    """A lock that is renewed in the background for as long as it is held.
+
+    The fencing token increases every time the resource is locked. Store it with every write that the lock protects
+    and let the storage reject writes with a token lower than the last one it has seen, so a holder whose lease
+    expired unnoticed (e.g. during a long GC pause) can not overwrite the writes of the next holder.
+    """
+
+    resource: str
+    lock: DistLock
+    fencing_token: int
+    expiration_seconds: int
+    lost: bool = False
+
 
 class DistLockManager:
     """Provides an interface to lock access to a resource in a distributed system.
 
     The lock is advisory; it is up to the caller to respect it.
 
-    Creating a lock is non-blocking, it succeeds or fails immediately.
+    Creating a lock with `get_lock` is non-blocking, it succeeds or fails immediately. `acquire_lock` waits
+    for the lock, `lease` also renews it for as long as it is held and hands out a fencing token.
 
     Locks are to be created with an expiration period after which the backend
     implementation must release it.
@@ -61,3 +90,83 @@ class DistLockManager:
 
     def release_sync(self, resource: DistLock) -> None:
         self._backend.release_sync(resource)  # type: ignore
+
+    async def acquire_lock(
+        self, resource: str, expiration_seconds: int, blocking_timeout: float, max_backoff: float = 1.0
+    ) -> DistLock | None:
+        """Wait at most `blocking_timeout` seconds for the lock.
+
+        Between attempts it waits a random time up to a bound that doubles after every attempt until `max_backoff`,
+        so waiting instances do not retry in lockstep.
+
+        Returns:
+            The lock, or None if it could not be acquired in time.
+        """
+        deadline = monotonic() + blocking_timeout
+        backoff = ACQUIRE_BACKOFF_SECONDS
+        while (lock := await self.get_lock(resource, expiration_seconds)) is None:
+            if (remaining := deadline - monotonic()) <= 0:
+                return None
+            await asyncio.sleep(min(remaining, random.uniform(0, backoff)))  # noqa: S311
+            backoff = min(max_backoff, backoff * 2)
+        return lock
+
+    async def extend_lock(self, lock: DistLock, expiration_seconds: int) -> bool:
+        """Reset the expiration of a held lock, returns False if the lock is no longer held."""
+        return await self._backend.extend_lock(lock, expiration_seconds)  # type: ignore
+
+    async def get_fencing_token(self, lock: DistLock) -> int | None:
+        """Return the next fencing token of the locked resource, or None if the lock is no longer held."""
+        return await self._backend.get_fencing_token(lock)  # type: ignore
+
+    async def _renew(self, lease: Lease) -> None:
+        interval = max(lease.expiration_seconds / 3, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                extended = await self.extend_lock(lease.lock, lease.expiration_seconds)
+            except Exception:
+                # E.g. the backend is unreachable, the lock may expire before it is reachable again
+                logger.exception("Failed to renew the lease on resource", resource=lease.resource)
+                extended = False
+            if not extended:
+                lease.lost = True
+                logger.warning("Lost the lease on resource", resource=lease.resource)
+                return
+
+    @asynccontextmanager
+    async def lease(
+        self, resource: str, expiration_seconds: int, blocking_timeout: float = 0
+    ) -> AsyncIterator[Lease | None]:
+        """Hold the lock on `resource` for the duration of the context, renewing it in the background.
+
+        The lease is renewed every third of `expiration_seconds`. When a renewal fails, `Lease.lost` is set and the
+        critical section should stop; the fencing token protects the writes it still makes.
+
+        Args:
+            resource: Name of the resource to lock.
+            expiration_seconds: Expiration of the lock when it is not renewed.
+            blocking_timeout: Maximum number of seconds to wait for the lock.
+
+        Yields:
+            The lease, or None if the lock could not be acquired in time.
+        """
+        if not (lock := await self.acquire_lock(resource, expiration_seconds, blocking_timeout)):
+            yield None
+            return
+
+        if (fencing_token := await self.get_fencing_token(lock)) is None:
+            # Expired right after it was acquired
+            yield None
+            return
+
+        lease = Lease(resource, lock, fencing_token, expiration_seconds)
+        renewal = asyncio.create_task(self._renew(lease))
+        try:
+            yield lease
+        finally:
+            renewal.cancel()
+            with suppress(asyncio.CancelledError):
+                await renewal
+            if not lease.lost:
+                await self.release_lock(lock)
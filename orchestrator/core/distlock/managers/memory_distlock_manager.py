@@ -31,6 +31,7 @@ class MemoryDistLockManager(Thread):
 
     manager_lock: Lock = Lock()
     locks: dict[str, tuple[Lock, float]] = {}
+    fencing_tokens: dict[str, int] = {}
 
     def __init__(self) -> None:
         super().__init__()
@@ -69,6 +70,25 @@ class MemoryDistLockManager(Thread):
     def release_sync(self, lock: Lock) -> None:
         asyncio.run(self.release_lock(lock))
 
+    def _find_resource(self, lock: Lock) -> str | None:
+        return next((resource for resource, (resource_lock, _) in self.locks.items() if lock is resource_lock), None)
+
+    async def extend_lock(self, lock: Lock, expiration_seconds: int) -> bool:
+        with self.manager_lock:
+            if (resource := self._find_resource(lock)) is None:
+                logger.debug("Can not extend a lock that is no longer held")
+                return False
+            self.locks[resource] = lock, time() + expiration_seconds
+            return True
+
+    async def get_fencing_token(self, lock: Lock) -> int | None:
+        with self.manager_lock:
+            if (resource := self._find_resource(lock)) is None:
+                return None
+            token = self.fencing_tokens.get(resource, 0) + 1
+            self.fencing_tokens[resource] = token
+            return token
+
     def run(self) -> None:
         while True:
             with self.manager_lock:
@@ -11,6 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import cast
+
 from pydantic import RedisDsn
 from redis import Redis
 from redis.asyncio import Redis as AIORedis
@@ -19,11 +21,18 @@ from redis.exceptions import LockError
 from redis.lock import Lock as SyncLock
 from structlog import get_logger
 
-from orchestrator.core.settings import app_settings
 from orchestrator.core.utils.redis_client import create_redis_asyncio_client, create_redis_client
 
 logger = get_logger(__name__)
 
+# Increment the fencing token of a lock, but only while the lock is still held with the given token
+INCREMENT_FENCE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('incr', KEYS[2])
+end
+return nil
+"""
+
 
 class RedisDistLockManager:
     """Create Distributed Locks in Redis.
@@ -35,6 +44,7 @@ class RedisDistLockManager:
 
     def __init__(self, redis_address: RedisDsn):
         self.redis_conn: AIORedis | None = None
+        self.sync_redis_conn: Redis | None = None
         self.redis_address = redis_address
 
     async def connect_redis(self) -> None:
@@ -43,6 +53,15 @@ class RedisDistLockManager:
     async def disconnect_redis(self) -> None:
         if self.redis_conn:
             await self.redis_conn.close()
+        if self.sync_redis_conn:
+            self.sync_redis_conn.close()
+            self.sync_redis_conn = None
+
+    def _get_sync_redis_conn(self) -> Redis:
+        # The client keeps a connection pool, which is safe to share between threads
+        if not self.sync_redis_conn:
+            self.sync_redis_conn = create_redis_client(self.redis_address)
+        return self.sync_redis_conn
 
     async def get_lock(self, resource: str, expiration_seconds: int) -> Lock | None:
         if not self.redis_conn:
@@ -77,11 +96,9 @@ class RedisDistLockManager:
 
     # https://github.com/aio-libs/aioredis-py/issues/1273
     def release_sync(self, lock: Lock) -> None:
-        redis_conn: Redis | None = None
         try:
-            redis_conn = create_redis_client(app_settings.CACHE_URI.get_secret_value())
             sync_lock: SyncLock = SyncLock(
-                redis=redis_conn,
+                redis=self._get_sync_redis_conn(),
                 name=lock.name,  # type: ignore
                 timeout=lock.timeout,
                 blocking=False,
@@ -91,9 +108,26 @@ class RedisDistLockManager:
             sync_lock.release()
         except LockError:
             logger.Exception("Could not release lock for resource", resource=lock.name)
-        finally:
-            if redis_conn:
-                redis_conn.close()
+
+    async def extend_lock(self, lock: Lock, expiration_seconds: int) -> bool:
+        if not self.redis_conn:
+            return False
+
+        try:
+            return await lock.extend(float(expiration_seconds), replace_ttl=True)
+        except LockError:
+            # Includes LockNotOwnedError, the lock expired and may be held by someone else
+            logger.warning("Could not extend lock for resource", resource=lock.name)
+            return False
+
+    async def get_fencing_token(self, lock: Lock) -> int | None:
+        if not self.redis_conn or lock.local.token is None:
+            return None
+
+        fencing_token = self.redis_conn.register_script(INCREMENT_FENCE_SCRIPT)
+        name = cast(str, lock.name)
+        token = await fencing_token(keys=[name, f"{name}:fencing-token"], args=[lock.local.token])
+        return int(token) if token is not None else None
 
 
 __all__ = [
@@ -20,6 +20,7 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Collection,
     Iterable,
     Mapping,
     Optional,
@@ -49,9 +50,12 @@ from orchestrator.core.db import (
 )
 from orchestrator.core.db.queries.subscription_instance import get_subscription_instance_dict
 from orchestrator.core.domain.helpers import (
+    IncludeTree,
     _to_product_block_field_type_iterable,
     get_root_blocks_to_instance_ids,
+    include_tree,
     no_private_attrs,
+    normalize_field_name,
 )
 from orchestrator.core.domain.lifecycle import (
     ProductLifecycle,
@@ -64,6 +68,7 @@ from orchestrator.core.domain.subscription_instance_transform import (
     transform_instance_fields,
 )
 from orchestrator.core.services.products import get_product_by_id
+from orchestrator.core.settings import SubscriptionSaveStrategy, app_settings
 from orchestrator.core.types import (
     SAFE_USED_BY_TRANSITIONS_FOR_STATUS,
     SubscriptionLifecycle,
@@ -88,6 +93,7 @@ class ProductNotInRegistryError(Exception):
 
 
 T = TypeVar("T")  # pragma: no mutate
+D = TypeVar("D", bound="DomainModel")  # pragma: no mutate
 S = TypeVar("S", bound="SubscriptionModel")  # pragma: no mutate
 B = TypeVar("B", bound="ProductBlockModel")  # pragma: no mutate
 
@@ -397,6 +403,46 @@ class DomainModel(BaseModel):
                 data[field_name] = field_type._from_other_lifecycle(value, status, subscription_id)
         return data
 
+    @classmethod
+    def _from_partial_data(cls: type[D], data: dict[str, Any], include: IncludeTree) -> D:
+        """Create a model from `data`, only validating the product block fields that are in `include`.
+
+        Product block fields that are not in `include` are set to None (or an empty list) without validation. Fields
+        that are included with a selection of subfields are created recursively, all other fields are validated
+        as usual.
+
+        Args:
+            data: The field values, as passed to the model constructor.
+            include: The fields to include, as returned by `include_tree()`.
+        """
+        model = cast(D, cls.model_construct())
+        for field_name in cls.model_fields:
+            if field_name in cls._product_block_fields_:
+                model._set_partial_product_block(
+                    field_name, data.get(field_name), include.get(normalize_field_name(field_name))
+                )
+            elif field_name in data:
+                setattr(model, field_name, data[field_name])
+        return model
+
+    def _set_partial_product_block(self, field_name: str, value: Any, include: IncludeTree | None) -> None:
+        field_type = self._product_block_fields_[field_name]
+        if include is None:
+            self.__dict__[field_name] = [] if is_list_type(field_type) else None
+            return
+
+        product_block_types = flatten_product_block_types(field_type)
+        if not include or value is None or len(product_block_types) != 1:
+            # Included without a selection of subfields, or ambiguous: validate the complete value
+            setattr(self, field_name, value)
+            return
+
+        product_block_type = one(product_block_types.values())
+        if isinstance(value, list):
+            self.__dict__[field_name] = [product_block_type._from_partial_data(item, include) for item in value]
+        else:
+            self.__dict__[field_name] = product_block_type._from_partial_data(value, include)
+
     def _save_instances(
         self, subscription_id: UUID, status: SubscriptionLifecycle
     ) -> tuple[list[SubscriptionInstanceTable], dict[str, list[SubscriptionInstanceTable]]]:
@@ -1046,6 +1092,7 @@ class SubscriptionModel(DomainModel):
     product: ProductModel
     customer_id: str
     _db_model: SubscriptionTable | None = PrivateAttr(default=None)
+    _partially_loaded: bool = PrivateAttr(default=False)
     subscription_id: UUID = Field(default_factory=uuid4)  # pragma: no mutate
     description: str = "Initial subscription"  # pragma: no mutate
     status: SubscriptionLifecycle = SubscriptionLifecycle.INITIAL  # pragma: no mutate
@@ -1138,6 +1185,7 @@ class SubscriptionModel(DomainModel):
     def _load_root_instances(
         cls,
         subscription_id: UUID | UUIDstr,
+        field_names: Collection[str] | None = None,
     ) -> dict[str, Optional[dict] | list[dict]]:
         """Load root subscription instance(s) for this subscription model.
 
@@ -1152,11 +1200,15 @@ class SubscriptionModel(DomainModel):
         data for the root subscription instance, it can rely on Pydantic to instantiate the root block and all
         nested blocks in one go. This is also why it does not have the params `status` and `match_domain_attr` because
         this information is already encoded in the domain model of a product.
+
+        Root product block fields that are not in `field_names` (when given) are not loaded and left empty.
         """
         root_block_instance_ids = get_root_blocks_to_instance_ids(subscription_id)
 
         root_block_types = {
             field_name: list(flatten_product_block_types(product_block_type).keys())
+            if field_names is None or field_name in field_names
+            else []
             for field_name, product_block_type in cls._product_block_fields_.items()
         }
 
@@ -1379,8 +1431,15 @@ class SubscriptionModel(DomainModel):
             raise
 
     @classmethod
-    def from_subscription(cls: type[S], subscription_id: UUID | UUIDstr) -> S:
-        """Use a subscription_id to return required fields of an existing subscription."""
+    def from_subscription(cls: type[S], subscription_id: UUID | UUIDstr, include: Iterable[str] | None = None) -> S:
+        """Use a subscription_id to return required fields of an existing subscription.
+
+        Args:
+            subscription_id: The subscription to load.
+            include: Optional dotted paths of the fields to load, like `["block.sub_block.int_field"]`. Product block
+                subtrees that are not on one of these paths are not loaded or validated and left empty (None or []).
+                A partially loaded subscription can not be saved.
+        """
         from orchestrator.core.domain.context_cache import get_from_cache, store_in_cache
 
         if cached_model := get_from_cache(subscription_id):
@@ -1408,10 +1467,16 @@ class SubscriptionModel(DomainModel):
 
         fixed_inputs = {fi.name: fi.value for fi in subscription.product.fixed_inputs}
 
-        instances = cls._load_root_instances(subscription_id)
+        include_fields = include_tree(include) if include is not None else None
+        root_field_names = (
+            [name for name in cls._product_block_fields_ if normalize_field_name(name) in include_fields]
+            if include_fields is not None
+            else None
+        )
+        instances = cls._load_root_instances(subscription_id, root_field_names)
 
         try:
-            model = cls(
+            data: dict[str, Any] = dict(
                 product=product,
                 customer_id=subscription.customer_id,
                 subscription_id=subscription.subscription_id,
@@ -1425,9 +1490,15 @@ class SubscriptionModel(DomainModel):
                 **fixed_inputs,
                 **instances,
             )
+            if include_fields is None:
+                model = cls(**data)
+            else:
+                model = cls._from_partial_data(data, include_fields)
+                model._partially_loaded = True
             model.db_model = subscription
 
-            store_in_cache(model)
+            if not model._partially_loaded:
+                store_in_cache(model)
 
             return model
         except ValidationError:
@@ -1436,14 +1507,34 @@ class SubscriptionModel(DomainModel):
             )
             raise
 
-    def save(self) -> None:
-        """Save the subscription to the database."""
+    def save(self, *, strategy: SubscriptionSaveStrategy | None = None) -> None:
+        """Save the subscription to the database.
+
+        Args:
+            strategy: How to save the subscription instances, defaults to `app_settings.SUBSCRIPTION_SAVE_STRATEGY`.
+                With `orm` every product block is saved through the ORM, with `bulk` the whole tree is diffed
+                against the database and written with a few set-based statements.
+
+        """
+        if self._partially_loaded:
+            raise ValueError("A partially loaded subscription can not be saved")
+
         specialized_type = lookup_specialized_type(self.__class__, self.status)
         if specialized_type and not isinstance(self, specialized_type):
             raise ValueError(
                 f"Lifecycle status {self.status.value} requires specialized type {specialized_type!r}, was: {type(self)!r}"
             )
 
+        strategy = strategy or app_settings.SUBSCRIPTION_SAVE_STRATEGY
+        if strategy == SubscriptionSaveStrategy.BULK:
+            # Import here to prevent cyclic imports
+            from orchestrator.core.domain.bulk_save import bulk_save_subscription_instances
+
+            sub = self._save_subscription_table(db.session.get(SubscriptionTable, self.subscription_id))
+            bulk_save_subscription_instances(self)
+            db.session.expire(sub, ["instances"])
+            return
+
         existing_sub = db.session.get(
             SubscriptionTable,
             self.subscription_id,
@@ -1454,24 +1545,7 @@ class SubscriptionModel(DomainModel):
                 selectinload(SubscriptionTable.instances).selectinload(SubscriptionInstanceTable.values),
             ],
         )
-        if not (sub := (existing_sub or self.db_model)):
-            raise ValueError("Cannot save SubscriptionModel without a db_model")
-
-        # Make sure we refresh the object and not use an already mapped object
-        db.session.refresh(sub)
-
-        self.db_model = sub
-        sub.product_id = self.product.product_id
-        sub.customer_id = self.customer_id
-        sub.description = self.description
-        sub.status = self.status.value
-        sub.insync = self.insync
-        sub.start_date = self.start_date
-        sub.end_date = self.end_date
-        sub.note = self.note
-
-        db.session.add(sub)
-        db.session.flush()  # Sends INSERT and returns subscription_id without committing transaction
+        sub = self._save_subscription_table(existing_sub)
 
         old_instances_dict = {instance.subscription_instance_id: instance for instance in sub.instances}
 
@@ -1497,6 +1571,28 @@ class SubscriptionModel(DomainModel):
 
         db.session.flush()
 
+    def _save_subscription_table(self, existing_sub: SubscriptionTable | None) -> SubscriptionTable:
+        """Write the subscription fields to the database model and flush it."""
+        if not (sub := (existing_sub or self.db_model)):
+            raise ValueError("Cannot save SubscriptionModel without a db_model")
+
+        # Make sure we refresh the object and not use an already mapped object
+        db.session.refresh(sub)
+
+        self.db_model = sub
+        sub.product_id = self.product.product_id
+        sub.customer_id = self.customer_id
+        sub.description = self.description
+        sub.status = self.status.value
+        sub.insync = self.insync
+        sub.start_date = self.start_date
+        sub.end_date = self.end_date
+        sub.note = self.note
+
+        db.session.add(sub)
+        db.session.flush()  # Sends INSERT and returns subscription_id without committing transaction
+        return sub
+
     @property
     def db_model(self) -> SubscriptionTable | None:
         if not self._db_model:
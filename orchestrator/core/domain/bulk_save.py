@@ -0,0 +1,413 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Set-based save strategy for subscription models.
+
+The default `SubscriptionModel.save()` walks the product block tree and lets the ORM unit of work write each
+subscription instance, instance value and instance relation separately. For subscriptions with thousands of instances
+that results in thousands of statements.
+
+The bulk strategy in this module first collects all rows that should exist for the subscription, diffs them against
+one read of the stored rows and then applies the difference with a fixed number of set-based statements.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Any, NamedTuple
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy import delete, inspect, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+
+from orchestrator.core.db import (
+    ResourceTypeTable,
+    SubscriptionInstanceRelationTable,
+    SubscriptionInstanceTable,
+    SubscriptionInstanceValueTable,
+    db,
+)
+from orchestrator.core.db.models import product_block_resource_type_association
+from orchestrator.core.domain.lifecycle import lookup_specialized_type
+from orchestrator.core.types import SubscriptionLifecycle, is_list_type, is_optional_type, is_union_type
+
+if TYPE_CHECKING:
+    from orchestrator.core.domain.base import DomainModel, ProductBlockModel, SubscriptionModel
+
+logger = structlog.get_logger(__name__)
+
+
+class RelationKey(NamedTuple):
+    in_use_by_id: UUID
+    depends_on_id: UUID
+    order_id: int
+
+
+class StoredInstance(NamedTuple):
+    subscription_id: UUID
+    label: str | None
+
+
+@dataclass
+class SubscriptionInstanceRows:
+    """All rows that should be stored for the subscription instances owned by one subscription."""
+
+    blocks: dict[UUID, "ProductBlockModel"] = field(default_factory=dict)
+    values: dict[UUID, dict[str, list[str]]] = field(default_factory=dict)
+    relations: dict[RelationKey, str] = field(default_factory=dict)
+    foreign_ids: set[UUID] = field(default_factory=set)
+
+
+def iter_depends_on_blocks(model: "DomainModel") -> Iterator[tuple[str, list["ProductBlockModel"]]]:
+    """Yield the product block field names of a domain model together with the blocks they contain."""
+    for field_name, field_type in model._product_block_fields_.items():
+        value = getattr(model, field_name)
+        if is_list_type(field_type):
+            yield field_name, list(value)
+        elif (is_optional_type(field_type) or is_union_type(field_type)) and value is None:
+            continue
+        else:
+            yield field_name, [value]
+
+
+def _serialize_instance_values(block: "ProductBlockModel") -> dict[str, list[str]]:
+    """Return the instance values of a product block as they are stored in the database."""
+    instance_values = {}
+    for field_name, field_type in block._non_product_block_fields_.items():
+        value = getattr(block, field_name)
+        if value is None:
+            continue
+        if is_list_type(field_type):
+            instance_values[field_name] = [str(val) for val in value if val is not None]
+        else:
+            instance_values[field_name] = [str(value)]
+    return instance_values
+
+
+def _get_stored_instances(*clauses: Any) -> dict[UUID, StoredInstance]:
+    rows = db.session.execute(
+        select(
+            SubscriptionInstanceTable.subscription_instance_id,
+            SubscriptionInstanceTable.subscription_id,
+            SubscriptionInstanceTable.label,
+        ).where(*clauses)
+    ).all()
+    return {row.subscription_instance_id: StoredInstance(row.subscription_id, row.label) for row in rows}
+
+
+def _check_block(block: "ProductBlockModel", status: SubscriptionLifecycle) -> None:
+    """Run the checks that `ProductBlockModel.save()` does before writing a block."""
+    if not block.name:
+        raise ValueError(f"Cannot create instance of abstract class. Use one of {block.__names__}")
+
+    specialized_type = lookup_specialized_type(block.__class__, status)
+    if specialized_type and not isinstance(block, specialized_type):
+        raise ValueError(
+            f"Lifecycle status {status} requires specialized type {specialized_type!r}, was: {type(block)!r}"
+        )
+
+    block._check_duplicate_instance_relations()
+    block._fix_pb_data()
+
+
+def collect_subscription_instance_rows(
+    model: "SubscriptionModel", stored_instances: dict[UUID, StoredInstance]
+) -> SubscriptionInstanceRows:
+    """Walk the product block tree of a subscription and collect the rows that should be stored.
+
+    A product block is foreign when it is owned by another subscription and already exists in the database. For
+    foreign blocks only the relation is stored, just like `ProductBlockModel.save()` does. Blocks owned by another
+    subscription are looked up in batches; `stored_instances` is updated with the result.
+
+    Args:
+        model: The subscription model to save
+        stored_instances: The stored instances of the subscription, by subscription instance id
+
+    Returns:
+        The rows for all instances owned by the subscription
+
+    """
+    subscription_id = model.subscription_id
+    rows = SubscriptionInstanceRows()
+    new_block_ids: set[UUID] = set()
+
+    def visit(blocks: Iterable["ProductBlockModel"]) -> list["ProductBlockModel"]:
+        """Collect rows for the given blocks and their children; return blocks of unknown ownership."""
+        unresolved = []
+        stack = list(blocks)
+        while stack:
+            block = stack.pop()
+            block_id = block.subscription_instance_id
+            if block_id in rows.blocks or block_id in rows.foreign_ids:
+                continue
+
+            if block.owner_subscription_id != subscription_id and block_id not in new_block_ids:
+                if block_id in stored_instances:
+                    rows.foreign_ids.add(block_id)
+                else:
+                    unresolved.append(block)
+                continue
+
+            _check_block(block, model.status)
+            rows.blocks[block_id] = block
+            rows.values[block_id] = _serialize_instance_values(block)
+            for field_name, depends_on_blocks in iter_depends_on_blocks(block):
+                for order_id, depends_on_block in enumerate(depends_on_blocks):
+                    key = RelationKey(block_id, depends_on_block.subscription_instance_id, order_id)
+                    rows.relations[key] = field_name
+                stack.extend(depends_on_blocks)
+        return unresolved
+
+    model._check_duplicate_instance_relations()
+    root_blocks = [block for _, blocks in iter_depends_on_blocks(model) for block in blocks]
+
+    unresolved = visit(root_blocks)
+    while unresolved:
+        unresolved_ids = {block.subscription_instance_id for block in unresolved}
+        stored_instances.update(
+            _get_stored_instances(SubscriptionInstanceTable.subscription_instance_id.in_(unresolved_ids))
+        )
+        # Blocks that do not exist yet are saved as part of this subscription
+        new_blocks = [block for block in unresolved if block.subscription_instance_id not in stored_instances]
+        new_block_ids.update(block.subscription_instance_id for block in new_blocks)
+        rows.foreign_ids.update(unresolved_ids - new_block_ids)
+        unresolved = visit(new_blocks)
+
+    if any(block.subscription_instance_id in rows.foreign_ids for block in root_blocks):
+        raise ValueError(
+            "Attempting to save a Foreign `Subscription Instance` directly below a subscription. This is not allowed."
+        )
+
+    return rows
+
+
+def _get_resource_type_ids(product_block_ids: Iterable[UUID]) -> dict[UUID, dict[str, UUID]]:
+    rows = db.session.execute(
+        select(
+            product_block_resource_type_association.c.product_block_id,
+            ResourceTypeTable.resource_type,
+            ResourceTypeTable.resource_type_id,
+        )
+        .join(ResourceTypeTable)
+        .where(product_block_resource_type_association.c.product_block_id.in_(set(product_block_ids)))
+    ).all()
+    resource_type_ids: dict[UUID, dict[str, UUID]] = defaultdict(dict)
+    for product_block_id, resource_type, resource_type_id in rows:
+        resource_type_ids[product_block_id][resource_type] = resource_type_id
+    return resource_type_ids
+
+
+def _diff_instances(
+    subscription_id: UUID, rows: SubscriptionInstanceRows, stored_instances: dict[UUID, StoredInstance]
+) -> tuple[list[dict], set[UUID]]:
+    upserts = [
+        {
+            "subscription_instance_id": block_id,
+            "subscription_id": subscription_id,
+            "product_block_id": block.product_block_id,
+            "label": block.label,
+        }
+        for block_id, block in rows.blocks.items()
+        if stored_instances.get(block_id) != StoredInstance(subscription_id, block.label)
+    ]
+    removed = {
+        instance_id
+        for instance_id, stored in stored_instances.items()
+        if stored.subscription_id == subscription_id and instance_id not in rows.blocks
+    }
+    return upserts, removed
+
+
+def _diff_values(rows: SubscriptionInstanceRows) -> tuple[list[dict], list[dict], set[UUID]]:
+    resource_type_ids = _get_resource_type_ids(block.product_block_id for block in rows.blocks.values())
+
+    desired: dict[tuple[UUID, UUID], list[str]] = {}
+    for block_id, instance_values in rows.values.items():
+        block = rows.blocks[block_id]
+        resource_types = resource_type_ids[block.product_block_id]
+        for field_name in block._non_product_block_fields_:
+            assert field_name in resource_types, (  # noqa: S101
+                f"Domain model {block.__class__} does not match the ProductBlockTable {block.name}, missing: {field_name} {resource_types}"
+            )
+        for field_name, values in instance_values.items():
+            desired[(block_id, resource_types[field_name])] = values
+
+    stored: dict[tuple[UUID, UUID], list[tuple[UUID, str]]] = defaultdict(list)
+    stored_rows = db.session.execute(
+        select(
+            SubscriptionInstanceValueTable.subscription_instance_value_id,
+            SubscriptionInstanceValueTable.subscription_instance_id,
+            SubscriptionInstanceValueTable.resource_type_id,
+            SubscriptionInstanceValueTable.value,
+        )
+        .where(SubscriptionInstanceValueTable.subscription_instance_id.in_(rows.blocks))
+        .order_by(SubscriptionInstanceValueTable.value)
+    ).all()
+    for value_id, instance_id, resource_type_id, value in stored_rows:
+        stored[(instance_id, resource_type_id)].append((value_id, value))
+
+    inserts: list[dict] = []
+    updates: list[dict] = []
+    removed: set[UUID] = set()
+    for key in desired.keys() | stored.keys():
+        instance_id, resource_type_id = key
+        for value, stored_value in zip_longest(desired.get(key, []), stored.get(key, [])):
+            if stored_value is None:
+                inserts.append(
+                    {
+                        "subscription_instance_value_id": uuid4(),
+                        "subscription_instance_id": instance_id,
+                        "resource_type_id": resource_type_id,
+                        "value": value,
+                    }
+                )
+            elif value is None:
+                removed.add(stored_value[0])
+            elif value != stored_value[1]:
+                updates.append({"subscription_instance_value_id": stored_value[0], "value": value})
+    return inserts, updates, removed
+
+
+def _diff_relations(rows: SubscriptionInstanceRows) -> tuple[list[dict], set[RelationKey]]:
+    stored_rows = db.session.execute(
+        select(
+            SubscriptionInstanceRelationTable.in_use_by_id,
+            SubscriptionInstanceRelationTable.depends_on_id,
+            SubscriptionInstanceRelationTable.order_id,
+            SubscriptionInstanceRelationTable.domain_model_attr,
+        ).where(SubscriptionInstanceRelationTable.in_use_by_id.in_(rows.blocks))
+    ).all()
+    stored = {RelationKey(*row[:3]): row.domain_model_attr for row in stored_rows}
+
+    upserts = [
+        key._asdict() | {"domain_model_attr": domain_model_attr}
+        for key, domain_model_attr in rows.relations.items()
+        if key not in stored or stored[key] != domain_model_attr
+    ]
+    removed = stored.keys() - rows.relations.keys()
+    return upserts, removed
+
+
+def _sync_session(removed_instances: set[UUID], removed_values: set[UUID], removed_relations: set[RelationKey]) -> None:
+    """Bring ORM objects of subscription instances in the session in line with the rows that were written."""
+    instance_tables = (SubscriptionInstanceTable, SubscriptionInstanceValueTable, SubscriptionInstanceRelationTable)
+    for obj in list(db.session.identity_map.values()):
+        if not isinstance(obj, instance_tables) or (identity := inspect(obj).identity) is None:
+            continue
+        match obj:
+            case SubscriptionInstanceTable():
+                deleted = identity[0] in removed_instances
+            case SubscriptionInstanceValueTable():
+                deleted = (
+                    identity[0] in removed_values
+                    or inspect(obj).dict.get("subscription_instance_id") in removed_instances
+                )
+            case SubscriptionInstanceRelationTable():
+                key = RelationKey(*identity)
+                deleted = key in removed_relations or not removed_instances.isdisjoint(key[:2])
+        if deleted:
+            db.session.expunge(obj)
+        else:
+            db.session.expire(obj)
+
+
+def bulk_save_subscription_instances(model: "SubscriptionModel") -> None:
+    """Save all subscription instances of a subscription model with set-based statements.
+
+    The subscription row itself must already be flushed. The result is the same as saving the product block tree
+    with `ProductBlockModel.save()`: instances, values and relations that are no longer part of the model are removed,
+    and instances owned by other subscriptions only get their relation stored.
+
+    Args:
+        model: The subscription model to save
+
+    """
+    subscription_id = model.subscription_id
+    stored_instances = _get_stored_instances(SubscriptionInstanceTable.subscription_id == subscription_id)
+    rows = collect_subscription_instance_rows(model, stored_instances)
+
+    instance_upserts, removed_instances = _diff_instances(subscription_id, rows, stored_instances)
+    value_inserts, value_updates, removed_values = _diff_values(rows)
+    relation_upserts, removed_relations = _diff_relations(rows)
+
+    if instance_upserts:
+        stmt = insert(SubscriptionInstanceTable)
+        db.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[SubscriptionInstanceTable.subscription_instance_id],
+                set_={
+                    SubscriptionInstanceTable.subscription_id: stmt.excluded.subscription_id,
+                    SubscriptionInstanceTable.label: stmt.excluded.label,
+                },
+            ),
+            instance_upserts,
+        )
+    if removed_values:
+        db.session.execute(
+            delete(SubscriptionInstanceValueTable).where(
+                SubscriptionInstanceValueTable.subscription_instance_value_id.in_(removed_values)
+            )
+        )
+    if value_updates:
+        db.session.execute(update(SubscriptionInstanceValueTable), value_updates)
+    if value_inserts:
+        db.session.execute(insert(SubscriptionInstanceValueTable), value_inserts)
+    if removed_relations:
+        db.session.execute(
+            delete(SubscriptionInstanceRelationTable).where(
+                tuple_(
+                    SubscriptionInstanceRelationTable.in_use_by_id,
+                    SubscriptionInstanceRelationTable.depends_on_id,
+                    SubscriptionInstanceRelationTable.order_id,
+                ).in_(removed_relations)
+            )
+        )
+    if relation_upserts:
+        stmt = insert(SubscriptionInstanceRelationTable)
+        db.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    SubscriptionInstanceRelationTable.in_use_by_id,
+                    SubscriptionInstanceRelationTable.depends_on_id,
+                    SubscriptionInstanceRelationTable.order_id,
+                ],
+                set_={SubscriptionInstanceRelationTable.domain_model_attr: stmt.excluded.domain_model_attr},
+            ),
+            relation_upserts,
+        )
+    if removed_instances:
+        db.session.execute(
+            delete(SubscriptionInstanceTable).where(
+                SubscriptionInstanceTable.subscription_instance_id.in_(removed_instances)
+            )
+        )
+
+    _sync_session(removed_instances, removed_values, removed_relations)
+    for block in rows.blocks.values():
+        # The db model is loaded again on first use, a new block still refers to its transient db model
+        block._db_model = None
+
+    logger.debug(
+        "Saved subscription instances in bulk",
+        subscription_id=subscription_id,
+        instances=len(rows.blocks),
+        upserted_instances=len(instance_upserts),
+        removed_instances=len(removed_instances),
+        inserted_values=len(value_inserts),
+        updated_values=len(value_updates),
+        removed_values=len(removed_values),
+        upserted_relations=len(relation_upserts),
+        removed_relations=len(removed_relations),
+    )
@@ -74,3 +74,33 @@ def get_root_blocks_to_instance_ids(subscription_id: UUID | UUIDstr) -> dict[str
     ).all()
 
     return group_by_key(block_name_to_instance_id_rows)  # type: ignore[arg-type]
+
+
+def normalize_field_name(field_name: str) -> str:
+    """Normalize a field name so that snake_case and camelCase spellings of the same field compare equal.
+
+    Example:
+        >>> normalize_field_name("sub_block_2") == normalize_field_name("subBlock2")
+        True
+    """
+    return field_name.replace("_", "").lower()
+
+
+IncludeTree = dict[str, "IncludeTree"]
+
+
+def include_tree(paths: Iterable[str]) -> IncludeTree:
+    """Turn dotted field paths into a nested dict of normalized field names.
+
+    A field that is selected without subfields maps to an empty dict.
+
+    Example:
+        >>> include_tree(["block.sub_block.int_field", "block.str_field", "description"])
+        {'block': {'subblock': {'intfield': {}}, 'strfield': {}}, 'description': {}}
+    """
+    tree: IncludeTree = {}
+    for path in paths:
+        node = tree
+        for field_name in path.split("."):
+            node = node.setdefault(normalize_field_name(field_name), {})
+    return tree
@@ -0,0 +1,71 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persisted GraphQL queries.
+
+Clients send the sha256 hash of a known query document instead of the document itself, in the format of Apollo's
+persisted queries:
+
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "<hash of the query document>"}}}
+"""
+
+import hashlib
+from collections.abc import Iterable, Iterator
+
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+PERSISTED_QUERY_REQUIRED = "PERSISTED_QUERY_REQUIRED"
+
+
+def persisted_query_hash(document: str) -> str:
+    """Return the hash by which a client refers to a persisted query document."""
+    return hashlib.sha256(document.encode()).hexdigest()
+
+
+def make_persisted_queries_extension(
+    documents: Iterable[str], only_persisted_queries: bool = False
+) -> type[SchemaExtension]:
+    """Create an extension that resolves persisted queries from the given query documents.
+
+    Args:
+        documents: The query documents that clients can refer to by hash.
+        only_persisted_queries: Reject query documents that are not in `documents`, whether they are sent by hash
+            or in full.
+
+    Returns:
+        The extension class, to pass to the GraphQL schema as its first extension. Unknown queries are rejected by
+        raising in `on_operation`, before the extensions after it start the operation.
+    """
+    registry = {persisted_query_hash(document): document for document in documents}
+
+    class PersistedQueriesExtension(SchemaExtension):
+        def on_operation(self) -> Iterator[None]:
+            execution_context = self.execution_context
+            persisted_query = (execution_context.operation_extensions or {}).get("persistedQuery")
+
+            if persisted_query:
+                if not (document := registry.get(persisted_query.get("sha256Hash"))):
+                    raise GraphQLError("PersistedQueryNotFound", extensions={"code": PERSISTED_QUERY_NOT_FOUND})
+                execution_context.query = document
+            elif (
+                only_persisted_queries
+                and execution_context.query
+                and persisted_query_hash(execution_context.query) not in registry
+            ):
+                raise GraphQLError("Only persisted queries are allowed", extensions={"code": PERSISTED_QUERY_REQUIRED})
+
+            yield
+
+    return PersistedQueriesExtension
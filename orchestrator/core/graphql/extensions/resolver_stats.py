@@ -0,0 +1,195 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Attribute the cost of a GraphQL operation to the resolvers that caused it.
+
+The `ResolverStatsExtension` records, per resolved field (the parent type and field name, like
+`SubscriptionType.product`), the number of calls, the wall time and the database queries that were executed while the
+resolver ran. Unlike the path of a field, these do not depend on the aliases and list indexes in the query, which keeps
+the number of label values of the metrics bounded by the schema. It also records the batch sizes of the dataloaders in
+the context. The results of a sampled operation are returned in the `resolver_stats` extension result and observed in
+the Prometheus histograms of `orchestrator.core.metrics.graphql`.
+
+Database queries are attributed through a context variable, which is copied into the threads of `run_in_threadpool`.
+This requires `monitor_sqlalchemy_queries()` and `add_query_observer(record_resolver_query)`, which the
+OrchestratorCore app sets up when the extension is enabled.
+"""
+
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from inspect import isawaitable
+from typing import Any
+
+import structlog
+from graphql import GraphQLResolveInfo
+from strawberry.dataloader import DataLoader
+from strawberry.extensions import SchemaExtension
+
+from orchestrator.core.metrics.graphql import (
+    GRAPHQL_DATALOADER_BATCH_SIZE,
+    GRAPHQL_RESOLVER_DB_QUERIES,
+    GRAPHQL_RESOLVER_DURATION,
+)
+from orchestrator.core.metrics.workflows import observe
+from orchestrator.core.settings import app_settings
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class FieldStats:
+    calls: int = 0
+    time: float = 0.0
+    db_queries: int = 0
+    db_time: float = 0.0
+
+
+@dataclass
+class LoaderStats:
+    batches: int = 0
+    keys: int = 0
+    max_batch_size: int = 0
+
+
+@dataclass
+class ResolverStats:
+    """Statistics of one GraphQL operation."""
+
+    fields: defaultdict[str, FieldStats] = field(default_factory=lambda: defaultdict(FieldStats))
+    loaders: defaultdict[str, LoaderStats] = field(default_factory=lambda: defaultdict(LoaderStats))
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record_resolver(self, field_name: str, duration: float) -> None:
+        stats = self.fields[field_name]
+        stats.calls += 1
+        stats.time += duration
+
+    def record_query(self, field_name: str, duration: float) -> None:
+        # Queries can be executed concurrently in threadpool threads
+        with self.lock:
+            stats = self.fields[field_name]
+            stats.db_queries += 1
+            stats.db_time += duration
+
+    def record_batch(self, loader_name: str, size: int) -> None:
+        stats = self.loaders[loader_name]
+        stats.batches += 1
+        stats.keys += size
+        stats.max_batch_size = max(stats.max_batch_size, size)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fields": {field_name: asdict(stats) for field_name, stats in self.fields.items()},
+            "loaders": {name: asdict(stats) for name, stats in self.loaders.items()},
+        }
+
+
+_current_resolver: ContextVar[tuple[ResolverStats, str] | None] = ContextVar("current_resolver", default=None)
+
+
+def record_resolver_query(duration: float) -> None:
+    """Query observer that attributes a query to the resolver that is running, see `add_query_observer()`."""
+    if current := _current_resolver.get():
+        stats, field_name = current
+        stats.record_query(field_name, duration)
+
+
+def _resolver_field(info: GraphQLResolveInfo) -> str:
+    return f"{info.parent_type.name}.{info.field_name}"
+
+
+class ResolverStatsExtension(SchemaExtension):
+    """Gathers statistics per resolved field for a sample of the executed GraphQL operations.
+
+    The fraction of operations that is sampled is set with `GRAPHQL_RESOLVER_STATS_SAMPLE_RATE`. Operations that
+    are not sampled only pay for a call to `random.random()` and one extra function call per resolved field.
+    """
+
+    stats: ResolverStats | None = None
+
+    def on_operation(self, *args, **kwargs) -> Iterator[None]:  # type: ignore
+        if random.random() >= app_settings.GRAPHQL_RESOLVER_STATS_SAMPLE_RATE:  # noqa: S311
+            yield
+            return
+
+        self.stats = ResolverStats()
+
+        yield
+
+        self._observe_metrics(self.stats)
+        logger.debug("GraphQL resolver stats", query=self.execution_context.query, **self.stats.to_dict())
+
+    def on_execute(self, *args, **kwargs) -> Iterator[None]:  # type: ignore
+        if self.stats:
+            self._instrument_dataloaders(self.stats)
+        yield
+
+    def _instrument_dataloaders(self, stats: ResolverStats) -> None:
+        context = self.execution_context.context
+        for name, loader in vars(context).items():
+            if isinstance(loader, DataLoader):
+                loader.load_fn = self._batch_recorder(stats, name, loader.load_fn)
+
+    @staticmethod
+    def _batch_recorder(
+        stats: ResolverStats, name: str, load_fn: Callable[[list], Awaitable[Any]]
+    ) -> Callable[[list], Awaitable[Any]]:
+        async def load_fn_with_stats(keys: list) -> Any:
+            stats.record_batch(name, len(keys))
+            observe(GRAPHQL_DATALOADER_BATCH_SIZE, len(keys), name)
+            return await load_fn(keys)
+
+        return load_fn_with_stats
+
+    def resolve(self, _next: Callable, root: Any, info: GraphQLResolveInfo, *args: str, **kwargs: Any) -> Any:
+        if not self.stats:
+            return _next(root, info, *args, **kwargs)
+
+        field_name = _resolver_field(info)
+        start = time.perf_counter()
+        token = _current_resolver.set((self.stats, field_name))
+        try:
+            result = _next(root, info, *args, **kwargs)
+        finally:
+            _current_resolver.reset(token)
+
+        if isawaitable(result):
+            return self._resolve_async(self.stats, field_name, start, result)
+
+        self.stats.record_resolver(field_name, time.perf_counter() - start)
+        return result
+
+    @staticmethod
+    async def _resolve_async(stats: ResolverStats, field_name: str, start: float, result: Awaitable[Any]) -> Any:
+        token = _current_resolver.set((stats, field_name))
+        try:
+            return await result
+        finally:
+            _current_resolver.reset(token)
+            stats.record_resolver(field_name, time.perf_counter() - start)
+
+    @staticmethod
+    def _observe_metrics(stats: ResolverStats) -> None:
+        for field_name, field_stats in stats.fields.items():
+            observe(GRAPHQL_RESOLVER_DURATION, field_stats.time, field_name)
+            observe(GRAPHQL_RESOLVER_DB_QUERIES, field_stats.db_queries, field_name)
+
+    def get_results(self) -> dict[str, Any]:
+        if not self.stats:
+            return {}
+        return {"resolver_stats": self.stats.to_dict()}
@@ -0,0 +1,162 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections.abc import AsyncIterator
+
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    OperationType,
+    TypeInfo,
+    TypeInfoVisitor,
+    Visitor,
+    get_operation_ast,
+    print_ast,
+    visit,
+)
+from strawberry.extensions import SchemaExtension
+
+from orchestrator.core.graphql.types import OrchestratorContext
+from orchestrator.core.utils.response_cache import cache_key, get_response_cache
+
+# Root query fields of which the results are cached, with the invalidation event types that evict them
+CACHED_ROOT_FIELDS: dict[str, set[str]] = {
+    "subscriptions": {"subscriptions"},
+    "products": {"products"},
+    "workflows": {"workflows"},
+    "__typename": set(),
+}
+
+# Types that can be selected below the cached root fields, with the invalidation event types that evict them. A type
+# that implements one of these interfaces gets the event types of the interface, like the types of the domain models.
+# A query that selects any other type is not cached.
+TYPE_TAGS: dict[str, set[str]] = {
+    "SubscriptionInterface": {"subscriptions"},
+    "BaseProductBlockType": {"subscriptions"},
+    "SubscriptionInterfaceConnection": set(),
+    "CustomerDescription": {"subscriptions"},
+    "ProductBlockInstance": {"subscriptions"},
+    "ProcessTypeConnection": set(),
+    "ProcessType": {"processes"},
+    "ProcessStepType": {"processes"},
+    "FormUserPermissionsType": {"processes"},
+    "ProductTypeConnection": set(),
+    "ProductType": {"products"},
+    "ProductModelGraphql": {"products"},
+    "ProductBlock": {"products"},
+    "FixedInput": {"products"},
+    "ResourceType": {"products"},
+    "WorkflowConnection": set(),
+    "Workflow": {"workflows"},
+    "Step": {"workflows"},
+    "PageInfo": set(),
+    "CustomerType": set(),
+}
+
+
+def _type_tags(type_: GraphQLNamedType) -> set[str] | None:
+    if type_.name in TYPE_TAGS:
+        return TYPE_TAGS[type_.name]
+    if isinstance(type_, GraphQLObjectType):
+        for interface in type_.interfaces:
+            if interface.name in TYPE_TAGS:
+                return TYPE_TAGS[interface.name]
+    return None
+
+
+class _SelectedTypes(Visitor):
+    """Collect the types of which fields are selected."""
+
+    def __init__(self, type_info: TypeInfo) -> None:
+        super().__init__()
+        self.type_info = type_info
+        self.types: set[GraphQLNamedType] = set()
+
+    def enter_field(self, *_args: object) -> None:
+        if parent_type := self.type_info.get_parent_type():
+            self.types.add(parent_type)
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """Serve query operations that only select cached root fields from the response cache.
+
+    Responses are cached per normalized query document, variables and user, and only when they have no errors.
+    """
+
+    def _cache_tags(self) -> set[str] | None:
+        execution_context = self.execution_context
+        if not execution_context.graphql_document:
+            return None
+        operation = get_operation_ast(execution_context.graphql_document, execution_context.operation_name)
+        if not operation or operation.operation != OperationType.QUERY:
+            return None
+
+        tags: set[str] = set()
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, FieldNode) or selection.name.value not in CACHED_ROOT_FIELDS:
+                return None
+            tags |= CACHED_ROOT_FIELDS[selection.name.value]
+
+        # Nested selections, like the processes of a subscription, are evicted by the events of their own type
+        schema = execution_context.schema._schema
+        type_info = TypeInfo(schema)
+        selected_types = _SelectedTypes(type_info)
+        fragments = [
+            definition
+            for definition in execution_context.graphql_document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        ]
+        for node in [operation, *fragments]:
+            visit(node, TypeInfoVisitor(type_info, selected_types))
+
+        for selected_type in selected_types.types - {schema.query_type}:
+            if (type_tags := _type_tags(selected_type)) is None:
+                return None
+            tags |= type_tags
+        return tags or None
+
+    async def _user_scope(self) -> str:
+        context = self.execution_context.context
+        if not isinstance(context, OrchestratorContext):
+            return ""
+        user = await context.get_current_user
+        return str(user.get("sub", "")) if user else ""
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        response_cache = get_response_cache()
+        if response_cache is None or not (tags := self._cache_tags()):
+            yield
+            return
+
+        execution_context = self.execution_context
+        key = cache_key(
+            print_ast(execution_context.graphql_document),  # type: ignore[arg-type]
+            execution_context.operation_name,
+            execution_context.variables,
+            await self._user_scope(),
+        )
+        versioned_key = await response_cache.versioned_key_async(tags, key)
+        if (data := await response_cache.get_async(versioned_key)) is not None:
+            execution_context.result = ExecutionResult(data=data)
+            yield
+            return
+
+        yield
+
+        result = execution_context.result
+        if isinstance(result, ExecutionResult) and not result.errors and result.data is not None:
+            await response_cache.set_async(versioned_key, result.data)
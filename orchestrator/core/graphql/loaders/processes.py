@@ -0,0 +1,38 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from uuid import UUID
+
+from strawberry.dataloader import DataLoader
+
+from orchestrator.core.db import ProductTable
+from orchestrator.core.services.processes import ProcessProgress, get_processes_progress
+from orchestrator.core.services.products import get_products
+
+NO_PROGRESS = ProcessProgress(cleared_steps=0, is_complete=False)
+
+
+async def product_loader(keys: list[UUID]) -> list[ProductTable | None]:
+    """GraphQL dataloader to efficiently get the ProductTables for multiple product_ids."""
+    products = {product.product_id: product for product in get_products(filters=[ProductTable.product_id.in_(keys)])}
+    return [products.get(product_id) for product_id in keys]
+
+
+async def process_progress_loader(keys: list[UUID]) -> list[ProcessProgress]:
+    """GraphQL dataloader to efficiently get the progress of multiple processes, for evaluating RBAC callbacks."""
+    progress = get_processes_progress(keys)
+    return [progress.get(process_id, NO_PROGRESS) for process_id in keys]
+
+
+ProductLoaderType = DataLoader[UUID, ProductTable | None]
+ProcessProgressLoaderType = DataLoader[UUID, ProcessProgress]
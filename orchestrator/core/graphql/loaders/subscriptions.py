@@ -12,7 +12,7 @@
 # limitations under the License.
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
 import structlog
@@ -27,6 +27,7 @@ from orchestrator.core.services.subscription_relations import (
     get_in_use_by_subscriptions,
     get_last_validation_datetimes,
 )
+from orchestrator.core.services.subscriptions import subscriptions_workflows
 from orchestrator.core.types import SubscriptionLifecycle
 
 logger = structlog.get_logger(__name__)
@@ -61,5 +62,12 @@ async def last_validation_datetime_loader(keys: list[UUID]) -> list[datetime | N
     return await get_last_validation_datetimes(keys)
 
 
+async def subscription_workflows_loader(keys: list[UUID]) -> list[dict[str, Any]]:
+    """GraphQL dataloader to efficiently get the available workflows for multiple subscription_ids."""
+    workflows = subscriptions_workflows(keys)
+    return [workflows.get(subscription_id, {}) for subscription_id in keys]
+
+
 SubsLoaderType = DataLoader[tuple[UUID, tuple[str, ...]], list[SubscriptionTable]]
 LastValidationLoaderType = DataLoader[UUID, datetime | None]
+SubscriptionWorkflowsLoaderType = DataLoader[UUID, dict[str, Any]]
@@ -49,6 +49,8 @@ from orchestrator.core.graphql.utils import (
     is_querying_page_data,
     to_graphql_result_page,
 )
+from orchestrator.core.graphql.utils.get_selected_paths import get_selected_paths
+from orchestrator.core.settings import app_settings
 from orchestrator.core.utils.get_subscription_dict import get_subscription_dict
 
 logger = structlog.get_logger(__name__)
@@ -75,16 +77,20 @@ def get_subscription_graphql_type(info: OrchestratorInfo, subscription_name: str
 
 
 async def get_subscription_details(info: OrchestratorInfo, subscription: SubscriptionTable) -> SubscriptionInterface:
-    from orchestrator.core.domain import SUBSCRIPTION_MODEL_REGISTRY
+    from orchestrator.core.domain import SUBSCRIPTION_MODEL_REGISTRY, SubscriptionModel
     from orchestrator.core.graphql.autoregistration import graphql_subscription_name
 
-    subscription_dict_data, _ = await get_subscription_dict(subscription.subscription_id)
-
     domain_model_type = SUBSCRIPTION_MODEL_REGISTRY[subscription.product.name]
     base_model = domain_model_type.__base_type__ or domain_model_type
 
     subscription_name = graphql_subscription_name(base_model.__name__)
-    subscription_details = base_model.model_validate(subscription_dict_data, strict=False)
+    if not app_settings.ENABLE_GRAPHQL_PARTIAL_SUBSCRIPTION_LOADING:
+        subscription_dict_data, _ = await get_subscription_dict(subscription.subscription_id)
+        subscription_details = base_model.model_validate(subscription_dict_data, strict=False)
+    else:
+        # Only load the product blocks that are selected in the query
+        include = [path.removeprefix("page.") for path in get_selected_paths(info)]
+        subscription_details = SubscriptionModel.from_subscription(subscription.subscription_id, include=include)
     subscription_details._db_model = subscription  # type: ignore
 
     strawberry_type = get_subscription_graphql_type(info, subscription_name)
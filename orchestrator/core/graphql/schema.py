@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from collections.abc import Callable, Iterable
+from functools import partial
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any, Coroutine, Protocol
@@ -19,7 +20,7 @@ import strawberry
 import structlog
 from fastapi.routing import APIRouter
 from graphql import GraphQLError
-from strawberry.extensions import SchemaExtension
+from strawberry.extensions import ParserCache, SchemaExtension, ValidationCache
 from strawberry.fastapi import GraphQLRouter
 from strawberry.schema.config import StrawberryConfig
 from strawberry.tools import merge_types
@@ -33,6 +34,9 @@ from oauth2_lib.strawberry import authenticated_field
 from orchestrator.core.domain.base import SubscriptionModel
 from orchestrator.core.graphql.autoregistration import create_subscription_strawberry_type, register_domain_models
 from orchestrator.core.graphql.extensions.model_cache import ModelCacheExtension
+from orchestrator.core.graphql.extensions.persisted_queries import make_persisted_queries_extension
+from orchestrator.core.graphql.extensions.resolver_stats import ResolverStatsExtension
+from orchestrator.core.graphql.extensions.response_cache import ResponseCacheExtension
 from orchestrator.core.graphql.extensions.stats import StatsExtension
 from orchestrator.core.graphql.mutations.customer_description import CustomerSubscriptionDescriptionMutation
 from orchestrator.core.graphql.mutations.start_process import ProcessMutation
@@ -223,12 +227,22 @@ def get_extensions(mutation: Any, query: Any) -> Iterable[type[SchemaExtension]]
         yield make_deprecation_checker_extension(query=query, mutation=mutation)
     if app_settings.ENABLE_GRAPHQL_STATS_EXTENSION:
         yield StatsExtension
+    if app_settings.ENABLE_GRAPHQL_RESOLVER_STATS_EXTENSION:
+        yield ResolverStatsExtension
+    if app_settings.RESPONSE_CACHE_ENABLED:
+        yield ResponseCacheExtension
     if app_settings.ENABLE_GRAPHQL_PROFILING_EXTENSION:
         from strawberry.extensions import pyinstrument
 
         yield pyinstrument.PyInstrument(report_path=Path("pyinstrument.html"))  # type: ignore
 
 
+def get_query_cache_extensions(query_cache_size: int) -> Iterable[Callable[[], SchemaExtension]]:
+    if query_cache_size:
+        yield partial(ParserCache, maxsize=query_cache_size)
+        yield partial(ValidationCache, maxsize=query_cache_size)
+
+
 def create_graphql_router(
     auth_manager: AuthManager,
     query: Any = Query,
@@ -240,6 +254,9 @@ def create_graphql_router(
     scalar_overrides: ScalarOverrideType | None = None,
     extensions: list | None = None,
     custom_context_getter: ContextGetterFactory | None = None,
+    query_cache_size: int = 0,
+    persisted_queries: Iterable[str] | None = None,
+    only_persisted_queries: bool = False,
 ) -> OrchestratorGraphqlRouter:
     scalar_overrides = scalar_overrides if scalar_overrides else dict(SCALAR_OVERRIDES)
     models = graphql_models if graphql_models else dict(DEFAULT_GRAPHQL_MODELS)
@@ -250,7 +267,13 @@ def create_graphql_router(
     if register_models:
         models = register_domain_models(subscription_interface, existing_models=models)
 
-    extensions = extensions or list(get_extensions(mutation, query))
+    extensions = [
+        *(extensions or get_extensions(mutation, query)),
+        *get_query_cache_extensions(query_cache_size),
+    ]
+    if persisted_queries is not None:
+        # First, so that a rejected query does not leave the operation of other extensions open
+        extensions.insert(0, make_persisted_queries_extension(persisted_queries, only_persisted_queries))
 
     schema = OrchestratorSchema(
         query=query,
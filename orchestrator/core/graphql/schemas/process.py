@@ -19,15 +19,18 @@ from strawberry.federation.types import FieldSet
 from strawberry.scalars import JSON
 
 from oauth2_lib.strawberry import authenticated_field
-from orchestrator.core.api.api_v1.endpoints.processes import get_auth_callbacks, get_steps_to_evaluate_for_rbac
-from orchestrator.core.db import ProcessTable, ProductTable, db
+from orchestrator.core.api.api_v1.endpoints.processes import (
+    get_auth_callbacks,
+    get_steps_to_evaluate_for_rbac_by_progress,
+)
+from orchestrator.core.db import ProcessTable
 from orchestrator.core.graphql.pagination import EMPTY_PAGE, Connection
 from orchestrator.core.graphql.schemas.customer import CustomerType
 from orchestrator.core.graphql.schemas.helpers import get_original_model
 from orchestrator.core.graphql.schemas.product import ProductType
 from orchestrator.core.graphql.types import FormUserPermissionsType, GraphqlFilter, GraphqlSort, OrchestratorInfo
 from orchestrator.core.schemas.process import ProcessSchema, ProcessStepSchema
-from orchestrator.core.services.processes import load_process
+from orchestrator.core.services.processes import get_process_workflow
 from orchestrator.core.settings import app_settings
 from orchestrator.core.utils.auth import AuthContext
 from orchestrator.core.workflows import get_workflow
@@ -83,9 +86,9 @@ class ProcessType:
         return model.traceback
 
     @authenticated_field(description="Returns the associated product")  # type: ignore
-    def product(self) -> ProductType | None:
-        if self.product_id and (product := db.session.get(ProductTable, self.product_id)):
-            return ProductType.from_pydantic(product)
+    async def product(self, info: OrchestratorInfo) -> ProductType | None:
+        if self.product_id and (product := await info.context.core_product_loader.load(self.product_id)):
+            return ProductType.from_pydantic(product)  # type: ignore[arg-type]
         return None
 
     @strawberry.field(description="Returns customer of a subscription")  # type: ignore
@@ -100,15 +103,18 @@ class ProcessType:
     async def user_permissions(self, info: OrchestratorInfo) -> FormUserPermissionsType:
         oidc_user = await info.context.get_current_user
 
-        # Note that workflow and pstat.workflow can differ here!
+        # Note that workflow and process_workflow can differ here!
         workflow = get_workflow(self.workflow_name)
-        pstat = load_process(db.session.get(ProcessTable, self.process_id))  # type: ignore[arg-type]
+        process_workflow = get_process_workflow(self.workflow_name)
+        progress = await info.context.core_process_progress_loader.load(self.process_id)
 
-        steps = get_steps_to_evaluate_for_rbac(pstat)
+        steps = get_steps_to_evaluate_for_rbac_by_progress(process_workflow, progress)
         auth_resume, auth_retry = get_auth_callbacks(steps, workflow)
 
-        resume_context = AuthContext(user=oidc_user, workflow=pstat.workflow, step=steps[-1], action="resume_workflow")
-        retry_context = AuthContext(user=oidc_user, workflow=pstat.workflow, step=steps[-1], action="retry_workflow")
+        resume_context = AuthContext(
+            user=oidc_user, workflow=process_workflow, step=steps[-1], action="resume_workflow"
+        )
+        retry_context = AuthContext(user=oidc_user, workflow=process_workflow, step=steps[-1], action="retry_workflow")
 
         return FormUserPermissionsType(
             retryAllowed=bool(auth_retry and await auth_retry(resume_context)),
@@ -18,7 +18,7 @@ from strawberry.scalars import JSON
 
 from orchestrator.core.graphql.schemas.errors import Error
 from orchestrator.core.schemas import WorkerStatus
-from orchestrator.core.schemas.engine_settings import EngineSettingsSchema
+from orchestrator.core.schemas.engine_settings import EngineSettingsSchema, ResumeProgressSchema
 
 CACHE_FLUSH_OPTIONS: dict[str, str] = {"all": "All caches"}
 
@@ -28,6 +28,11 @@ class WorkerStatusType:
     pass
 
 
+@strawberry.experimental.pydantic.type(model=ResumeProgressSchema, all_fields=True)
+class ResumeProgressType:
+    pass
+
+
 @strawberry.experimental.pydantic.type(model=EngineSettingsSchema, all_fields=True)
 class EngineSettingsType:
     pass
@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import deepcopy
 from datetime import datetime
 from typing import Annotated
 from uuid import UUID
@@ -23,6 +24,7 @@ from strawberry.federation.schema_directives import Key
 from strawberry.federation.types import FieldSet
 
 from oauth2_lib.strawberry import authenticated_field
+from orchestrator.core.api.api_v1.endpoints.subscriptions import authorize_subscription_workflows
 from orchestrator.core.db import FixedInputTable, ProductTable, SubscriptionTable, db
 from orchestrator.core.domain import SUBSCRIPTION_MODEL_REGISTRY
 from orchestrator.core.graphql.loaders.subscriptions import SubsLoaderType
@@ -38,6 +40,7 @@ from orchestrator.core.graphql.utils.get_subscription_product_blocks import (
     ProductBlockInstance,
     get_subscription_product_blocks,
 )
+from orchestrator.core.schemas.workflow import SubscriptionWorkflowListsSchema
 from orchestrator.core.services.fixed_inputs import get_fixed_inputs
 from orchestrator.core.services.subscription_relations import get_recursive_relations
 from orchestrator.core.services.subscriptions import (
@@ -195,6 +198,17 @@ class SubscriptionInterface:
     async def last_validated_at(self, info: OrchestratorInfo) -> datetime | None:
         return await info.context.core_last_validation_datetime_loader.load(self.subscription_id)
 
+    @authenticated_field(description="Returns the workflows that can be started for this subscription")  # type: ignore
+    async def available_workflows(self, info: OrchestratorInfo) -> dict:
+        workflows = await info.context.core_subscription_workflows_loader.load(self.subscription_id)
+        if not workflows:
+            return {}
+        oidc_user = await info.context.get_current_user
+        authorized_workflows = authorize_subscription_workflows(deepcopy(workflows), oidc_user)
+        return SubscriptionWorkflowListsSchema.model_validate(authorized_workflows).model_dump(
+            mode="json", by_alias=True, exclude_none=True
+        )
+
     @strawberry.field(description="Returns customer of a subscription")  # type: ignore
     def customer(self) -> CustomerType:
         return CustomerType(
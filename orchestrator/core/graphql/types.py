@@ -28,12 +28,20 @@ from oauth2_lib.fastapi import AuthManager
 from oauth2_lib.strawberry import OauthContext
 from orchestrator.core.db.filters import Filter
 from orchestrator.core.db.sorting import Sort, SortOrder
+from orchestrator.core.graphql.loaders.processes import (
+    ProcessProgressLoaderType,
+    ProductLoaderType,
+    process_progress_loader,
+    product_loader,
+)
 from orchestrator.core.graphql.loaders.subscriptions import (
     LastValidationLoaderType,
+    SubscriptionWorkflowsLoaderType,
     SubsLoaderType,
     depends_on_subs_loader,
     in_use_by_subs_loader,
     last_validation_datetime_loader,
+    subscription_workflows_loader,
 )
 from orchestrator.core.services.process_broadcast_thread import ProcessDataBroadcastThread
 
@@ -67,6 +75,11 @@ class OrchestratorContext(OauthContext):
         self.core_last_validation_datetime_loader: LastValidationLoaderType = DataLoader(
             load_fn=last_validation_datetime_loader
         )
+        self.core_subscription_workflows_loader: SubscriptionWorkflowsLoaderType = DataLoader(
+            load_fn=subscription_workflows_loader
+        )
+        self.core_product_loader: ProductLoaderType = DataLoader(load_fn=product_loader)
+        self.core_process_progress_loader: ProcessProgressLoaderType = DataLoader(load_fn=process_progress_loader)
         super().__init__(auth_manager)
 
 
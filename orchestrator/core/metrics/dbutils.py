@@ -11,13 +11,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
 from contextlib import contextmanager
-from typing import Generator, TypeVar
+from typing import Callable, Generator, Generic, TypeVar
 
 import structlog
 from psycopg import errors as psycopg_errors
 from sqlalchemy.exc import ProgrammingError
 
+from orchestrator.core.settings import app_settings
+
 logger = structlog.get_logger(__name__)
 
 T = TypeVar("T")
@@ -44,3 +48,40 @@ def handle_missing_tables() -> Generator[None, None, None]:
                 error_type=type(e.orig).__name__ if hasattr(e, "orig") else "Unknown",
             )
             raise
+
+
+class CachedQuery(Generic[T]):
+    """Cache the result of a metrics query for `METRICS_CACHE_TTL` seconds.
+
+    When the result has expired only one thread runs the query again, concurrent scrapes wait for it and share its
+    result. The query runs on every call when `METRICS_CACHE_TTL` is 0.
+    """
+
+    def __init__(self, query: Callable[[], T]) -> None:
+        self.query = query
+        self._lock = threading.Lock()
+        self._cached: tuple[float, T] | None = None
+
+    def _get_cached(self) -> tuple[float, T] | None:
+        if (cached := self._cached) and time.monotonic() < cached[0]:
+            return cached
+        return None
+
+    def __call__(self) -> T:
+        if not (ttl := app_settings.METRICS_CACHE_TTL):
+            return self.query()
+
+        if cached := self._get_cached():
+            return cached[1]
+
+        with self._lock:
+            if cached := self._get_cached():
+                return cached[1]
+
+            result = self.query()
+            self._cached = (time.monotonic() + ttl, result)
+            return result
+
+    def clear(self) -> None:
+        """Let the next call run the query."""
+        self._cached = None
@@ -0,0 +1,39 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from prometheus_client import Histogram
+
+# Observed by the ResolverStatsExtension for sampled GraphQL operations, registered by
+# initialize_default_metrics() when the extension is enabled
+GRAPHQL_RESOLVER_DURATION = Histogram(
+    "wfo_graphql_resolver_duration",
+    "Wall time spent resolving a GraphQL field during an operation, including awaited dataloaders and queries.",
+    ["field"],
+    unit="seconds",
+    registry=None,
+)
+GRAPHQL_RESOLVER_DB_QUERIES = Histogram(
+    "wfo_graphql_resolver_db_queries",
+    "Number of database queries executed while resolving a GraphQL field during an operation.",
+    ["field"],
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250, float("inf")),
+    registry=None,
+)
+GRAPHQL_DATALOADER_BATCH_SIZE = Histogram(
+    "wfo_graphql_dataloader_batch_size",
+    "Number of keys in a batch loaded by a GraphQL dataloader.",
+    ["loader"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, float("inf")),
+    registry=None,
+)
@@ -14,8 +14,20 @@
 from prometheus_client import CollectorRegistry
 
 from orchestrator.core.metrics.engine import WorkflowEngineCollector
+from orchestrator.core.metrics.graphql import (
+    GRAPHQL_DATALOADER_BATCH_SIZE,
+    GRAPHQL_RESOLVER_DB_QUERIES,
+    GRAPHQL_RESOLVER_DURATION,
+)
 from orchestrator.core.metrics.processes import ProcessCollector
 from orchestrator.core.metrics.subscriptions import SubscriptionCollector
+from orchestrator.core.metrics.workflows import (
+    PROCESS_BROADCAST_DURATION,
+    PROCESS_QUEUE_WAIT,
+    STEP_DURATION,
+    STEP_LOG_WRITE_DURATION,
+)
+from orchestrator.core.settings import app_settings
 
 ORCHESTRATOR_METRICS_REGISTRY = CollectorRegistry(auto_describe=True)
 
@@ -25,3 +37,11 @@ def initialize_default_metrics() -> None:
     ORCHESTRATOR_METRICS_REGISTRY.register(SubscriptionCollector())
     ORCHESTRATOR_METRICS_REGISTRY.register(ProcessCollector())
     ORCHESTRATOR_METRICS_REGISTRY.register(WorkflowEngineCollector())
+    ORCHESTRATOR_METRICS_REGISTRY.register(STEP_DURATION)
+    ORCHESTRATOR_METRICS_REGISTRY.register(PROCESS_QUEUE_WAIT)
+    ORCHESTRATOR_METRICS_REGISTRY.register(STEP_LOG_WRITE_DURATION)
+    ORCHESTRATOR_METRICS_REGISTRY.register(PROCESS_BROADCAST_DURATION)
+    if app_settings.ENABLE_GRAPHQL_RESOLVER_STATS_EXTENSION:
+        ORCHESTRATOR_METRICS_REGISTRY.register(GRAPHQL_RESOLVER_DURATION)
+        ORCHESTRATOR_METRICS_REGISTRY.register(GRAPHQL_RESOLVER_DB_QUERIES)
+        ORCHESTRATOR_METRICS_REGISTRY.register(GRAPHQL_DATALOADER_BATCH_SIZE)
@@ -20,7 +20,7 @@ from sqlalchemy import desc, func
 
 from orchestrator.core.db import ProcessTable, ProductTable, SubscriptionTable, WorkflowTable, db
 from orchestrator.core.db.models import ProcessSubscriptionTable
-from orchestrator.core.metrics.dbutils import handle_missing_tables
+from orchestrator.core.metrics.dbutils import CachedQuery, handle_missing_tables
 from orchestrator.core.targets import Target
 from orchestrator.core.workflow import ProcessStatus
 from pydantic_forms.types import UUIDstr
@@ -112,6 +112,9 @@ def _get_processes() -> list[ProcessTableQueryResult]:
     return result or []
 
 
+_get_processes_cached = CachedQuery(_get_processes)
+
+
 class ProcessCollector(Collector):
     """Collector that contains two Prometheus gauges with process counts and total runtime.
 
@@ -149,7 +152,7 @@ class ProcessCollector(Collector):
             documentation="Total time spent on processes in seconds.",
         )
 
-        for row in _get_processes():
+        for row in _get_processes_cached():
             label_values = [
                 row.last_status,
                 str(row.created_by),
@@ -20,7 +20,7 @@ from pydantic import BaseModel
 from sqlalchemy import desc, func
 
 from orchestrator.core.db import ProductTable, SubscriptionTable, db
-from orchestrator.core.metrics.dbutils import handle_missing_tables
+from orchestrator.core.metrics.dbutils import CachedQuery, handle_missing_tables
 from orchestrator.core.types import SubscriptionLifecycle
 from pydantic_forms.types import UUIDstr
 
@@ -80,6 +80,9 @@ def _get_subscriptions() -> list[SubscriptionTableQueryResult]:
     return result or []
 
 
+_get_subscriptions_cached = CachedQuery(_get_subscriptions)
+
+
 class SubscriptionCollector(Collector):
     """Collector for Subscriptions stored in the subscription database.
 
@@ -104,7 +107,7 @@ class SubscriptionCollector(Collector):
             documentation="Number of subscriptions per product, lifecycle state, customer, and in sync state.",
         )
 
-        for row in _get_subscriptions():
+        for row in _get_subscriptions_cached():
             subscriptions.add_metric(
                 [row.product_name, row.lifecycle_state, row.customer_id, str(row.insync)], row.subscription_count
             )
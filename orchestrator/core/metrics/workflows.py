@@ -0,0 +1,91 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from prometheus_client import Histogram
+
+from orchestrator.core.settings import app_settings
+
+OTHER_LABEL_VALUE = "other"
+
+# Observed by the workflow engine, registered by initialize_default_metrics()
+STEP_DURATION = Histogram(
+    "wfo_step_duration",
+    "Time spent executing a workflow step, excluding writing its result to the database.",
+    ["workflow_name", "step_name"],
+    unit="seconds",
+    registry=None,
+)
+PROCESS_QUEUE_WAIT = Histogram(
+    "wfo_process_queue_wait",
+    "Time a started or resumed process waits for a thread of the threadpool executor.",
+    ["workflow_name"],
+    unit="seconds",
+    registry=None,
+)
+STEP_LOG_WRITE_DURATION = Histogram(
+    "wfo_step_log_write_duration",
+    "Time spent writing the result of a workflow step to the database, including the commit and the broadcast.",
+    ["workflow_name"],
+    unit="seconds",
+    registry=None,
+)
+PROCESS_BROADCAST_DURATION = Histogram(
+    "wfo_process_broadcast_duration",
+    "Time the workflow engine spends handing a process update to the broadcast function.",
+    unit="seconds",
+    registry=None,
+)
+
+_seen_label_values: dict[Histogram, set[tuple[str, ...]]] = {}
+_seen_label_values_lock = threading.Lock()
+
+
+def bounded_label_values(histogram: Histogram, *label_values: str) -> tuple[str, ...]:
+    """Return the label values to observe, limiting the number of series of the histogram.
+
+    Workflow and step names can be generated at runtime. Once `METRICS_MAX_LABEL_SETS` combinations of label values
+    are observed for a histogram, new combinations are observed as "other".
+    """
+    seen = _seen_label_values.setdefault(histogram, set())
+    if label_values in seen:
+        return label_values
+
+    with _seen_label_values_lock:
+        if len(seen) < app_settings.METRICS_MAX_LABEL_SETS:
+            seen.add(label_values)
+            return label_values
+
+    return (OTHER_LABEL_VALUE,) * len(label_values)
+
+
+def observe(histogram: Histogram, value: float, *label_values: str) -> None:
+    """Observe a value in the histogram, with the label values bounded by `bounded_label_values`."""
+    if label_values:
+        histogram.labels(*bounded_label_values(histogram, *label_values)).observe(value)
+    else:
+        histogram.observe(value)
+
+
+@contextmanager
+def observe_duration(histogram: Histogram, *label_values: str) -> Iterator[None]:
+    """Observe the duration of the block in the histogram, also when it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(histogram, time.perf_counter() - start, *label_values)
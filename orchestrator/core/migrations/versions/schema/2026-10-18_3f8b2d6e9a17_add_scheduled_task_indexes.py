@@ -0,0 +1,54 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Add next_run_time index for listing scheduled tasks.
+
+Lets the scheduled tasks be sorted by next run time in the database. The table created by APScheduler already has this
+index, the one created by an earlier migration doesn't. The linker table already has its schedule_id index.
+
+Revision ID: 3f8b2d6e9a17
+Revises: 7d3e5b9a1c24
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "3f8b2d6e9a17"
+down_revision = "7d3e5b9a1c24"
+branch_labels = None
+depends_on = None
+
+
+# Marks the index as created by this migration, an index created by APScheduler is left alone on downgrade
+INDEX_COMMENT = "Created by migration 3f8b2d6e9a17"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.execute(text("SELECT to_regclass('ix_apscheduler_jobs_next_run_time')")).scalar() is not None:
+        return
+
+    conn.execute(text("CREATE INDEX ix_apscheduler_jobs_next_run_time ON apscheduler_jobs (next_run_time);"))
+    conn.execute(text(f"COMMENT ON INDEX ix_apscheduler_jobs_next_run_time IS '{INDEX_COMMENT}';"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    comment = conn.execute(
+        text("SELECT obj_description(to_regclass('ix_apscheduler_jobs_next_run_time'), 'pg_class')")
+    ).scalar()
+    if comment == INDEX_COMMENT:
+        conn.execute(text("DROP INDEX ix_apscheduler_jobs_next_run_time;"))
@@ -0,0 +1,116 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Add process_status_counts table maintained by a trigger on processes.
+
+Lets GET /api/processes/status-counts read a handful of counter rows instead of aggregating the whole processes table.
+
+Revision ID: 7d3e5b9a1c24
+Revises: ca79fd834ba0
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "7d3e5b9a1c24"
+down_revision = "ca79fd834ba0"
+branch_labels = None
+depends_on = None
+
+# Rows with a zero count are kept, so status transitions only update existing rows.
+# An UPDATE locks the two counter rows in a fixed order, so concurrent opposite transitions (e.g. running -> failed and
+# failed -> running) can not deadlock.
+# Row-level triggers do NOT fire on TRUNCATE; `rebuild_process_status_counts()` in
+# orchestrator.core.services.processes resynchronizes the table.
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION process_status_counts_add(p_is_task BOOLEAN, p_last_status VARCHAR, p_delta INTEGER)
+RETURNS void AS $$
+BEGIN
+    INSERT INTO process_status_counts (is_task, last_status, process_count)
+    VALUES (p_is_task, p_last_status, p_delta)
+    ON CONFLICT (is_task, last_status)
+    DO UPDATE SET process_count = process_status_counts.process_count + p_delta;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION process_status_counts_maintain() RETURNS trigger AS $$
+BEGIN
+    IF (TG_OP = 'INSERT') THEN
+        PERFORM process_status_counts_add(NEW.is_task, NEW.last_status, 1);
+    ELSIF (TG_OP = 'DELETE') THEN
+        PERFORM process_status_counts_add(OLD.is_task, OLD.last_status, -1);
+    ELSIF (OLD.is_task, OLD.last_status) IS DISTINCT FROM (NEW.is_task, NEW.last_status) THEN
+        IF (OLD.is_task, OLD.last_status) < (NEW.is_task, NEW.last_status) THEN
+            PERFORM process_status_counts_add(OLD.is_task, OLD.last_status, -1);
+            PERFORM process_status_counts_add(NEW.is_task, NEW.last_status, 1);
+        ELSE
+            PERFORM process_status_counts_add(NEW.is_task, NEW.last_status, 1);
+            PERFORM process_status_counts_add(OLD.is_task, OLD.last_status, -1);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS process_status_counts (
+                is_task BOOLEAN NOT NULL,
+                last_status VARCHAR(50) NOT NULL,
+                process_count INTEGER NOT NULL,
+                CONSTRAINT pk_process_status_counts PRIMARY KEY (is_task, last_status)
+            );
+            """
+        )
+    )
+
+    conn.execute(text(TRIGGER_FUNCTION))
+    conn.execute(text("DROP TRIGGER IF EXISTS process_status_counts_maintain_trg ON processes;"))
+    conn.execute(
+        text(
+            "CREATE TRIGGER process_status_counts_maintain_trg "
+            "AFTER INSERT OR UPDATE OF is_task, last_status OR DELETE ON processes "
+            "FOR EACH ROW EXECUTE FUNCTION process_status_counts_maintain();"
+        )
+    )
+
+    # Backfill from existing rows. Assumes no concurrent writes to processes during the migration, otherwise run
+    # `rebuild_process_status_counts()` afterward.
+    conn.execute(
+        text(
+            """
+            INSERT INTO process_status_counts (is_task, last_status, process_count)
+            SELECT is_task, last_status, count(*)
+            FROM processes
+            GROUP BY is_task, last_status
+            ON CONFLICT (is_task, last_status) DO NOTHING;
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TRIGGER IF EXISTS process_status_counts_maintain_trg ON processes;"))
+    conn.execute(text("DROP FUNCTION IF EXISTS process_status_counts_maintain();"))
+    conn.execute(text("DROP FUNCTION IF EXISTS process_status_counts_add(BOOLEAN, VARCHAR, INTEGER);"))
+    conn.execute(text("DROP TABLE IF EXISTS process_status_counts;"))
@@ -0,0 +1,50 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Add subscription_validation_results table.
+
+Stores the outcome of the validation workflows that the validation runner runs without starting a process.
+
+Revision ID: 5c8e1f4a7b3d
+Revises: ebd82574781f
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+from orchestrator.core.db.models import UtcTimestamp
+
+# revision identifiers, used by Alembic.
+revision = "5c8e1f4a7b3d"
+down_revision = "ebd82574781f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "subscription_validation_results",
+        sa.Column("subscription_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("workflow_name", sa.String(), nullable=False),
+        sa.Column("passed", sa.Boolean(), nullable=False),
+        sa.Column("validated_at", UtcTimestamp(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["subscription_id"], ["subscriptions.subscription_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("subscription_id", "workflow_name", name="pk_subscription_validation_results"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("subscription_validation_results")
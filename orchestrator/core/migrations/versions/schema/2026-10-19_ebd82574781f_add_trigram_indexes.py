@@ -0,0 +1,72 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Add trigram indexes on the filterable text columns of subscriptions and processes.
+
+The list endpoints filter with ILIKE, which a b-tree index can't serve. A GIN index with the pg_trgm operator class
+can, also when the term is in the middle of the value. The ids are filtered as text, so these are indexed on the
+same cast as the filter uses.
+
+`processes.last_step` and `processes.failed_reason` are not indexed: they are written after every step, and
+maintaining a GIN index would slow down the workflow engine more than it speeds up the filters.
+
+The indexes are created concurrently, outside the migration transaction, so the tables stay writable while they are
+built. If building an index fails, Postgres leaves an invalid index behind that has to be dropped before running this
+migration again.
+
+Revision ID: ebd82574781f
+Revises: 3f8b2d6e9a17
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "ebd82574781f"
+down_revision = "3f8b2d6e9a17"
+branch_labels = None
+depends_on = None
+
+# Index name, table and indexed expression
+TRIGRAM_INDEXES = [
+    ("ix_subscriptions_subscription_id_trgm", "subscriptions", "(subscription_id::varchar)"),
+    ("ix_subscriptions_description_trgm", "subscriptions", "description"),
+    ("ix_subscriptions_customer_id_trgm", "subscriptions", "customer_id"),
+    ("ix_subscriptions_note_trgm", "subscriptions", "note"),
+    ("ix_processes_pid_trgm", "processes", "(pid::varchar)"),
+    ("ix_processes_assignee_trgm", "processes", "assignee"),
+    ("ix_processes_created_by_trgm", "processes", "created_by"),
+    ("ix_processes_note_trgm", "processes", "note"),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, table, expression in TRIGRAM_INDEXES:
+            conn.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} "
+                    f"USING gin ({expression} gin_trgm_ops);"
+                )
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in reversed(TRIGRAM_INDEXES):
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};"))
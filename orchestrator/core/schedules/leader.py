@@ -0,0 +1,102 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Elect one leader among the running scheduler instances.
+
+Only the leader runs the scheduled tasks and processes the schedule changes, the other instances wait until they can
+take over. The leader holds a Postgres session level advisory lock on a connection of its own. When the leader stops or
+loses its database connection, Postgres releases the lock and another instance acquires it.
+"""
+
+import structlog
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import DBAPIError
+
+logger = structlog.get_logger(__name__)
+
+# Arbitrary key of the advisory lock, the same for all instances
+SCHEDULER_LEADER_LOCK_ID = 7_461_902_358_102_655_343
+
+
+class SchedulerLeaderLock:
+    """Advisory lock that is held by the scheduler instance that is the leader."""
+
+    def __init__(self, engine: Engine, lock_id: int = SCHEDULER_LEADER_LOCK_ID) -> None:
+        self.engine = engine
+        self.lock_id = lock_id
+        self._connection: Connection | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._connection is not None
+
+    def acquire(self) -> bool:
+        """Try to become the leader, returns whether this instance is the leader."""
+        if self._connection is not None:
+            return True
+
+        connection = self.engine.connect()
+        try:
+            acquired = connection.execute(text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": self.lock_id})
+            is_leader = bool(acquired.scalar())
+            # The lock is bound to the session, end the transaction to not leave the connection idle in transaction
+            connection.commit()
+        except DBAPIError:
+            connection.invalidate()
+            connection.close()
+            logger.exception("Could not acquire the scheduler leader lock")
+            return False
+
+        if not is_leader:
+            connection.close()
+            return False
+
+        self._connection = connection
+        logger.info("Acquired the scheduler leader lock")
+        return True
+
+    def check(self) -> bool:
+        """Check that the connection holding the lock is alive, returns whether this instance is still the leader."""
+        if self._connection is None:
+            return False
+
+        try:
+            self._connection.execute(text("SELECT 1"))
+            self._connection.commit()
+        except DBAPIError:
+            logger.exception("Lost the connection holding the scheduler leader lock")
+            self._discard()
+            return False
+        return True
+
+    def release(self) -> None:
+        """Stop being the leader."""
+        if self._connection is None:
+            return
+
+        try:
+            self._connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": self.lock_id})
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+            logger.info("Released the scheduler leader lock")
+        except DBAPIError:
+            logger.exception("Could not release the scheduler leader lock")
+            self._discard()
+
+    def _discard(self) -> None:
+        if self._connection is None:
+            return
+        # Don't return the connection to the pool, closing it is what releases the lock on the server
+        self._connection.invalidate()
+        self._connection.close()
+        self._connection = None
@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle  # noqa: S403
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Generator
@@ -20,23 +21,34 @@ from apscheduler.jobstores.sqlalchemy import Job, SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from more_itertools import partition
 from pydantic import BaseModel
+from sqlalchemy import ColumnElement, String, cast, func, or_, select
 
 from orchestrator.core.db import db
 from orchestrator.core.db.filters import Filter
 from orchestrator.core.db.filters.filters import CallableErrorHandler
+from orchestrator.core.db.models import APSchedulerJobStoreModel, WorkflowApschedulerJob
 from orchestrator.core.db.sorting import Sort
 from orchestrator.core.db.sorting.sorting import SortOrder
 from orchestrator.core.schedules.service import get_linker_entries_by_schedule_ids
+from orchestrator.core.settings import app_settings
 from orchestrator.core.utils.helpers import camel_to_snake, to_camel
 
-executors = {
-    "default": ThreadPoolExecutor(1),
-}
-job_defaults = {
-    "coalesce": True,
-}
 
-scheduler = BackgroundScheduler(executors=executors, job_defaults=job_defaults)
+def create_scheduler() -> BackgroundScheduler:
+    """Create a scheduler that runs the scheduled tasks in a thread pool, configured by the SCHEDULER_* settings."""
+    executors = {
+        "default": ThreadPoolExecutor(app_settings.SCHEDULER_MAX_WORKERS),
+    }
+    job_defaults = {
+        "coalesce": app_settings.SCHEDULER_COALESCE,
+        "misfire_grace_time": app_settings.SCHEDULER_MISFIRE_GRACE_TIME,
+        # A task that is still running when it is due again is skipped
+        "max_instances": 1,
+    }
+    return BackgroundScheduler(executors=executors, job_defaults=job_defaults)
+
+
+scheduler = create_scheduler()
 
 
 @contextmanager
@@ -60,17 +72,23 @@ def get_scheduler_task(job_id: str) -> Job | None:
 
 @contextmanager
 def get_scheduler(paused: bool = False) -> Generator[BackgroundScheduler, Any, None]:
-    with get_scheduler_store() as store:
-        try:
+    """Start the scheduler with the tasks in the database and shut it down on exit.
+
+    A scheduler can't be started again once it is shut down, its thread pool is shut down as well. The module level
+    scheduler is therefore replaced with a new one on exit, so a scheduler that regains the leadership runs its tasks.
+    """
+    global scheduler
+    try:
+        with get_scheduler_store() as store:
             scheduler.add_jobstore(store)
-        except ValueError:
-            pass
-        scheduler.start(paused=paused)
+            scheduler.start(paused=paused)
 
-        try:
-            yield scheduler
-        finally:
-            scheduler.shutdown()
+            try:
+                yield scheduler
+            finally:
+                scheduler.shutdown()
+    finally:
+        scheduler = create_scheduler()
 
 
 class ScheduledTask(BaseModel):
@@ -190,6 +208,62 @@ def enrich_with_workflow_id(
     ]
 
 
+# The name and trigger of a scheduled task are only stored in its pickled job state
+_sql_filter_columns: dict[str, ColumnElement] = {
+    "id": APSchedulerJobStoreModel.id,
+    "workflow_id": cast(WorkflowApschedulerJob.workflow_id, String),
+}
+_sql_sort_columns: dict[str, ColumnElement] = {
+    "id": APSchedulerJobStoreModel.id,
+    "workflow_id": WorkflowApschedulerJob.workflow_id,
+    "next_run_time": APSchedulerJobStoreModel.next_run_time,
+}
+
+
+def _can_query_in_sql(filter_by: list[Filter] | None, sort_by: list[Sort] | None) -> bool:
+    return all(camel_to_snake(f.field) in _sql_filter_columns for f in filter_by or []) and all(
+        camel_to_snake(sort.field) in _sql_sort_columns for sort in sort_by or []
+    )
+
+
+def _query_scheduler_tasks(
+    first: int, after: int, filter_by: list[Filter] | None, sort_by: list[Sort] | None
+) -> tuple[list[ScheduledTask], int]:
+    """Filter, sort and paginate the scheduled tasks in the database, only the job states of the page are unpickled."""
+    stmt = select(
+        APSchedulerJobStoreModel.id, APSchedulerJobStoreModel.job_state, WorkflowApschedulerJob.workflow_id
+    ).join(WorkflowApschedulerJob, WorkflowApschedulerJob.schedule_id == APSchedulerJobStoreModel.id)
+    if filter_by:
+        stmt = stmt.where(
+            or_(*(_sql_filter_columns[camel_to_snake(f.field)].icontains(f.value, autoescape=True) for f in filter_by))
+        )
+
+    total = db.session.scalar(select(func.count()).select_from(stmt.subquery())) or 0
+
+    order_by = []
+    for sort in sort_by or []:
+        column = _sql_sort_columns[camel_to_snake(sort.field)]
+        order_by.append(column.asc() if sort.order == SortOrder.ASC else column.desc())
+    # Paused tasks have no next run time, like the job store these come last
+    stmt = stmt.order_by(
+        *order_by, APSchedulerJobStoreModel.next_run_time.asc().nulls_last(), APSchedulerJobStoreModel.id
+    )
+
+    scheduled_tasks = []
+    for row in db.session.execute(stmt.offset(after).limit(first + 1)):
+        job_state = pickle.loads(row.job_state)  # noqa: S301
+        scheduled_tasks.append(
+            ScheduledTask(
+                id=row.id,
+                workflow_id=str(row.workflow_id),
+                name=job_state["name"],
+                next_run_time=job_state["next_run_time"],
+                trigger=str(job_state["trigger"]),
+            )
+        )
+    return scheduled_tasks, total
+
+
 def get_scheduler_tasks(
     first: int = 10,
     after: int = 0,
@@ -197,6 +271,14 @@ def get_scheduler_tasks(
     sort_by: list[Sort] | None = None,
     error_handler: CallableErrorHandler = default_error_handler,
 ) -> tuple[list[ScheduledTask], int]:
+    """Return a page of the scheduled tasks that are linked to a workflow, and the total number of these tasks.
+
+    Filtering on and sorting by the id, workflow id and next run time is done in the database. Filtering on or sorting
+    by the name or trigger needs all scheduled tasks to be loaded.
+    """
+    if _can_query_in_sql(filter_by, sort_by):
+        return _query_scheduler_tasks(first, after, filter_by, sort_by)
+
     scheduled_tasks = get_all_scheduler_tasks()
     scheduled_tasks = filter_scheduled_tasks(scheduled_tasks, error_handler, filter_by)
     scheduled_tasks = sort_scheduled_tasks(scheduled_tasks, error_handler, sort_by)
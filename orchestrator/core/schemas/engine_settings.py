@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import datetime
 
 import strawberry
 from pydantic import ConfigDict
@@ -37,7 +38,17 @@ class WorkerStatus(OrchestratorBaseModel):
     number_of_running_jobs: int = 0
 
 
+class ResumeProgressSchema(OrchestratorBaseModel):
+    total: int
+    resumed: int
+    failed: int
+    in_progress: bool
+    started_at: datetime
+    finished_at: datetime | None = None
+
+
 class EngineSettingsSchema(EngineSettingsBaseSchema):
     global_status: GlobalStatusEnum | None = None
     running_processes: int
+    resume_progress: ResumeProgressSchema | None = None
     model_config = ConfigDict(from_attributes=True)
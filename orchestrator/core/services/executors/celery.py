@@ -10,9 +10,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from http import HTTPStatus
-from typing import Any
+from typing import Any, NamedTuple
 from uuid import UUID
 
 import structlog
@@ -22,7 +22,7 @@ from sqlalchemy import select
 
 from orchestrator.core import app_settings
 from orchestrator.core.api.error_handling import raise_status
-from orchestrator.core.db import ProcessTable, WorkflowTable, db
+from orchestrator.core.db import ProcessTable, db
 from orchestrator.core.db.database import transactional
 from orchestrator.core.services.executors.types import ExecutorFunction
 from orchestrator.core.services.processes import (
@@ -30,9 +30,10 @@ from orchestrator.core.services.processes import (
     can_be_resumed,
     create_process,
     delete_process,
+    delete_processes,
     set_process_status,
 )
-from orchestrator.core.services.workflows import get_workflow_by_name
+from orchestrator.core.services.workflows import WorkflowRegistryEntry, get_workflow_registry_entry
 from orchestrator.core.targets import Target
 from orchestrator.core.workflow import ProcessStat, ProcessStatus
 from pydantic_forms.types import State
@@ -40,10 +41,10 @@ from pydantic_forms.types import State
 logger = structlog.get_logger(__name__)
 
 
-def _resolve_queue(workflow: WorkflowTable) -> str | None:
+def _resolve_queue(workflow: WorkflowRegistryEntry) -> str | None:
     """Return the dedicated queue for this workflow's target, or None for default task_routes routing.
 
-    Pure lookup on an already-loaded workflow row; must never touch the database, as the
+    Pure lookup on an already-loaded workflow entry; must never touch the database, as the
     executor closes/commits its session right before publishing. The explicit Target()
     conversion makes a corrupt persisted target fail loudly instead of silently routing
     to the default queue.
@@ -51,6 +52,26 @@ def _resolve_queue(workflow: WorkflowTable) -> str | None:
     return app_settings.CELERY_TARGET_QUEUES.get(Target(workflow.target))
 
 
+def _resolve_options(workflow: WorkflowRegistryEntry) -> dict[str, Any]:
+    """Return the apply_async routing options for this workflow's target.
+
+    Contains the queue from CELERY_TARGET_QUEUES and the priority from CELERY_TARGET_PRIORITIES, options that are not
+    configured for the target are left out so the default task_routes routing applies.
+    """
+    options: dict[str, Any] = {}
+    if queue := _resolve_queue(workflow):
+        options["queue"] = queue
+    if (priority := app_settings.CELERY_TARGET_PRIORITIES.get(Target(workflow.target))) is not None:
+        options["priority"] = priority
+    return options
+
+
+class _Dispatch(NamedTuple):
+    process_id: UUID
+    task_name: str
+    options: dict[str, Any]
+
+
 def _block_when_testing(task_result: AsyncResult) -> None:
     # Enables "Sync celery tasks. This will let the app wait until celery completes"
     if app_settings.TESTING:
@@ -67,22 +88,23 @@ def _celery_start_process(pstat: ProcessStat, user: str = SYSTEM_USER, **kwargs:
     """
     from orchestrator.core.services.tasks import NEW_TASK, NEW_WORKFLOW, get_celery_task
 
-    if not (wf_table := get_workflow_by_name(pstat.workflow.name)):
+    if not (workflow := get_workflow_registry_entry(pstat.workflow.name)):
         raise_status(HTTPStatus.NOT_FOUND, "Workflow in Database does not exist")
 
-    task_name = NEW_TASK if wf_table.is_task else NEW_WORKFLOW
+    task_name = NEW_TASK if workflow.is_task else NEW_WORKFLOW
     trigger_task = get_celery_task(task_name)
     # Resolve before the session boundary below; no workflow attribute may be read after it.
-    queue = _resolve_queue(wf_table)
+    options = _resolve_options(workflow)
 
     # Close the SessionTransaction on the API side.
     db.session.close()
 
     try:
         # Trigger the celery task. This will create a SessionTransaction on the worker to read the process.
-        options = {"queue": queue} if queue else {}
         result = trigger_task.apply_async((pstat.process_id, user), **options)
-        logger.debug("Enqueued process", process_id=pstat.process_id, task=task_name, queue=queue or "default")
+        logger.debug(
+            "Enqueued process", process_id=pstat.process_id, task=task_name, queue=options.get("queue", "default")
+        )
         _block_when_testing(result)
         return pstat.process_id
     except (ConnectionError, OperationalError) as e:
@@ -112,7 +134,7 @@ def _celery_resume_process(
     task_name = RESUME_TASK if process.workflow.is_task else RESUME_WORKFLOW
     trigger_task = get_celery_task(task_name)
     # Resolve before the transaction boundary below; no workflow attribute may be read after it.
-    queue = _resolve_queue(process.workflow)
+    options = _resolve_options(process.workflow)
 
     # Final write action to the process: ensure the SessionTransaction is committed on the API side.
     with transactional(db, logger):
@@ -120,9 +142,10 @@ def _celery_resume_process(
 
     try:
         # Trigger the celery task. This will create a SessionTransaction on the worker to read the process.
-        options = {"queue": queue} if queue else {}
         result = trigger_task.apply_async((process.process_id, user), **options)
-        logger.debug("Enqueued process", process_id=process.process_id, task=task_name, queue=queue or "default")
+        logger.debug(
+            "Enqueued process", process_id=process.process_id, task=task_name, queue=options.get("queue", "default")
+        )
         _block_when_testing(result)
 
         return process.process_id
@@ -160,6 +183,64 @@ def _celery_set_process_status_resumed(process_id: UUID) -> None:
         raise ValueError(f"Process has incorrect status to resume: {locked_process.last_status}")
 
 
+def _publish_tasks(dispatches: Sequence[_Dispatch], user: str, published: list[UUID]) -> None:
+    """Publish a task for every dispatch over a single broker connection.
+
+    The id of every enqueued process is appended to `published`, so the caller knows which processes were enqueued
+    when publishing fails halfway.
+    """
+    from orchestrator.core.services.tasks import get_celery_producer, get_celery_task
+
+    trigger_tasks = {task_name: get_celery_task(task_name) for task_name in {d.task_name for d in dispatches}}
+    results = []
+    with get_celery_producer() as producer:
+        for dispatch in dispatches:
+            trigger_task = trigger_tasks[dispatch.task_name]
+            results.append(trigger_task.apply_async((dispatch.process_id, user), producer=producer, **dispatch.options))
+            published.append(dispatch.process_id)
+
+    logger.debug("Enqueued processes", count=len(published))
+    for result in results:
+        _block_when_testing(result)
+
+
+def _celery_start_processes(pstats: Sequence[ProcessStat], user: str = SYSTEM_USER, **kwargs: Any) -> list[UUID]:
+    """Trigger celery workers to start the given processes.
+
+    This wrapper ensures that:
+     - The current sqlalchemy SessionTransaction is closed
+     - All tasks are published over a single broker connection
+     - The processes that were not enqueued are removed from the database if triggering celery failed
+    """
+    from orchestrator.core.services.tasks import NEW_TASK, NEW_WORKFLOW
+
+    workflows: dict[str, WorkflowRegistryEntry] = {}
+    dispatches = []
+    for pstat in pstats:
+        if (workflow := workflows.get(pstat.workflow.name)) is None:
+            if not (workflow := get_workflow_registry_entry(pstat.workflow.name)):
+                raise_status(HTTPStatus.NOT_FOUND, "Workflow in Database does not exist")
+            workflows[pstat.workflow.name] = workflow
+        task_name = NEW_TASK if workflow.is_task else NEW_WORKFLOW
+        dispatches.append(_Dispatch(pstat.process_id, task_name, _resolve_options(workflow)))
+
+    # Close the SessionTransaction on the API side.
+    db.session.close()
+
+    published: list[UUID] = []
+    try:
+        _publish_tasks(dispatches, user, published)
+    except (ConnectionError, OperationalError):
+        logger.warning(
+            "Connection error when submitting tasks to Celery. Delete the processes that were not enqueued.",
+            enqueued=len(published),
+            total=len(dispatches),
+        )
+        delete_processes([dispatch.process_id for dispatch in dispatches[len(published) :]])
+        raise
+    return published
+
+
 def _celery_validate(validation_workflow: str, json: list[State] | None) -> None:
     pstat = create_process(validation_workflow, user_inputs=json)
     CELERY_EXECUTION_CONTEXT[ExecutorFunction.START](pstat)
@@ -169,4 +250,5 @@ CELERY_EXECUTION_CONTEXT: dict[ExecutorFunction, Callable] = {
     ExecutorFunction.START: _celery_start_process,
     ExecutorFunction.RESUME: _celery_resume_process,
     ExecutorFunction.VALIDATE: _celery_validate,
+    ExecutorFunction.START_MANY: _celery_start_processes,
 }
@@ -10,7 +10,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import partial
 from uuid import UUID
 
@@ -103,7 +103,12 @@ def thread_start_process(
     pstat.current_user = user
 
     _safe_logstep_with_func = partial(safe_logstep, broadcast_func=broadcast_func)
-    return _run_process_async(pstat.process_id, lambda: runwf(pstat, _safe_logstep_with_func), broadcast_func=broadcast_func)
+    return _run_process_async(
+        pstat.process_id,
+        lambda: runwf(pstat, _safe_logstep_with_func),
+        broadcast_func=broadcast_func,
+        workflow_name=pstat.workflow.name,
+    )
 
 
 def thread_resume_process(
@@ -146,7 +151,12 @@ def thread_resume_process(
 
     # Trigger the task in the current thread or threadpool (depends on executor mode).
     _safe_logstep_prep = partial(safe_logstep, broadcast_func=broadcast_func)
-    _run_process_async(pstat.process_id, lambda: runwf(pstat, _safe_logstep_prep), broadcast_func=broadcast_func)
+    _run_process_async(
+        pstat.process_id,
+        lambda: runwf(pstat, _safe_logstep_prep),
+        broadcast_func=broadcast_func,
+        workflow_name=pstat.workflow.name,
+    )
     return pstat.process_id
 
 
@@ -156,8 +166,17 @@ def thread_validate_workflow(validation_workflow: str, json: list[State] | None)
     return THREADPOOL_EXECUTION_CONTEXT[ExecutorFunction.START](pstat)
 
 
+def thread_start_processes(
+    pstats: Sequence[ProcessStat],
+    user: str = SYSTEM_USER,
+    broadcast_func: BroadcastFunc | None = None,
+) -> list[UUID]:
+    return [thread_start_process(pstat, user=user, broadcast_func=broadcast_func) for pstat in pstats]
+
+
 THREADPOOL_EXECUTION_CONTEXT: dict[ExecutorFunction, Callable] = {
     ExecutorFunction.START: thread_start_process,
     ExecutorFunction.RESUME: thread_resume_process,
     ExecutorFunction.VALIDATE: thread_validate_workflow,
+    ExecutorFunction.START_MANY: thread_start_processes,
 }
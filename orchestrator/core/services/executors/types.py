@@ -18,3 +18,4 @@ class ExecutorFunction(StrEnum):
     START = "start"
     RESUME = "resume"
     VALIDATE = "validate"
+    START_MANY = "start_many"
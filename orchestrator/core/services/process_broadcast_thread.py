@@ -10,7 +10,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import asyncio
 import queue
 import threading
 from functools import partial
@@ -24,7 +23,8 @@ from orchestrator.core.types import BroadcastFunc
 from orchestrator.core.websocket import (
     WS_CHANNELS,
     broadcast_process_update_to_websocket,
-    broadcast_process_update_to_websocket_async,
+    get_terminated_process_subscription_ids,
+    sync_broadcast_process_update,
     websocket_manager,
 )
 from orchestrator.core.websocket.websocket_manager import WebSocketManager
@@ -32,7 +32,8 @@ from orchestrator.core.websocket.websocket_manager import WebSocketManager
 if TYPE_CHECKING:
     from orchestrator.core.graphql.types import OrchestratorInfo
 
-BroadcastQueue = queue.Queue[UUID]
+# The process id with the subscription ids of the process when it is no longer running
+BroadcastQueue = queue.Queue[tuple[UUID, set[UUID] | None]]
 
 logger = structlog.get_logger(__name__)
 
@@ -47,11 +48,9 @@ class ProcessDataBroadcastThread(threading.Thread):
     def run(self) -> None:
         logger.info("Starting ProcessDataBroadcastThread")
         try:
-            loop = asyncio.new_event_loop()  # Create an eventloop specifically for this thread
-
             while not self.shutdown:
                 try:
-                    process_id = self.queue.get(block=True, timeout=1)
+                    process_id, subscription_ids = self.queue.get(block=True, timeout=1)
                 except queue.Empty:
                     continue
                 logger.debug(
@@ -60,9 +59,9 @@ class ProcessDataBroadcastThread(threading.Thread):
                     where="ProcessDataBroadcastThread",
                     channels=WS_CHANNELS.EVENTS,
                 )
-                loop.run_until_complete(broadcast_process_update_to_websocket_async(process_id))
+                # Sent from the broadcast bridge, which coalesces the updates of fast running processes
+                sync_broadcast_process_update(process_id, subscription_ids)
 
-            loop.close()
             logger.info("Shutdown ProcessDataBroadcastThread")
         except Exception:
             logger.exception("Unhandled exception in ProcessDataBroadcastThread, exiting")
@@ -89,7 +88,8 @@ def _broadcast_ws_fn(process_id: UUID) -> None:
 def _broadcast_queue_put_fn(broadcast_queue: BroadcastQueue, process_id: UUID) -> None:
     # Catch all exceptions as broadcasting failure is noncritical to workflow completion
     try:
-        broadcast_queue.put(process_id)
+        # Read the status here, the workflow may not have committed it when the broadcast thread gets the update
+        broadcast_queue.put((process_id, get_terminated_process_subscription_ids(process_id)))
     except Exception:
         logger.exception("An error occurred when putting process_id on broadcast queue")
 
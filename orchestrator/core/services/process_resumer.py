@@ -0,0 +1,200 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Hand many processes to the executor concurrently, e.g. to resume processes after the engine has been unlocked.
+
+The processes are loaded in batches, a thread per batch hands them to the executor one by one. The rate at which all
+threads together hand off processes can be limited, so a large backlog does not flood the workers at once.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import structlog
+from more_itertools import chunked
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from orchestrator.core.db import ProcessTable, db
+from orchestrator.core.schemas.engine_settings import ResumeProgressSchema
+from orchestrator.core.settings import app_settings
+from orchestrator.core.utils.datetime import nowtz
+
+logger = structlog.get_logger(__name__)
+
+
+class RateLimiter:
+    """Space out calls so that all threads together make at most `rate` calls per second, 0 means unlimited."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + 1 / self.rate
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class ResumeProgress:
+    """Progress of a resume run, updated by the threads of the run."""
+
+    def __init__(self, total: int) -> None:
+        self._lock = threading.Lock()
+        self.total = total
+        self.resumed = 0
+        self.failed = 0
+        self.started_at = nowtz()
+        self.finished_at: datetime | None = None
+
+    def add(self, *, resumed: int = 0, failed: int = 0) -> None:
+        with self._lock:
+            self.resumed += resumed
+            self.failed += failed
+
+    def finish(self) -> None:
+        self.finished_at = nowtz()
+
+    def to_schema(self) -> ResumeProgressSchema:
+        with self._lock:
+            return ResumeProgressSchema(
+                total=self.total,
+                resumed=self.resumed,
+                failed=self.failed,
+                in_progress=self.finished_at is None,
+                started_at=self.started_at,
+                finished_at=self.finished_at,
+            )
+
+
+_unlock_progress: ResumeProgress | None = None
+
+
+def get_resume_progress() -> ResumeProgressSchema | None:
+    """Return the progress of resuming the processes after the latest engine unlock by this instance, if any."""
+    return _unlock_progress.to_schema() if _unlock_progress else None
+
+
+def _hand_off_batch(
+    process_ids: list[UUID | str],
+    handoff: Callable[[ProcessTable], Any],
+    rate_limiter: RateLimiter,
+    progress: ResumeProgress,
+) -> list[UUID]:
+    """Load a batch of processes with a single query and hand them to the executor in a database scope of its own."""
+    handed_off = []
+    with db.database_scope():
+        stmt = (
+            select(ProcessTable)
+            .where(ProcessTable.process_id.in_(process_ids))
+            .options(joinedload(ProcessTable.workflow))
+        )
+        processes = {str(process.process_id): process for process in db.session.scalars(stmt)}
+
+        for process_id in process_ids:
+            if not (process := processes.get(str(process_id))):
+                # Removed since the candidates were collected
+                progress.add(failed=1)
+                continue
+
+            rate_limiter.wait()
+            try:
+                handoff(process)
+            except Exception as exc:
+                logger.warning("Could not resume process", process_id=str(process_id), error=str(exc))
+                progress.add(failed=1)
+            else:
+                handed_off.append(process.process_id)
+                progress.add(resumed=1)
+
+    return handed_off
+
+
+def resume_processes_concurrently(
+    process_ids: Sequence[UUID | str],
+    handoff: Callable[[ProcessTable], Any],
+    concurrency: int | None = None,
+    batch_size: int | None = None,
+    rate_limit: float | None = None,
+    progress: ResumeProgress | None = None,
+) -> list[UUID]:
+    """Hand the given processes to the executor with a thread pool.
+
+    Args:
+        process_ids: The processes to hand off.
+        handoff: Function that hands one process to the executor, e.g. `resume_process` or `restart_process`.
+        concurrency: Maximum number of threads, defaults to `app_settings.RESUME_CONCURRENCY`.
+        batch_size: Number of processes a thread loads with one query, defaults to `app_settings.RESUME_BATCH_SIZE`.
+        rate_limit: Maximum number of processes handed off per second by all threads together, defaults to
+            `app_settings.RESUME_RATE_LIMIT`.
+        progress: Progress to update while handing off the processes.
+
+    Returns:
+        The ids of the processes that were handed off, processes that failed or no longer exist are left out.
+    """
+    concurrency = concurrency or app_settings.RESUME_CONCURRENCY
+    batch_size = batch_size or app_settings.RESUME_BATCH_SIZE
+    rate_limiter = RateLimiter(app_settings.RESUME_RATE_LIMIT if rate_limit is None else rate_limit)
+    progress = progress or ResumeProgress(len(process_ids))
+
+    logger.info("Resuming processes", total=len(process_ids), concurrency=concurrency, batch_size=batch_size)
+    handed_off: list[UUID] = []
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="process-resumer") as executor:
+            batches = chunked(process_ids, batch_size)
+            for batch_result in executor.map(
+                lambda batch: _hand_off_batch(batch, handoff, rate_limiter, progress), batches
+            ):
+                handed_off.extend(batch_result)
+    finally:
+        progress.finish()
+
+    logger.info("Completed resuming processes", resumed=progress.resumed, failed=progress.failed)
+    return handed_off
+
+
+def resume_processes_after_unlock(
+    process_ids: Sequence[UUID], handoff: Callable[[ProcessTable], Any]
+) -> threading.Thread:
+    """Hand the processes that were running when the engine was locked to the executor on a dedicated thread.
+
+    The thread does not take a thread of the threadpool executor, which may be needed to run the resumed processes.
+    Its progress is reported in the engine status, see `get_resume_progress()`.
+
+    Returns:
+        The started thread
+    """
+    global _unlock_progress
+
+    progress = _unlock_progress = ResumeProgress(len(process_ids))
+    thread = threading.Thread(
+        target=resume_processes_concurrently,
+        args=(process_ids, handoff),
+        kwargs={"progress": progress},
+        name="engine-unlock-resumer",
+        daemon=True,
+    )
+    thread.start()
+    return thread
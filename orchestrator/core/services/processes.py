@@ -11,18 +11,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import threading
+import time
 from collections.abc import Callable, Sequence
 from concurrent.futures.thread import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from http import HTTPStatus
-from typing import Any
+from typing import Any, NamedTuple
 from uuid import UUID, uuid4
 
 import structlog
 from deepmerge.merger import Merger
 from pytz import utc
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
@@ -30,14 +31,28 @@ from nwastdlib.ex import show_ex
 from oauth2_lib.fastapi import OIDCUserModel
 from orchestrator.core.api.error_handling import raise_status
 from orchestrator.core.config.assignee import Assignee
-from orchestrator.core.db import EngineSettingsTable, ProcessStepTable, ProcessSubscriptionTable, ProcessTable, db
+from orchestrator.core.db import (
+    EngineSettingsTable,
+    ProcessStatusCountsTable,
+    ProcessStepTable,
+    ProcessSubscriptionTable,
+    ProcessTable,
+    db,
+)
 from orchestrator.core.db.database import transactional
 from orchestrator.core.db.models import FAILED_REASON_LENGTH, TRACEBACK_LENGTH
 from orchestrator.core.distlock import distlock_manager
+from orchestrator.core.metrics.workflows import (
+    PROCESS_BROADCAST_DURATION,
+    PROCESS_QUEUE_WAIT,
+    observe,
+    observe_duration,
+)
 from orchestrator.core.schemas.engine_settings import WorkerStatus
 from orchestrator.core.services.executors.types import ExecutorFunction
 from orchestrator.core.services.input_state import store_input_state
-from orchestrator.core.services.workflows import get_workflow_by_name
+from orchestrator.core.services.process_resumer import resume_processes_after_unlock
+from orchestrator.core.services.workflows import get_workflow_registry_entry
 from orchestrator.core.settings import ExecutorType, app_settings
 from orchestrator.core.types import BroadcastFunc
 from orchestrator.core.utils.datetime import nowtz
@@ -58,6 +73,7 @@ from orchestrator.core.workflow import (
     RunPredicatePass,
     Step,
     StepList,
+    StepStatus,
     Success,
     Workflow,
     abort_wf,
@@ -168,16 +184,16 @@ def shutdown_thread_pool() -> None:
 
 
 def _db_create_process(stat: ProcessStat) -> None:
-    wf_table = get_workflow_by_name(stat.workflow.name)
-    if not wf_table:
+    workflow = get_workflow_registry_entry(stat.workflow.name)
+    if not workflow:
         raise AssertionError(f"No workflow found with name: {stat.workflow.name}")
 
     p = ProcessTable(
         process_id=stat.process_id,
-        workflow_id=wf_table.workflow_id,
+        workflow_id=workflow.workflow_id,
         last_status=ProcessStatus.CREATED,
         created_by=stat.current_user,
-        is_task=wf_table.is_task,
+        is_task=workflow.is_task,
     )
     db.session.add(p)
 
@@ -188,6 +204,12 @@ def delete_process(process_id: UUID) -> None:
     broadcast_invalidate_status_counts()
 
 
+def delete_processes(process_ids: Sequence[UUID]) -> None:
+    with transactional(db, logger):
+        db.session.execute(delete(ProcessTable).where(ProcessTable.process_id.in_(process_ids)))
+    broadcast_invalidate_status_counts()
+
+
 def _update_process(process_id: UUID, step: Step, process_state: WFProcess) -> ProcessTable:
     p = db.session.get(ProcessTable, process_id)
     if p is None:
@@ -356,7 +378,8 @@ def _db_log_step(
     db.session.add(current_step)
 
     if broadcast_func:
-        broadcast_func(p.process_id)
+        with observe_duration(PROCESS_BROADCAST_DURATION):
+            broadcast_func(p.process_id)
 
     return process_state.__class__(current_step.state)
 
@@ -440,8 +463,9 @@ def _get_process(process_id: UUID) -> ProcessTable:
     return process
 
 
-def _run_process_async(process_id: UUID, f: Callable, broadcast_func: BroadcastFunc | None = None) -> UUID:
-
+def _run_process_async(
+    process_id: UUID, f: Callable, broadcast_func: BroadcastFunc | None = None, workflow_name: str = ""
+) -> UUID:
     def run() -> WFProcess:
         with _ActiveJobTracker():
             try:
@@ -464,8 +488,14 @@ def _run_process_async(process_id: UUID, f: Callable, broadcast_func: BroadcastF
             return result
 
     if app_settings.EXECUTOR == ExecutorType.THREADPOOL:
+        queued_at = time.perf_counter()
+
+        def run_queued() -> WFProcess:
+            observe(PROCESS_QUEUE_WAIT, time.perf_counter() - queued_at, workflow_name)
+            return run()
+
         workflow_executor = get_thread_pool()
-        process_handle = workflow_executor.submit(run)
+        process_handle = workflow_executor.submit(run_queued)
 
         # Wait for the thread to return.
         if app_settings.TESTING:
@@ -478,14 +508,13 @@ def _run_process_async(process_id: UUID, f: Callable, broadcast_func: BroadcastF
     return process_id
 
 
-def create_process(
+def _prepare_process(
     workflow_key: str,
-    user_inputs: list[State] | None = None,
-    user: str = SYSTEM_USER,
-    user_model: OIDCUserModel | None = None,
-) -> ProcessStat:
-    # ATTENTION!! When modifying this function make sure you make similar changes to `run_workflow` in the test code
-
+    user_inputs: list[State] | None,
+    user: str,
+    user_model: OIDCUserModel | None,
+) -> tuple[ProcessStat, State]:
+    """Check the run predicate and the initial form of a new process, without writing anything to the database."""
     if user_inputs is None:
         user_inputs = default_user_inputs()
 
@@ -524,14 +553,53 @@ def create_process(
         current_user=user,
         user_model=user_model,
     )
+    return pstat, state | initial_state
+
+
+def create_process(
+    workflow_key: str,
+    user_inputs: list[State] | None = None,
+    user: str = SYSTEM_USER,
+    user_model: OIDCUserModel | None = None,
+) -> ProcessStat:
+    # ATTENTION!! When modifying this function make sure you make similar changes to `run_workflow` in the test code
+    pstat, initial_state = _prepare_process(workflow_key, user_inputs, user, user_model)
 
     with transactional(db, logger):
         _db_create_process(pstat)
-        store_input_state(process_id, state | initial_state, "initial_state")
+        store_input_state(pstat.process_id, initial_state, "initial_state")
 
     return pstat
 
 
+def create_processes(
+    workflow_key: str,
+    user_inputs_list: Sequence[list[State] | None],
+    user: str = SYSTEM_USER,
+) -> list[ProcessStat]:
+    """Create a process for every set of user inputs in a single transaction.
+
+    All forms are validated before anything is written, so either all processes are created or none.
+
+    Args:
+        workflow_key: name of workflow
+        user_inputs_list: The form inputs of every process
+        user: User who starts these processes
+
+    Returns:
+        The created processes, in the order of `user_inputs_list`
+
+    """
+    prepared = [_prepare_process(workflow_key, user_inputs, user, None) for user_inputs in user_inputs_list]
+
+    with transactional(db, logger):
+        for pstat, initial_state in prepared:
+            _db_create_process(pstat)
+            store_input_state(pstat.process_id, initial_state, "initial_state")
+
+    return [pstat for pstat, _ in prepared]
+
+
 def start_process(
     workflow_key: str,
     user_inputs: list[State] | None = None,
@@ -558,6 +626,36 @@ def start_process(
     return start_func(pstat, user=user, user_model=user_model, broadcast_func=broadcast_func)
 
 
+def start_processes(
+    workflow_key: str,
+    user_inputs_list: Sequence[list[State] | None],
+    user: str = SYSTEM_USER,
+    broadcast_func: BroadcastFunc | None = None,
+) -> list[UUID]:
+    """Start a process of the same workflow for every set of user inputs.
+
+    The processes are created in a single transaction and handed to the executor in one go, which for the celery
+    executor means they are published over a single broker connection.
+
+    Args:
+        workflow_key: name of workflow
+        user_inputs_list: The form inputs of every process
+        user: User who starts these processes
+        broadcast_func: Optional function to broadcast process data
+
+    Returns:
+        The process ids, in the order of `user_inputs_list`
+
+    """
+    if not user_inputs_list:
+        return []
+
+    pstats = create_processes(workflow_key, user_inputs_list, user=user)
+
+    start_many_func = get_execution_context()[ExecutorFunction.START_MANY]
+    return start_many_func(pstats, user=user, broadcast_func=broadcast_func)
+
+
 def restart_process(
     process: ProcessTable,
     *,
@@ -848,11 +946,71 @@ def _restore_log(steps: list[ProcessStepTable]) -> list[WFProcess]:
     return [deserialize(step) for step in steps]
 
 
-def load_process(process: ProcessTable) -> ProcessStat:
-    workflow = get_workflow(str(process.workflow.name))
+class ProcessProgress(NamedTuple):
+    """How far a process got in its workflow, as `_recoverwf` would determine it from the step log."""
+
+    cleared_steps: int
+    is_complete: bool
+
+
+_UNCLEARED_STEP_STATUSES = (StepStatus.FAILED, StepStatus.SUSPEND, StepStatus.WAITING, StepStatus.AWAITING_CALLBACK)
+
+
+def get_processes_progress(process_ids: Sequence[UUID]) -> dict[UUID, ProcessProgress]:
+    """Get the progress of multiple processes in one query, without loading and deserializing their steps."""
+    stmt = (
+        select(
+            ProcessTable.process_id,
+            func.count(ProcessStepTable.step_id).filter(ProcessStepTable.status.not_in(_UNCLEARED_STEP_STATUSES)),
+            func.coalesce(func.bool_or(ProcessStepTable.status == StepStatus.COMPLETE), False),
+        )
+        .outerjoin(ProcessStepTable)
+        .where(ProcessTable.process_id.in_(process_ids))
+        .group_by(ProcessTable.process_id)
+    )
+    return {
+        process_id: ProcessProgress(cleared_steps=cleared_steps, is_complete=is_complete)
+        for process_id, cleared_steps, is_complete in db.session.execute(stmt)
+    }
+
+
+def get_process_status_counts() -> dict[str, dict[str, int]]:
+    """Get the number of processes and tasks per status from the trigger maintained process_status_counts table."""
+    stmt = select(
+        ProcessStatusCountsTable.is_task, ProcessStatusCountsTable.last_status, ProcessStatusCountsTable.process_count
+    ).where(ProcessStatusCountsTable.process_count > 0)
+    rows = db.session.execute(stmt).all()
+    return {
+        "process_counts": {status: process_count for is_task, status, process_count in rows if not is_task},
+        "task_counts": {status: process_count for is_task, status, process_count in rows if is_task},
+    }
+
+
+def rebuild_process_status_counts() -> None:
+    """Recompute the process_status_counts table from the processes table.
+
+    Only needed when the counts drifted, for example after a TRUNCATE of the processes table which doesn't fire the
+    trigger that maintains them.
+    """
+    db.session.execute(delete(ProcessStatusCountsTable))
+    db.session.execute(
+        insert(ProcessStatusCountsTable).from_select(
+            ["is_task", "last_status", "process_count"],
+            select(ProcessTable.is_task, ProcessTable.last_status, func.count()).group_by(
+                ProcessTable.is_task, ProcessTable.last_status
+            ),
+        )
+    )
+    db.session.commit()
 
-    if not workflow:
-        workflow = removed_workflow
+
+def get_process_workflow(workflow_name: str) -> Workflow:
+    """Get the workflow to load a process with, which is `removed_workflow` when it is no longer registered."""
+    return get_workflow(workflow_name) or removed_workflow
+
+
+def load_process(process: ProcessTable) -> ProcessStat:
+    workflow = get_process_workflow(str(process.workflow.name))
 
     log = _restore_log(process.steps)
     pstate, remaining = _recoverwf(workflow, log)
@@ -866,11 +1024,25 @@ def load_process(process: ProcessTable) -> ProcessStat:
     )
 
 
-def _get_running_processes() -> list[ProcessTable]:
-    stmt = select(ProcessTable).where(ProcessTable.last_status == "running")
+def _set_running_processes_resumed() -> list[UUID]:
+    stmt = (
+        update(ProcessTable)
+        .where(ProcessTable.last_status == ProcessStatus.RUNNING)
+        .values(last_status=ProcessStatus.RESUMED)
+        .returning(ProcessTable.process_id)
+    )
     return list(db.session.scalars(stmt))
 
 
+def _resume_processes_in_background(process_ids: list[UUID]) -> None:
+    if not process_ids:
+        return
+
+    thread = resume_processes_after_unlock(process_ids, partial(resume_process, user=SYSTEM_USER))
+    if app_settings.TESTING:
+        thread.join()
+
+
 def set_process_status(process: ProcessTable, status: ProcessStatus) -> None:
     process.last_status = status
     db.session.add(process)
@@ -896,10 +1068,10 @@ def marshall_processes(engine_settings: EngineSettingsTable, new_global_lock: bo
             engine_settings.global_lock = new_global_lock
             db.session.commit()
 
-            # Resume all the running processes
-            for process in _get_running_processes():
-                set_process_status(process, ProcessStatus.RESUMED)
-                resume_process(process, user=SYSTEM_USER)
+            # Resume all the running processes in the background, the progress is reported in the engine status
+            process_ids = _set_running_processes_resumed()
+            db.session.commit()
+            _resume_processes_in_background(process_ids)
 
         elif not engine_settings.global_lock and new_global_lock:
             # Lock the engine
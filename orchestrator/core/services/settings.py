@@ -20,6 +20,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from orchestrator.core.db import EngineSettingsTable, db
 from orchestrator.core.schemas.engine_settings import EngineSettingsSchema, GlobalStatusEnum
+from orchestrator.core.services.process_resumer import get_resume_progress
 from orchestrator.core.services.worker_status_monitor import get_worker_status_monitor
 from orchestrator.core.settings import app_settings
 
@@ -107,4 +108,5 @@ def generate_engine_settings_schema(
         global_lock=engine_settings.global_lock,
         global_status=global_status,
         running_processes=running_count,
+        resume_progress=get_resume_progress(),
     )
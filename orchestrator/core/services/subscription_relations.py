@@ -18,7 +18,7 @@ from uuid import UUID
 
 import structlog
 from more_itertools import flatten, unique_everseen
-from sqlalchemy import Row, func, select
+from sqlalchemy import Row, func, select, union_all
 from sqlalchemy import Text as SaText
 from sqlalchemy import cast as sa_cast
 from sqlalchemy.orm import aliased
@@ -30,6 +30,7 @@ from orchestrator.core.db import (
     SubscriptionInstanceTable,
     SubscriptionInstanceValueTable,
     SubscriptionTable,
+    SubscriptionValidationResultTable,
     db,
 )
 from orchestrator.core.db.models import (
@@ -286,14 +287,24 @@ async def get_recursive_relations(
 
 
 async def get_last_validation_datetimes(subscription_ids: list[UUID]) -> list[datetime | None]:
-    stmt = (
-        select(ProcessSubscriptionTable.subscription_id, func.max(ProcessTable.last_modified_at))
+    """Return the last validation of each subscription, by a validate process or by the validation runner."""
+    validations = union_all(
+        select(
+            ProcessSubscriptionTable.subscription_id,
+            ProcessTable.last_modified_at.label("validated_at"),
+        )
         .join(ProcessSubscriptionTable)
-        .group_by(ProcessSubscriptionTable.subscription_id)
         .where(
             (ProcessSubscriptionTable.workflow_target == "VALIDATE")
             & ProcessSubscriptionTable.subscription_id.in_(subscription_ids)
-        )
+        ),
+        select(
+            SubscriptionValidationResultTable.subscription_id,
+            SubscriptionValidationResultTable.validated_at,
+        ).where(SubscriptionValidationResultTable.subscription_id.in_(subscription_ids)),
+    ).subquery()
+    stmt = select(validations.c.subscription_id, func.max(validations.c.validated_at)).group_by(
+        validations.c.subscription_id
     )
     results = db.session.execute(stmt).all()
     last_validation_indexed_by_sub_id = {
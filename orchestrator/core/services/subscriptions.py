@@ -13,22 +13,21 @@
 
 """Module that provides service functions on subscriptions."""
 
-import pickle  # noqa: S403
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime
-from hashlib import md5
-from typing import Any, TypeVar, overload
+from hashlib import blake2b
+from typing import Any, NamedTuple, TypeVar, overload
 from uuid import UUID
 
+import orjson
 import structlog
 from more_itertools import first
 from sqlalchemy import Text, cast, not_, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Query, aliased, joinedload
+from sqlalchemy.orm import Query, aliased, joinedload, selectinload
 from sqlalchemy.sql.expression import or_
 
-from orchestrator.core.api.helpers import getattr_in, product_block_paths, update_in
 from orchestrator.core.db import (
     ProductTable,
     ResourceTypeTable,
@@ -52,6 +51,7 @@ from orchestrator.core.targets import Target
 from orchestrator.core.types import SubscriptionLifecycle
 from orchestrator.core.utils.datetime import nowtz
 from orchestrator.core.utils.helpers import is_ipaddress_type
+from orchestrator.core.utils.json import to_serializable
 from pydantic_forms.types import UUIDstr
 
 logger = structlog.get_logger(__name__)
@@ -447,6 +447,13 @@ def _in_sync_filter(query: Query) -> list[SubscriptionRelationSchema]:
 
 RELATION_RESOURCE_TYPES: list[str] = []
 
+_RELATED_SUBSCRIPTION_COLUMNS = (
+    SubscriptionTable.subscription_id,
+    SubscriptionTable.description,
+    SubscriptionTable.insync,
+    SubscriptionTable.status,
+)
+
 
 def status_relations(subscription: SubscriptionTable | None) -> dict[str, list[SubscriptionRelationSchema]]:
     """Return info about locked subscription dependencies.
@@ -486,6 +493,135 @@ def status_relations(subscription: SubscriptionTable | None) -> dict[str, list[S
     return result
 
 
+class _RelatedSubscription(NamedTuple):
+    subscription_id: UUID
+    description: str
+    insync: bool
+    status: str
+
+
+def _related_subscriptions(rows: Iterable[Any]) -> dict[UUID, dict[UUID, _RelatedSubscription]]:
+    """Group (subscription_id, *related subscription columns) rows by the first column."""
+    grouped: dict[UUID, dict[UUID, _RelatedSubscription]] = defaultdict(dict)
+    for subscription_id, *columns in rows:
+        related = _RelatedSubscription(*columns)
+        grouped[subscription_id].setdefault(related.subscription_id, related)
+    return grouped
+
+
+def _in_use_by_relations(subscription_ids: set[UUID]) -> dict[UUID, dict[UUID, _RelatedSubscription]]:
+    in_use_by_instances = aliased(SubscriptionInstanceTable)
+    depends_on_instances = aliased(SubscriptionInstanceTable)
+    # Find relations through instance hierarchy
+    stmt = (
+        select(depends_on_instances.subscription_id, *_RELATED_SUBSCRIPTION_COLUMNS)
+        .distinct()
+        .select_from(in_use_by_instances)
+        .join(SubscriptionTable, in_use_by_instances.subscription)
+        .join(in_use_by_instances.depends_on_block_relations)
+        .join(depends_on_instances, SubscriptionInstanceRelationTable.depends_on)
+        .where(depends_on_instances.subscription_id.in_(subscription_ids))
+        .where(in_use_by_instances.subscription_id != depends_on_instances.subscription_id)
+    )
+    rows: list[Any] = list(db.session.execute(stmt))
+
+    if RELATION_RESOURCE_TYPES:
+        # Find relations through resource types
+        subscription_ids_by_value = {str(subscription_id): subscription_id for subscription_id in subscription_ids}
+        resource_type_stmt = (
+            select(SubscriptionInstanceValueTable.value, *_RELATED_SUBSCRIPTION_COLUMNS)
+            .distinct()
+            .select_from(SubscriptionInstanceValueTable)
+            .join(ResourceTypeTable)
+            .join(SubscriptionInstanceTable)
+            .join(SubscriptionTable, SubscriptionInstanceTable.subscription)
+            .where(ResourceTypeTable.resource_type.in_(RELATION_RESOURCE_TYPES))
+            .where(SubscriptionInstanceValueTable.value.in_(subscription_ids_by_value))
+        )
+        rows += [
+            (subscription_ids_by_value[value], *columns) for value, *columns in db.session.execute(resource_type_stmt)
+        ]
+
+    return _related_subscriptions(rows)
+
+
+def _depends_on_relations(subscription_ids: set[UUID]) -> dict[UUID, dict[UUID, _RelatedSubscription]]:
+    in_use_by_instances = aliased(SubscriptionInstanceTable)
+    depends_on_instances = aliased(SubscriptionInstanceTable)
+    # Find relations through instance hierarchy
+    stmt = (
+        select(in_use_by_instances.subscription_id, *_RELATED_SUBSCRIPTION_COLUMNS)
+        .distinct()
+        .select_from(depends_on_instances)
+        .join(SubscriptionTable, depends_on_instances.subscription)
+        .join(depends_on_instances.in_use_by_block_relations)
+        .join(in_use_by_instances, SubscriptionInstanceRelationTable.in_use_by)
+        .where(in_use_by_instances.subscription_id.in_(subscription_ids))
+        .where(depends_on_instances.subscription_id != in_use_by_instances.subscription_id)
+    )
+    rows: list[Any] = list(db.session.execute(stmt))
+
+    if RELATION_RESOURCE_TYPES:
+        # Find relations through resource types
+        resource_type_stmt = (
+            select(SubscriptionInstanceTable.subscription_id, *_RELATED_SUBSCRIPTION_COLUMNS)
+            .distinct()
+            .select_from(SubscriptionInstanceValueTable)
+            .join(ResourceTypeTable)
+            .join(SubscriptionInstanceTable)
+            .join(
+                SubscriptionTable, SubscriptionInstanceValueTable.value == cast(SubscriptionTable.subscription_id, Text)
+            )
+            .where(ResourceTypeTable.resource_type.in_(RELATION_RESOURCE_TYPES))
+            .where(SubscriptionInstanceTable.subscription_id.in_(subscription_ids))
+        )
+        rows += list(db.session.execute(resource_type_stmt))
+
+    return _related_subscriptions(rows)
+
+
+def status_relations_for_subscriptions(
+    subscription_ids: Sequence[UUID],
+) -> dict[UUID, dict[str, list[SubscriptionRelationSchema]]]:
+    """Return info about locked subscription dependencies for many subscriptions at once.
+
+    Batched variant of `status_relations` which computes the locked and unterminated relations of all
+    subscriptions with a fixed number of queries, independent of the number of subscriptions.
+
+    Args:
+        subscription_ids: the subscriptions to get the relation status for
+
+    Returns:
+        A dict mapping each subscription_id to the structure returned by `status_relations`.
+
+    """
+    unique_subscription_ids = set(subscription_ids)
+    if not unique_subscription_ids:
+        return {}
+
+    in_use_by = _in_use_by_relations(unique_subscription_ids)
+    depends_on = _depends_on_relations(unique_subscription_ids)
+
+    def to_schemas(relations: Iterable[_RelatedSubscription]) -> list[SubscriptionRelationSchema]:
+        return [
+            SubscriptionRelationSchema(subscription_id=r.subscription_id, subscription_description=r.description)
+            for r in relations
+        ]
+
+    def get_status_relations(subscription_id: UUID) -> dict[str, list[SubscriptionRelationSchema]]:
+        in_use_by_relations = in_use_by.get(subscription_id, {}).values()
+        depends_on_relations = depends_on.get(subscription_id, {}).values()
+        return {
+            "locked_relations": to_schemas(r for r in in_use_by_relations if not r.insync)
+            + to_schemas(r for r in depends_on_relations if not r.insync),
+            "unterminated_in_use_by_subscriptions": to_schemas(
+                r for r in in_use_by_relations if r.status != SubscriptionLifecycle.TERMINATED
+            ),
+        }
+
+    return {subscription_id: get_status_relations(subscription_id) for subscription_id in unique_subscription_ids}
+
+
 def get_relations(subscription_id: UUIDstr) -> dict[str, list[SubscriptionRelationSchema]]:
     subscription_table = db.session.get(
         SubscriptionTable,
@@ -535,13 +671,48 @@ def subscription_workflows(subscription: SubscriptionTable) -> dict[str, Any]:
         ... }
 
     """
+    data = status_relations(subscription) if subscription.insync else None
+    return _subscription_workflows(subscription, data)
+
+
+def subscriptions_workflows(subscription_ids: Sequence[UUID]) -> dict[UUID, dict[str, Any]]:
+    """Return the workflows a user can start for many subscriptions at once.
+
+    Batched variant of `subscription_workflows`: the subscriptions, their product workflows and the status relations
+    are fetched with a fixed number of queries, independent of the number of subscriptions.
+
+    Args:
+        subscription_ids: the subscriptions to get the workflows for
+
+    Returns:
+        A dict mapping each existing subscription_id to the structure returned by `subscription_workflows`.
+
+    """
+    if not subscription_ids:
+        return {}
+
+    stmt = (
+        select(SubscriptionTable)
+        .options(selectinload(SubscriptionTable.product).selectinload(ProductTable.workflows))
+        .where(SubscriptionTable.subscription_id.in_(set(subscription_ids)))
+    )
+    subscriptions = db.session.scalars(stmt).all()
+    relations = status_relations_for_subscriptions([s.subscription_id for s in subscriptions if s.insync])
+    return {
+        subscription.subscription_id: _subscription_workflows(subscription, relations.get(subscription.subscription_id))
+        for subscription in subscriptions
+    }
+
+
+def _subscription_workflows(
+    subscription: SubscriptionTable, data: dict[str, list[SubscriptionRelationSchema]] | None
+) -> dict[str, Any]:
     default_json: dict[str, Any] = {}
+    unterminated_in_use_by_subscriptions = data["unterminated_in_use_by_subscriptions"] if data else []
 
     if not subscription.insync:
         default_json["reason"] = "subscription.not_in_sync"
-    else:
-        data = status_relations(subscription)
-
+    elif data:
         if data["locked_relations"]:
             default_json["reason"] = "subscription.relations_not_in_sync"
             default_json["locked_relations"] = [r.subscription_id for r in data["locked_relations"]]
@@ -582,14 +753,12 @@ def subscription_workflows(subscription: SubscriptionTable) -> dict[str, Any]:
                 blocked_by_depends_on_subscriptions = WF_BLOCKED_BY_PARENTS.get(
                     workflow.name, workflow.target == Target.TERMINATE
                 )
-            if blocked_by_depends_on_subscriptions and data["unterminated_in_use_by_subscriptions"]:
+            if blocked_by_depends_on_subscriptions and unterminated_in_use_by_subscriptions:
                 workflow_json["reason"] = "subscription.no_modify_subscription_in_use_by_others"
                 workflow_json["unterminated_in_use_by_subscriptions"] = [
-                    r.subscription_id for r in data["unterminated_in_use_by_subscriptions"]
-                ]
-                workflow_json["unterminated_in_use_by_subscriptions_detail"] = data[
-                    "unterminated_in_use_by_subscriptions"
+                    r.subscription_id for r in unterminated_in_use_by_subscriptions
                 ]
+                workflow_json["unterminated_in_use_by_subscriptions_detail"] = unterminated_in_use_by_subscriptions
                 workflow_json["action"] = "terminated" if workflow.target == Target.TERMINATE else "modified"
 
         workflows[workflow.target.lower()].append(workflow_json)
@@ -598,8 +767,13 @@ def subscription_workflows(subscription: SubscriptionTable) -> dict[str, Any]:
 
 
 def _generate_etag(model: dict) -> str:
-    encoded = pickle.dumps(model)
-    return md5(encoded).hexdigest()  # noqa: S303, S324
+    """Return a stable hash of a (extended) domain model dict.
+
+    The dict is encoded to canonical JSON (sorted keys) with orjson and hashed with BLAKE2b, which is a lot cheaper
+    than pickling the nested dict with its UUIDs, datetimes and IP addresses.
+    """
+    encoded = orjson.dumps(model, default=to_serializable, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return blake2b(encoded, digest_size=16).hexdigest()
 
 
 def convert_to_in_use_by_relation(obj: Any) -> dict[str, str]:
@@ -674,30 +848,40 @@ def format_special_types(subscription: dict) -> dict:
 
 
 def format_extended_domain_model(subscription: dict, filter_owner_relations: bool) -> dict:
-    """Format the subscription dict depending on filter settings.
+    """Format the subscription dict depending on filter settings, and format special types to string.
+
+    The dict is modified in-place with a single traversal. Product blocks that have `in_use_by_ids` are collected on
+    the way and filtered afterwards, when all instance ids of the subscription are known.
 
     Args:
         subscription: result from build_extended_domain_model() or cache
         filter_owner_relations: True to filter instance ids from the current subscription
     """
+    instance_ids_to_filter = {subscription["subscription_id"]}
+    blocks_in_use: list[dict] = []
 
-    def filter_instance_ids_on_subscription() -> None:
-        paths = product_block_paths(subscription)
-        instance_ids_to_filter = {getattr_in(subscription, f"{path}.subscription_instance_id") for path in paths}
-        instance_ids_to_filter.add(subscription["subscription_id"])
+    def format_block(block: dict) -> dict:
+        for key, value in block.items():
+            block[key] = format_value(value)
+        instance_ids_to_filter.add(block.get("subscription_instance_id"))
+        if block.get("in_use_by_ids"):
+            blocks_in_use.append(block)
+        return block
 
-        def filter_instance_ids_on_productblock(path_to_block: str) -> None:
-            if not (block_instance_ids := getattr_in(subscription, f"{path_to_block}.in_use_by_ids")):
-                return
-            filtered_instance_ids = set(block_instance_ids) - instance_ids_to_filter
-            update_in(subscription, f"{path_to_block}.in_use_by_ids", list(filtered_instance_ids))
+    def format_value(v: Any) -> Any:
+        if isinstance(v, dict):
+            return format_block(v)
+        if isinstance(v, list):
+            return [format_value(item) for item in v]
+        if is_ipaddress_type(v):
+            return str(v)
+        return v
 
-        # find all product blocks, filter instance_ids if needed
-        for path in paths:
-            filter_instance_ids_on_productblock(path)
+    format_block(subscription)
 
     if filter_owner_relations:
-        filter_instance_ids_on_subscription()
+        for block in blocks_in_use:
+            block["in_use_by_ids"] = list(set(block["in_use_by_ids"]) - instance_ids_to_filter)
 
     return subscription
 
@@ -47,6 +47,13 @@ def get_celery_task(task_name: str) -> Any:
     raise AssertionError("Celery has not been initialised yet")
 
 
+def get_celery_producer() -> Any:
+    """Return a context manager that holds a producer, to publish many tasks over a single broker connection."""
+    if _celery:
+        return _celery.producer_or_acquire()
+    raise AssertionError("Celery has not been initialised yet")
+
+
 def register_custom_serializer() -> None:
     # orchestrator specific serializer to correctly handle more complex classes
     registry.register("orchestrator-json", json_dumps, json_loads, "application/json", "utf-8")
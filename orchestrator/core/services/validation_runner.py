@@ -0,0 +1,193 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run the steps of subscription validation workflows in bulk, without creating a process per subscription.
+
+Only subscriptions that fail validation get a validate process, so the failure is recorded and can be inspected and
+retried like before. The outcome of every validation is stored in the subscription_validation_results table.
+"""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import NamedTuple, cast
+from uuid import UUID
+
+import structlog
+from more_itertools import chunked
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import joinedload
+
+from orchestrator.core.db import (
+    ProductTable,
+    SubscriptionTable,
+    SubscriptionValidationResultTable,
+    db,
+    transactional,
+)
+from orchestrator.core.domain import SubscriptionModel
+from orchestrator.core.domain.context_cache import cache_subscription_models
+from orchestrator.core.services.workflows import SubscriptionValidations, usable_validation_workflows
+from orchestrator.core.settings import app_settings
+from orchestrator.core.targets import Target
+from orchestrator.core.utils.json import json_dumps, json_loads
+from orchestrator.core.workflow import Process, StepList, Success, Workflow
+from orchestrator.core.workflows import get_workflow
+from orchestrator.core.workflows.steps import resync, unsync_unchecked
+from pydantic_forms.types import State
+
+logger = structlog.get_logger(__name__)
+
+
+class ValidationResult(NamedTuple):
+    """The outcome of running one validation workflow for one subscription.
+
+    `passed` is None when the workflow can not be run in bulk, it has to be started as a process.
+    """
+
+    subscription_id: UUID
+    workflow_name: str
+    passed: bool | None
+
+
+def get_validation_steps(workflow: Workflow) -> StepList | None:
+    """Return the steps of a validate workflow without the steps that lock, unlock and link the subscription.
+
+    Returns None for workflows that are not created with `validate_workflow`, these can only be run as a process.
+    """
+    steps = list(workflow.steps)
+    if unsync_unchecked not in steps or resync not in steps:
+        return None
+
+    start = steps.index(unsync_unchecked) + 1
+    end = len(steps) - 1 - steps[::-1].index(resync)
+    return StepList(steps[start:end])
+
+
+def _serialize(state: State) -> State:
+    # Like the workflow engine, steps receive the state as it would be stored in the database
+    return cast(State, json_loads(json_dumps(state)))
+
+
+def _run_steps(steps: StepList, state: State) -> bool:
+    process: Process = Success(state)
+    for step in steps:
+        if not (process.issuccess() or process.isskipped()):
+            break
+        process = process.map(_serialize)
+        try:
+            with transactional(db, logger):
+                process = process.execute_step(step)
+        except Exception:
+            logger.exception("Validation step raised an exception", step_name=step.name)
+            return False
+
+    return process.issuccess() or process.isskipped()
+
+
+def _validate_subscription(subscription: SubscriptionTable, workflow_name: str) -> bool | None:
+    workflow = get_workflow(workflow_name)
+    if workflow is None or (steps := get_validation_steps(workflow)) is None:
+        logger.info("Validation workflow can not be run in bulk", workflow_name=workflow_name)
+        return None
+
+    try:
+        model = SubscriptionModel.from_subscription(subscription.subscription_id)
+    except Exception:
+        logger.exception("Could not load subscription", subscription_id=str(subscription.subscription_id))
+        return False
+
+    # The state after `unsync_unchecked`, which stores the subscription model in the state
+    state = {
+        "workflow_name": workflow_name,
+        "workflow_target": Target.VALIDATE,
+        "subscription_id": str(subscription.subscription_id),
+        "product": str(subscription.product_id),
+        "customer_id": subscription.customer_id,
+        "version": subscription.version,
+        "subscription": model,
+    }
+    return _run_steps(steps, state)
+
+
+def _validate_batch(batch: list[SubscriptionValidations]) -> list[ValidationResult]:
+    """Validate a batch of subscriptions in a database scope of its own.
+
+    The subscription rows of the batch are loaded with a single query, `SubscriptionModel.from_subscription` then
+    finds them in the session. Like in a process, every step runs in a transaction of its own.
+    """
+    results = []
+    with db.database_scope(), cache_subscription_models():
+        stmt = (
+            select(SubscriptionTable)
+            .where(SubscriptionTable.subscription_id.in_([info.subscription_id for info in batch]))
+            .options(joinedload(SubscriptionTable.product).selectinload(ProductTable.fixed_inputs))
+        )
+        subscriptions = {subscription.subscription_id: subscription for subscription in db.session.scalars(stmt)}
+
+        for info in batch:
+            if not (subscription := subscriptions.get(info.subscription_id)):
+                # Removed since the validations were collected
+                continue
+            for workflow_name in usable_validation_workflows(info):
+                passed = _validate_subscription(subscription, workflow_name)
+                results.append(ValidationResult(info.subscription_id, workflow_name, passed))
+
+    return results
+
+
+def run_subscription_validations(
+    validations: list[SubscriptionValidations],
+    concurrency: int | None = None,
+    batch_size: int | None = None,
+) -> Iterator[ValidationResult]:
+    """Run the validation workflows of the given subscriptions in a thread pool.
+
+    Args:
+        validations: The subscriptions and their validation workflows, see `get_subscription_validations`.
+        concurrency: Maximum number of threads, defaults to `app_settings.VALIDATION_RUNNER_CONCURRENCY`.
+        batch_size: Number of subscriptions per database scope, defaults to
+            `app_settings.VALIDATION_RUNNER_BATCH_SIZE`.
+
+    Returns:
+        The result of every validation workflow that was run, batch by batch as they complete.
+    """
+    concurrency = concurrency or app_settings.VALIDATION_RUNNER_CONCURRENCY
+    batch_size = batch_size or app_settings.VALIDATION_RUNNER_BATCH_SIZE
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="validation-runner") as executor:
+        for results in executor.map(_validate_batch, chunked(validations, batch_size)):
+            yield from results
+
+
+def store_validation_results(results: Iterable[ValidationResult], validated_at: datetime) -> None:
+    """Store the outcome of the validations that were run, replacing the previous outcome of the same workflow."""
+    rows = [
+        {
+            "subscription_id": result.subscription_id,
+            "workflow_name": result.workflow_name,
+            "passed": result.passed,
+            "validated_at": validated_at,
+        }
+        for result in results
+        if result.passed is not None
+    ]
+    if not rows:
+        return
+
+    stmt = insert(SubscriptionValidationResultTable)
+    stmt = stmt.on_conflict_do_update(
+        constraint="pk_subscription_validation_results",
+        set_={"passed": stmt.excluded.passed, "validated_at": stmt.excluded.validated_at},
+    )
+    db.session.execute(stmt, rows)
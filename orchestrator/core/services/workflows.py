@@ -11,12 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import Iterator, NamedTuple
 from uuid import UUID
 
 import structlog
-from sqlalchemy import Select, select
+from sqlalchemy import Connection, Select, event, select
+from sqlalchemy.orm import Mapper, Session, object_session
 
 from orchestrator.core.db import (
     SubscriptionTable,
@@ -26,8 +29,11 @@ from orchestrator.core.db import (
 from orchestrator.core.schemas import StepSchema, WorkflowSchema
 from orchestrator.core.services.executors.types import ExecutorFunction
 from orchestrator.core.services.subscriptions import TARGET_DEFAULT_USABLE_MAP, WF_USABLE_MAP
+from orchestrator.core.settings import app_settings
 from orchestrator.core.targets import Target
+from orchestrator.core.workflow import ProcessStat
 from orchestrator.core.workflows import get_workflow
+from pydantic_forms.types import State
 
 logger = structlog.get_logger(__name__)
 
@@ -69,6 +75,62 @@ def get_workflow_by_name(workflow_name: str) -> WorkflowTable | None:
     return db.session.scalar(select(WorkflowTable).where(WorkflowTable.name == workflow_name))
 
 
+class WorkflowRegistryEntry(NamedTuple):
+    """The columns of a workflow row that are needed to create a process for it."""
+
+    workflow_id: UUID
+    name: str
+    target: Target
+    is_task: bool
+
+
+# Workflow name to the expiry time and entry
+_workflow_registry: dict[str, tuple[float, WorkflowRegistryEntry]] = {}
+_WORKFLOW_REGISTRY_CHANGED = "workflow_registry_changed"
+
+
+def get_workflow_registry_entry(workflow_name: str) -> WorkflowRegistryEntry | None:
+    """Return the registry entry of a workflow by name, only querying the database on a cache miss.
+
+    Workflows that do not exist are not cached, so workflows that are added later are picked up on the next call. The
+    cache is cleared when a transaction that inserted, updated or deleted a workflow through the ORM is committed or
+    rolled back; use `clear_workflow_registry_cache` after changing workflows with plain SQL in the same process.
+    Changes made by other processes are picked up once the entry is older than `WORKFLOW_REGISTRY_CACHE_TTL`.
+    """
+    now = time.monotonic()
+    if (cached := _workflow_registry.get(workflow_name)) and cached[0] > now:
+        return cached[1]
+
+    if not (workflow := get_workflow_by_name(workflow_name)):
+        return None
+
+    entry = WorkflowRegistryEntry(
+        workflow_id=workflow.workflow_id, name=workflow.name, target=workflow.target, is_task=workflow.is_task
+    )
+    _workflow_registry[workflow_name] = (now + app_settings.WORKFLOW_REGISTRY_CACHE_TTL, entry)
+    return entry
+
+
+def clear_workflow_registry_cache() -> None:
+    _workflow_registry.clear()
+
+
+@event.listens_for(WorkflowTable, "after_insert")
+@event.listens_for(WorkflowTable, "after_update")
+@event.listens_for(WorkflowTable, "after_delete")
+def _mark_workflow_registry_changed(_mapper: Mapper, _connection: Connection, workflow: WorkflowTable) -> None:
+    # Clearing the cache now would let other threads cache the old row again before this transaction commits
+    if session := object_session(workflow):
+        session.info[_WORKFLOW_REGISTRY_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _invalidate_workflow_registry(session: Session, *_: object) -> None:
+    if session.info.pop(_WORKFLOW_REGISTRY_CHANGED, False):
+        clear_workflow_registry_cache()
+
+
 def get_workflow_by_workflow_id(workflow_id: str) -> WorkflowTable | None:
     return db.session.scalar(select(WorkflowTable).where(WorkflowTable.workflow_id == workflow_id))
 
@@ -108,6 +170,19 @@ def get_subscription_validations(subscriptions: list[SubscriptionTable]) -> list
     return list(generate())
 
 
+def usable_validation_workflows(info: SubscriptionValidations, product_type_filter: str | None = None) -> list[str]:
+    """Return the validation workflows of a subscription that can be run in its current lifecycle status."""
+    if product_type_filter is not None and info.product_type != product_type_filter:
+        return []
+
+    def is_usable(workflow_name: str) -> bool:
+        system_usable_when = WF_USABLE_MAP.get(workflow_name, TARGET_DEFAULT_USABLE_MAP[Target.SYSTEM])
+        validate_usable_when = WF_USABLE_MAP.get(workflow_name, TARGET_DEFAULT_USABLE_MAP[Target.VALIDATE])
+        return info.subscription_status in system_usable_when + validate_usable_when
+
+    return [workflow_name for workflow_name in info.workflows if is_usable(workflow_name)]
+
+
 def start_subscription_validations(
     info: SubscriptionValidations,
     product_type_filter: str | None = None,
@@ -118,37 +193,109 @@ def start_subscription_validations(
     """
     result = []
 
-    for workflow_name in info.workflows:
-        target_system = TARGET_DEFAULT_USABLE_MAP[Target.SYSTEM]
-        system_usable_when = WF_USABLE_MAP.get(workflow_name, target_system)
-        target_validate = TARGET_DEFAULT_USABLE_MAP[Target.VALIDATE]
-        validate_usable_when = WF_USABLE_MAP.get(workflow_name, target_validate)
+    for workflow_name in usable_validation_workflows(info, product_type_filter):
+        json = [{"subscription_id": str(info.subscription_id)}]
 
-        usable_when = system_usable_when + validate_usable_when
-        if info.subscription_status in usable_when and (
-                product_type_filter is None or info.product_type == product_type_filter
-        ):
-            json = [{"subscription_id": str(info.subscription_id)}]
+        # against circular import
+        from orchestrator.core.services.processes import get_execution_context
 
-            # against circular import
-            from orchestrator.core.services.processes import get_execution_context
+        validate_func = get_execution_context()[ExecutorFunction.VALIDATE]
 
-            validate_func = get_execution_context()[ExecutorFunction.VALIDATE]
+        # Allow the executor function to create the process
+        db.session.enable_commit()
+        try:
+            validate_func(workflow_name, json=json)
+        finally:
+            # Disable committing again
+            db.session.disable_commit()
 
-            # Allow the executor function to create the process
-            db.session.enable_commit()
+        result.append(
+            {
+                "workflow_name": workflow_name,
+                "subscription_id": (info.subscription_id),
+                "product_type": (info.product_type),
+            }
+        )
+
+    return result
+
+
+def _validation_inputs(info: SubscriptionValidations) -> list[State]:
+    return [{"subscription_id": str(info.subscription_id)}]
+
+
+def _create_validation_processes_one_by_one(
+    workflow_name: str, infos: list[SubscriptionValidations]
+) -> tuple[list[ProcessStat], list[SubscriptionValidations]]:
+    """Create a validation process for every subscription separately, skipping the ones that cannot be created.
+
+    Returns:
+        The created processes and the subscriptions they validate
+    """
+    # against circular import
+    from orchestrator.core.services.processes import create_process
+
+    pstats = []
+    created = []
+    for info in infos:
+        try:
+            pstats.append(create_process(workflow_name, user_inputs=_validation_inputs(info)))
+        except Exception:
+            logger.exception(
+                "Could not create validation process", workflow_name=workflow_name, subscription_id=info.subscription_id
+            )
+            continue
+        created.append(info)
+    return pstats, created
+
+
+def start_subscription_validations_in_bulk(validations: Iterable[SubscriptionValidations]) -> list:
+    """Start the validation workflows of many subscriptions.
+
+    The processes are grouped per workflow, every group is created in a single transaction and handed to the executor
+    at once, see `start_processes`. When the form or run predicate fails for one of the subscriptions, the processes
+    of that workflow are created one by one instead, so the other subscriptions are still validated.
+
+    Note: this function is designed to be used from within a workflow step function.
+    """
+    # against circular import
+    from orchestrator.core.services.processes import create_processes, get_execution_context
+
+    start_many_func = get_execution_context()[ExecutorFunction.START_MANY]
+
+    infos_per_workflow: dict[str, list[SubscriptionValidations]] = defaultdict(list)
+    for info in validations:
+        for workflow_name in usable_validation_workflows(info):
+            infos_per_workflow[workflow_name].append(info)
+
+    result: list[dict] = []
+
+    # Allow the executor function to create the processes
+    db.session.enable_commit()
+    try:
+        for workflow_name, infos in infos_per_workflow.items():
             try:
-                validate_func(workflow_name, json=json)
-            finally:
-                # Disable committing again
-                db.session.disable_commit()
+                pstats = create_processes(workflow_name, [_validation_inputs(info) for info in infos])
+            except Exception:
+                logger.warning(
+                    "Could not create all validation processes at once, creating them one by one",
+                    workflow_name=workflow_name,
+                    exc_info=True,
+                )
+                pstats, infos = _create_validation_processes_one_by_one(workflow_name, infos)
 
-            result.append(
+            if pstats:
+                start_many_func(pstats)
+            result.extend(
                 {
                     "workflow_name": workflow_name,
-                    "subscription_id": (info.subscription_id),
-                    "product_type": (info.product_type),
+                    "subscription_id": info.subscription_id,
+                    "product_type": info.product_type,
                 }
+                for info in infos
             )
+    finally:
+        # Disable committing again
+        db.session.disable_commit()
 
     return result
@@ -55,6 +55,11 @@ class LifecycleValidationMode(strEnum):
     IGNORED = "ignored"
 
 
+class SubscriptionSaveStrategy(strEnum):
+    ORM = "orm"
+    BULK = "bulk"
+
+
 class AppSettings(BaseSettings):
     TESTING: bool = True
     SESSION_SECRET: SecretStr = "".join(secrets.choice(string.ascii_letters) for i in range(16))  # type: ignore
@@ -101,6 +106,27 @@ class AppSettings(BaseSettings):
     TRANSLATIONS_DIR: Path | None = None
     WEBSOCKET_BROADCASTER_URL: SecretStr = "memory://"  # type: ignore
     ENABLE_WEBSOCKETS: bool = True
+    WEBSOCKET_CLIENT_QUEUE_SIZE: int = Field(
+        100,
+        ge=1,
+        description=(
+            "Number of messages that are buffered for a websocket client with the redis broadcaster. Clients that "
+            "fall further behind are disconnected."
+        ),
+    )
+    WEBSOCKET_BROADCAST_MAX_PENDING: int = Field(
+        10000,
+        ge=1,
+        description="Number of broadcasts of synchronous callers that can wait to be sent, further ones are dropped.",
+    )
+    PROCESS_BROADCAST_COALESCE_WINDOW: float = Field(
+        1.0,
+        ge=0,
+        description=(
+            "Seconds in which the updates of a running process are combined into a single websocket broadcast, "
+            "0 broadcasts every update."
+        ),
+    )
     DISABLE_INSYNC_CHECK: bool = False
     DEFAULT_PRODUCT_WORKFLOWS: list[str] = ["modify_note"]
     SKIP_MODEL_FOR_MIGRATION_DB_DIFF: list[str] = []
@@ -111,16 +137,123 @@ class AppSettings(BaseSettings):
     DEFAULT_CUSTOMER_FULLNAME: str = "Default::Orchestrator-Core Customer"
     DEFAULT_CUSTOMER_SHORTCODE: str = "default-cust"
     DEFAULT_CUSTOMER_IDENTIFIER: str = "59289a57-70fb-4ff5-9c93-10fe67b12434"
+    SCHEDULER_MAX_WORKERS: int = Field(5, ge=1, description="Number of threads that run the scheduled tasks.")
+    SCHEDULER_COALESCE: bool = Field(
+        True, description="Run a scheduled task once when several of its runs were missed, instead of once per run."
+    )
+    SCHEDULER_MISFIRE_GRACE_TIME: int | None = Field(
+        300,
+        ge=1,
+        description=(
+            "Seconds that a scheduled task can still run after its scheduled time, for example after a scheduler "
+            "instance took over from one that stopped. None runs missed tasks however late they are."
+        ),
+    )
+    SCHEDULER_LEADER_CHECK_INTERVAL: float = Field(
+        5,
+        gt=0,
+        description=(
+            "Seconds between attempts of a standby scheduler instance to become the leader, and between checks of "
+            "the leader that it still holds the leader lock."
+        ),
+    )
     TASK_LOG_RETENTION_DAYS: int = 3
     ENABLE_GRAPHQL_DEPRECATION_CHECKER: bool = True
     ENABLE_GRAPHQL_PROFILING_EXTENSION: bool = False
     ENABLE_GRAPHQL_STATS_EXTENSION: bool = False
+    ENABLE_GRAPHQL_RESOLVER_STATS_EXTENSION: bool = Field(
+        False, description="Attribute database queries, time and dataloader batches to the resolved GraphQL fields."
+    )
+    GRAPHQL_RESOLVER_STATS_SAMPLE_RATE: float = Field(
+        1.0, ge=0, le=1, description="Fraction of GraphQL operations that the resolver stats extension profiles."
+    )
+    ENABLE_GRAPHQL_PARTIAL_SUBSCRIPTION_LOADING: bool = Field(
+        False,
+        description=(
+            "Only load and validate the product blocks that a GraphQL query selects when it asks for subscription "
+            "details. Leave disabled when domain models have validators or computed fields that depend on other "
+            "product blocks."
+        ),
+    )
     ENABLE_PROMETHEUS_METRICS_ENDPOINT: bool = False
+    METRICS_CACHE_TTL: int = Field(
+        0,
+        ge=0,
+        description=(
+            "Seconds that the process and subscription metrics are cached, so scrapes of several Prometheus replicas "
+            "share one database query. 0 queries the database on every scrape."
+        ),
+    )
+    METRICS_MAX_LABEL_SETS: int = Field(
+        1000,
+        ge=1,
+        description=(
+            "Number of label value combinations per workflow engine histogram, further combinations are recorded "
+            "with the label values 'other'."
+        ),
+    )
+    WORKFLOW_REGISTRY_CACHE_TTL: int = Field(
+        60,
+        ge=0,
+        description=(
+            "Seconds that a process looks up the workflow of a new process from its cache, before it reads it from the "
+            "database again. Changes committed by the same process are picked up right away."
+        ),
+    )
     VALIDATE_OUT_OF_SYNC_SUBSCRIPTIONS: bool = False
+    VALIDATION_RUNNER_ENABLED: bool = Field(
+        False,
+        description=(
+            "Let task_validate_subscriptions run the validation steps itself instead of starting a validate "
+            "process per subscription. A process is only started for subscriptions that fail validation."
+        ),
+    )
+    VALIDATION_RUNNER_CONCURRENCY: int = Field(4, ge=1, description="Number of threads used by the validation runner.")
+    VALIDATION_RUNNER_BATCH_SIZE: int = Field(
+        50, ge=1, description="Number of subscriptions a validation runner thread loads and validates together."
+    )
+    RESUME_CONCURRENCY: int = Field(
+        4, ge=1, description="Number of threads that hand processes to the executor when resuming them in bulk."
+    )
+    RESUME_BATCH_SIZE: int = Field(
+        100, ge=1, description="Number of processes a resume thread loads from the database with one query."
+    )
+    RESUME_RATE_LIMIT: float = Field(
+        0,
+        ge=0,
+        description=(
+            "Maximum number of processes handed to the executor per second when resuming them in bulk, "
+            "e.g. after unlocking the engine. 0 means unlimited."
+        ),
+    )
+    RESPONSE_CACHE_ENABLED: bool = Field(
+        False,
+        description=(
+            "Cache subscription, product and workflow list queries and process status counts on the server. Entries "
+            "are evicted by the invalidateCache websocket events."
+        ),
+    )
+    RESPONSE_CACHE_TTL: int = Field(60, ge=1, description="Seconds that a response cache entry can be used.")
+    RESPONSE_CACHE_MAXSIZE: int = Field(1000, ge=1, description="Number of entries in the in-process response cache.")
+    RESPONSE_CACHE_REDIS: bool = Field(
+        False,
+        description=(
+            "Share the response cache between processes through CACHE_URI. Required when processes run on celery "
+            "workers or when there are multiple API instances."
+        ),
+    )
     FILTER_BY_MODE: Literal["partial", "exact"] = "exact"
     EXPOSE_SETTINGS: bool = False
     EXPOSE_OAUTH_SETTINGS: bool = False
     LIFECYCLE_VALIDATION_MODE: LifecycleValidationMode = LifecycleValidationMode.LOOSE
+    SUBSCRIPTION_SAVE_STRATEGY: SubscriptionSaveStrategy = Field(
+        SubscriptionSaveStrategy.ORM,
+        description=(
+            "Default strategy used by SubscriptionModel.save(). 'orm' saves the product block tree through the ORM "
+            "unit of work, 'bulk' diffs the whole tree against one read of the stored instances and applies the "
+            "changes with a few set-based statements."
+        ),
+    )
     MCP_ENABLED: bool = False
     CELERY_TARGET_QUEUES: dict[Target, str] = Field(
         default_factory=dict,
@@ -133,6 +266,17 @@ class AppSettings(BaseSettings):
         ),
     )
 
+    CELERY_TARGET_PRIORITIES: dict[Target, int] = Field(
+        default_factory=dict,
+        description=(
+            "Optional mapping of workflow Target to a Celery message priority (0-9), used for both new starts and "
+            "resumes. Use it to keep user initiated workflows from waiting behind bulk started validations, e.g. "
+            '\'{"CREATE": 0, "MODIFY": 0, "VALIDATE": 9}\'. How the priority is applied depends on the broker: '
+            "Redis consumes lower numbers first, RabbitMQ higher numbers, and only on queues with x-max-priority. "
+            "Targets not listed are published without a priority. Only used when EXECUTOR is 'celery'."
+        ),
+    )
+
     @field_validator("CELERY_TARGET_QUEUES")
     @classmethod
     def validate_celery_target_queues(cls, value: dict[Target, str]) -> dict[Target, str]:
@@ -140,6 +284,13 @@ class AppSettings(BaseSettings):
             raise ValueError("CELERY_TARGET_QUEUES queue names must be non-empty")
         return value
 
+    @field_validator("CELERY_TARGET_PRIORITIES")
+    @classmethod
+    def validate_celery_target_priorities(cls, value: dict[Target, int]) -> dict[Target, int]:
+        if any(not 0 <= priority <= 9 for priority in value.values()):
+            raise ValueError("CELERY_TARGET_PRIORITIES priorities must be between 0 and 9")
+        return value
+
 
 app_settings = AppSettings()
 
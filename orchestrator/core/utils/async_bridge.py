@@ -0,0 +1,148 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run coroutines for synchronous callers on one event loop in a background thread.
+
+Workflow steps and other synchronous code used to broadcast with `anyio.run()`, which creates and closes an event loop
+for every message and blocks the caller until it is sent. An `AsyncBridge` keeps a single event loop running in a
+daemon thread. Callers submit a coroutine function without waiting for it.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CoroutineFunction = Callable[..., Coroutine[Any, Any, Any]]
+
+
+class AsyncBridge:
+    """Fire-and-forget execution of coroutines on an event loop in a background thread.
+
+    Submissions are queued, and the loop is woken once to start all submissions that queued up since it last ran. At
+    most `concurrency` coroutines run at the same time. When `max_pending` submissions are waiting, new ones are dropped
+    so a stalled loop can't make the process run out of memory.
+
+    The loop is started on the first submission, also in a forked process, so the bridge can be created at import time
+    and used by API and worker processes alike.
+    """
+
+    def __init__(self, name: str, max_pending: int, concurrency: int):
+        self.name = name
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self._reset()
+        # The loop thread doesn't exist in a forked child, it starts its own on the first submission
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._pending: deque[tuple[CoroutineFunction, tuple[Any, ...]]] = deque()
+        self._lock = threading.Lock()
+        self._draining = False
+        self._drain_task: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def submit(self, fn: CoroutineFunction, *args: Any) -> bool:
+        """Schedule `fn(*args)` on the event loop of the bridge.
+
+        Returns:
+            False when the submission is dropped because too many submissions are pending.
+        """
+        with self._lock:
+            loop = self._ensure_started()
+            if len(self._pending) >= self.max_pending:
+                logger.warning("Drop submission to full async bridge", bridge=self.name, fn=fn.__qualname__)
+                return False
+
+            self._pending.append((fn, args))
+            if self._draining:
+                return True
+            self._draining = True
+
+        # Run the submissions in an empty context, they must not share the database session of the caller
+        loop.call_soon_threadsafe(self._start_drain, context=contextvars.Context())
+        return True
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop and self._thread and self._thread.is_alive():
+            return self._loop
+
+        # A previous loop may have been stopped before it ran all pending submissions, the new loop drains them
+        self._draining = False
+        self._drain_task = None
+        self._running = set()
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._thread = threading.Thread(target=self._loop.run_forever, name=self.name, daemon=True)
+        self._thread.start()
+        return self._loop
+
+    def _start_drain(self) -> None:
+        self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    def _next(self) -> tuple[CoroutineFunction, tuple[Any, ...]] | None:
+        with self._lock:
+            if self._pending:
+                return self._pending.popleft()
+            self._draining = False
+            return None
+
+    async def _drain(self) -> None:
+        while True:
+            # Submissions stay pending until they can run, so `max_pending` bounds everything that waits
+            await self._semaphore.acquire()
+            if (submission := self._next()) is None:
+                self._semaphore.release()
+                return
+
+            task = asyncio.create_task(self._run(*submission))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, fn: CoroutineFunction, args: tuple[Any, ...]) -> None:
+        try:
+            await fn(*args)
+        except Exception:
+            logger.exception("Exception in async bridge", bridge=self.name, fn=fn.__qualname__)
+        finally:
+            self._semaphore.release()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Run the pending submissions and stop the event loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if not loop or not thread or not thread.is_alive():
+            return
+
+        async def wait_for_pending() -> None:
+            if self._drain_task:
+                await self._drain_task
+            await asyncio.gather(*self._running)
+
+        try:
+            asyncio.run_coroutine_threadsafe(wait_for_pending(), loop).result(timeout)
+        except TimeoutError:
+            logger.warning("Async bridge did not finish pending submissions", bridge=self.name)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
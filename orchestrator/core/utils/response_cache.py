@@ -0,0 +1,203 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Server-side cache of expensive read responses, evicted by the `invalidateCache` events of the websocket.
+
+Entries are stored per cache tag; a tag is the `type` of an invalidation event like `subscriptions` or
+`processStatusCounts`. Every tag has a generation that is incremented by each invalidation event of its type, and an
+entry is stored under the generations of its tags at the time its value was computed. An event therefore makes all
+entries of its tag unreachable at once, they age out of the cache by LRU and TTL.
+
+The in-process tier is an LRU cache per process. The optional Redis tier (`RESPONSE_CACHE_REDIS`) shares the entries
+and the tag generations between processes, which is required when invalidation events are emitted by other
+processes, like celery workers or other API instances.
+
+Invalidation events are only emitted when websockets are enabled (`ENABLE_WEBSOCKETS`).
+
+The Redis client is blocking, async code uses the `_async` variants which run the Redis calls in a thread.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable
+from hashlib import sha256
+from typing import Any, ParamSpec, TypeVar
+
+import orjson
+import structlog
+from redis import Redis
+
+from orchestrator.core.settings import AppSettings
+from orchestrator.core.utils.redis_client import create_redis_client
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+REDIS_KEY_PREFIX = "orchestrator:response-cache"
+
+
+class ResponseCache:
+    """In-process LRU cache of JSON serializable responses with an optional Redis tier.
+
+    Args:
+        maxsize: Maximum number of entries in the in-process tier.
+        ttl: Time to live of an entry in seconds.
+        redis: Client of the Redis tier, or None to only cache in-process.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, redis: Redis | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.redis = redis
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generations: defaultdict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _tag_generations(self, tags: list[str]) -> list[int]:
+        if self.redis is None:
+            return [self._generations[tag] for tag in tags]
+        generations = self.redis.mget([f"{REDIS_KEY_PREFIX}:generation:{tag}" for tag in tags])
+        return [int(generation or 0) for generation in generations]
+
+    def versioned_key(self, tags: Iterable[str], key: str) -> str:
+        """Return the key under which the response for `key` is stored with the current generation of `tags`.
+
+        Get the versioned key before computing a response, so that a response computed during an invalidation event
+        is stored under the old generation.
+        """
+        sorted_tags = sorted(set(tags))
+        generations = self._tag_generations(sorted_tags)
+        return ":".join([key, *(f"{tag}.{generation}" for tag, generation in zip(sorted_tags, generations))])
+
+    def get(self, versioned_key: str) -> Any | None:
+        with self._lock:
+            if entry := self._entries.get(versioned_key):
+                expires, value = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(versioned_key)
+                    return value
+                del self._entries[versioned_key]
+
+        if self.redis is None or (cached := self.redis.get(f"{REDIS_KEY_PREFIX}:{versioned_key}")) is None:
+            return None
+
+        value = orjson.loads(cached)
+        self._set_local(versioned_key, value)
+        return value
+
+    def set(self, versioned_key: str, value: Any) -> None:
+        self._set_local(versioned_key, value)
+        if self.redis is not None:
+            self.redis.set(
+                f"{REDIS_KEY_PREFIX}:{versioned_key}", orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS), ex=self.ttl
+            )
+
+    def _set_local(self, versioned_key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[versioned_key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(versioned_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tag: str) -> None:
+        """Make all entries of the given tag unreachable."""
+        with self._lock:
+            self._generations[tag] += 1
+        if self.redis is not None:
+            self.redis.incr(f"{REDIS_KEY_PREFIX}:generation:{tag}")
+
+    async def _to_thread(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        if self.redis is None:
+            return fn(*args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def versioned_key_async(self, tags: Iterable[str], key: str) -> str:
+        return await self._to_thread(self.versioned_key, tags, key)
+
+    async def get_async(self, versioned_key: str) -> Any | None:
+        return await self._to_thread(self.get, versioned_key)
+
+    async def set_async(self, versioned_key: str, value: Any) -> None:
+        await self._to_thread(self.set, versioned_key, value)
+
+    async def invalidate_async(self, tag: str) -> None:
+        await self._to_thread(self.invalidate, tag)
+
+    def cached(self, tags: Iterable[str], key: str, fn: Callable[[], T]) -> T:
+        """Return the cached response for `key`, or compute it with `fn` and cache it."""
+        versioned_key = self.versioned_key(tags, key)
+        if (value := self.get(versioned_key)) is not None:
+            return value
+        value = fn()
+        self.set(versioned_key, value)
+        return value
+
+
+def cache_key(*parts: Any) -> str:
+    """Return a fixed length cache key for the JSON serializable parts."""
+    return sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+_response_cache: ResponseCache | None = None
+
+
+# The global ResponseCache is set after calling this function
+def init_response_cache(settings: AppSettings) -> ResponseCache | None:
+    global _response_cache
+    if not settings.RESPONSE_CACHE_ENABLED:
+        _response_cache = None
+        return None
+
+    if not settings.ENABLE_WEBSOCKETS:
+        logger.warning("The response cache is only evicted by websocket events, entries will live until their TTL")
+
+    redis = create_redis_client(settings.CACHE_URI.get_secret_value()) if settings.RESPONSE_CACHE_REDIS else None
+    _response_cache = ResponseCache(settings.RESPONSE_CACHE_MAXSIZE, settings.RESPONSE_CACHE_TTL, redis)
+    return _response_cache
+
+
+def get_response_cache() -> ResponseCache | None:
+    return _response_cache
+
+
+def cached_response(tags: Iterable[str], key: str, fn: Callable[[], T]) -> T:
+    """Return the response of `fn`, from the response cache when it is enabled.
+
+    This blocks on the Redis tier, call it from sync endpoints which FastAPI runs in its thread pool.
+    """
+    if _response_cache is None:
+        return fn()
+    return _response_cache.cached(tags, key, fn)
+
+
+def invalidate_response_cache(cache_object: dict[str, str]) -> None:
+    """Evict the responses of an `invalidateCache` event from the response cache."""
+    if _response_cache is None:
+        return
+    try:
+        _response_cache.invalidate(cache_object["type"])
+    except Exception:
+        logger.exception("Could not invalidate the response cache", cache_object=cache_object)
+
+
+async def invalidate_response_cache_async(cache_object: dict[str, str]) -> None:
+    """Evict the responses of an `invalidateCache` event from the response cache without blocking the event loop."""
+    if _response_cache is None:
+        return
+    try:
+        await _response_cache.invalidate_async(cache_object["type"])
+    except Exception:
+        logger.exception("Could not invalidate the response cache", cache_object=cache_object)
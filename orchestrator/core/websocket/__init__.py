@@ -15,13 +15,15 @@ from typing import Any, cast
 from urllib.parse import urlparse
 from uuid import UUID
 
-import anyio
 from sqlalchemy.orm import selectinload
 from structlog import get_logger
 
 from nwastdlib.asyncio import gather_nice
 from orchestrator.core.db import ProcessTable, db
 from orchestrator.core.settings import AppSettings, app_settings
+from orchestrator.core.utils.async_bridge import AsyncBridge
+from orchestrator.core.utils.response_cache import invalidate_response_cache_async
+from orchestrator.core.websocket.coalescer import ProcessUpdateCoalescer
 from orchestrator.core.websocket.websocket_manager import WebSocketManager
 from orchestrator.core.workflow import ProcessStatus
 from pydantic_forms.types import UUIDstr
@@ -31,6 +33,11 @@ logger = get_logger(__name__)
 
 broadcaster_type = urlparse(app_settings.WEBSOCKET_BROADCASTER_URL.get_secret_value()).scheme
 
+# Sends the broadcasts of synchronous callers, such as workflow steps, without blocking them
+broadcast_bridge = AsyncBridge(
+    "websocket-broadcast", max_pending=app_settings.WEBSOCKET_BROADCAST_MAX_PENDING, concurrency=50
+)
+
 
 class WS_CHANNELS:
     ALL_PROCESSES = "processes"
@@ -104,15 +111,16 @@ async def _broadcast_event(name: str, value: Any) -> None:
 
 
 def sync_broadcast_invalidate_cache(cache_object: dict[str, str]) -> None:
-    anyio.run(broadcast_invalidate_cache, cache_object)
+    broadcast_bridge.submit(broadcast_invalidate_cache, cache_object)
 
 
 async def broadcast_invalidate_cache(cache_object: dict[str, str]) -> None:
+    await invalidate_response_cache_async(cache_object)
     await _broadcast_event("invalidateCache", cache_object)
 
 
 def sync_invalidate_subscription_cache(subscription_id: UUID | UUIDstr, invalidate_all: bool = True) -> None:
-    anyio.run(invalidate_subscription_cache, subscription_id, invalidate_all)
+    broadcast_bridge.submit(invalidate_subscription_cache, subscription_id, invalidate_all)
 
 
 async def invalidate_subscription_cache(subscription_id: UUID | UUIDstr, invalidate_all: bool = True) -> None:
@@ -151,37 +159,91 @@ def broadcast_invalidate_status_counts() -> None:
 def broadcast_process_update_to_websocket(
     process_id: UUID,
 ) -> None:
-    """Broadcast data of the current process to connected websocket clients."""
+    """Broadcast data of the current process to connected websocket clients.
+
+    The status of the process is read with the session of the caller, call this from the thread that updates the
+    process so a status that is not committed yet is taken into account.
+    """
     if not websocket_manager.enabled:
         logger.debug(
             "WebSocketManager is not enabled. Skip broadcasting through websocket.", process_id=str(process_id)
         )
         return
 
-    anyio.run(broadcast_process_update_to_websocket_async, process_id)
+    sync_broadcast_process_update(process_id, get_terminated_process_subscription_ids(process_id))
 
 
-async def broadcast_process_update_to_websocket_async(
-    process_id: UUID,
-) -> None:
+def sync_broadcast_process_update(process_id: UUID, subscription_ids: set[UUID] | None) -> None:
+    """Broadcast an update of a process of which the caller already read the status.
+
+    Args:
+        process_id: The process that was updated.
+        subscription_ids: The subscriptions of the process when it is no longer running, None when it is still running.
+    """
     if not websocket_manager.enabled:
         logger.debug(
             "WebSocketManager is not enabled. Skip broadcasting through websocket.", process_id=str(process_id)
         )
         return
 
+    broadcast_bridge.submit(_coalesced_process_update, process_id, subscription_ids)
+
+
+def get_terminated_process_subscription_ids(process_id: UUID) -> set[UUID] | None:
+    """Return the subscriptions of a process that is no longer running, or None when it is still running."""
+    process = db.session.get(ProcessTable, process_id, options=[selectinload(ProcessTable.process_subscriptions)])
+    if process is None or process.last_status not in _TERMINAL_PROCESS_STATUSES:
+        return None
+    return {ps.subscription_id for ps in process.process_subscriptions}
+
+
+def _get_committed_terminated_process_subscription_ids(process_id: UUID) -> set[UUID] | None:
+    # Use a session of its own, the session of the caller may be in use by another thread
+    with db.database_scope():
+        return get_terminated_process_subscription_ids(process_id)
+
+
+async def _broadcast_process_update(process_id: UUID, subscription_ids: set[UUID] | None = None) -> None:
     await broadcast_invalidate_cache({"type": "processes", "id": "LIST"})
     await broadcast_invalidate_cache({"type": "processes", "id": str(process_id)})
 
-    process = await asyncio.to_thread(db.session.get, ProcessTable, process_id, options=[selectinload(ProcessTable.process_subscriptions)])
+    tasks = [invalidate_subscription_cache_by_id(subscription_id) for subscription_id in subscription_ids or ()]
+    await gather_nice(tasks, limit=10)
 
-    subscription_ids = set()
 
-    if process is not None and process.last_status in _TERMINAL_PROCESS_STATUSES:
-        subscription_ids = {ps.subscription_id for ps in process.process_subscriptions}
+async def _broadcast_trailing_process_update(process_id: UUID) -> None:
+    # The process may have finished since its update was deferred
+    subscription_ids = await asyncio.to_thread(_get_committed_terminated_process_subscription_ids, process_id)
+    if subscription_ids is not None:
+        process_update_coalescer.finish(process_id)
+    await _broadcast_process_update(process_id, subscription_ids)
 
-    tasks = [invalidate_subscription_cache_by_id(subscription_id) for subscription_id in subscription_ids]
-    await gather_nice(tasks, limit=10)
+
+process_update_coalescer = ProcessUpdateCoalescer(_broadcast_trailing_process_update)
+
+
+async def _coalesced_process_update(process_id: UUID, subscription_ids: set[UUID] | None) -> None:
+    if subscription_ids is not None:
+        process_update_coalescer.finish(process_id)
+    elif (window := app_settings.PROCESS_BROADCAST_COALESCE_WINDOW) and process_update_coalescer.defer(
+        process_id, window
+    ):
+        return
+
+    await _broadcast_process_update(process_id, subscription_ids)
+
+
+async def broadcast_process_update_to_websocket_async(
+    process_id: UUID,
+) -> None:
+    if not websocket_manager.enabled:
+        logger.debug(
+            "WebSocketManager is not enabled. Skip broadcasting through websocket.", process_id=str(process_id)
+        )
+        return
+
+    subscription_ids = await asyncio.to_thread(_get_committed_terminated_process_subscription_ids, process_id)
+    await _broadcast_process_update(process_id, subscription_ids)
 
 
 __all__ = [
@@ -0,0 +1,81 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Coalesce the broadcasts of process updates of fast running workflows."""
+
+import asyncio
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any
+from uuid import UUID
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SendFunc = Callable[[UUID], Coroutine[Any, Any, None]]
+
+
+class ProcessUpdateCoalescer:
+    """Broadcast at most one update per process per window.
+
+    The first update of a process is sent right away. Updates that follow within the window are combined into one update
+    at the end of the window, the clients fetch the latest state of the process when they receive it. The final update
+    of a process is not deferred, call `finish` and send it right away. The coalescer must be used from a single event
+    loop.
+    """
+
+    def __init__(self, send: SendFunc):
+        self.send = send
+        self._reset()
+        # Timers of the parent process don't run in a forked child
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._last_sent: dict[UUID, float] = {}
+        self._trailing: dict[UUID, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def defer(self, process_id: UUID, window: float) -> bool:
+        """Register an update of the process, returns True when it is sent at the end of the window instead of now."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if process_id in self._trailing:
+            return True
+
+        last_sent = self._last_sent.get(process_id)
+        if last_sent is None or now - last_sent >= window:
+            self._last_sent = {pid: sent for pid, sent in self._last_sent.items() if now - sent < window}
+            self._last_sent[process_id] = now
+            return False
+
+        self._trailing[process_id] = loop.call_later(last_sent + window - now, self._send_trailing, process_id)
+        return True
+
+    def finish(self, process_id: UUID) -> None:
+        """Forget the process, its final update is sent right away."""
+        if trailing := self._trailing.pop(process_id, None):
+            trailing.cancel()
+        self._last_sent.pop(process_id, None)
+
+    def _send_trailing(self, process_id: UUID) -> None:
+        del self._trailing[process_id]
+        self._last_sent[process_id] = asyncio.get_running_loop().time()
+        task = asyncio.create_task(self._send(process_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, process_id: UUID) -> None:
+        try:
+            await self.send(process_id)
+        except Exception:
+            logger.exception("Failed to broadcast process update", process_id=str(process_id))
@@ -10,6 +10,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 from fastapi import WebSocket, status
@@ -17,11 +20,15 @@ from starlette.concurrency import run_until_first_complete
 from starlette.websockets import WebSocketDisconnect
 from structlog.stdlib import BoundLogger, get_logger
 
+from orchestrator.core.settings import app_settings
 from orchestrator.core.utils.json import json_dumps
 from orchestrator.core.utils.redis import RedisBroadcast
 
 logger = get_logger(__name__)
 
+# Queued for a client that is dropped
+_DROPPED = None
+
 
 def _make_logger(websocket: WebSocket, channel: str) -> BoundLogger:
     return logger.bind(
@@ -29,16 +36,104 @@ def _make_logger(websocket: WebSocket, channel: str) -> BoundLogger:
     )
 
 
+def _parse_message(raw_message: Any) -> str | None:
+    match raw_message:
+        case {"type": "message", "data": bytes() as data}:
+            return data.decode()
+        case None:
+            return None
+        case _:
+            logger.info("Drop unrecognized message", raw=raw_message)
+            return None
+
+
+def _drop(queue: asyncio.Queue[str | None]) -> None:
+    if queue.full():
+        # Make room for the signal, a client that is this far behind will refetch its data after reconnecting
+        while not queue.empty():
+            queue.get_nowait()
+    queue.put_nowait(_DROPPED)
+
+
+class WebsocketHub:
+    """Fan out the messages of a redis channel to the websocket clients of this process.
+
+    There is one redis subscription per channel, which is opened for the first client and closed after the last one
+    leaves. Every client has a queue of `queue_size` messages. A client that doesn't keep up is dropped when its queue
+    is full, so it can't hold up the other clients or make the process buffer an unbounded number of messages.
+    """
+
+    def __init__(self, broadcast: RedisBroadcast, queue_size: int):
+        self.broadcast = broadcast
+        self.queue_size = queue_size
+        self.queues: dict[str, set[asyncio.Queue[str | None]]] = {}
+        self.readers: dict[str, asyncio.Task] = {}
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncGenerator[asyncio.Queue[str | None], None]:
+        """Register a client queue for the channel, it receives None when the client is dropped."""
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=self.queue_size)
+        self.queues.setdefault(channel, set()).add(queue)
+        if channel not in self.readers:
+            self.readers[channel] = asyncio.create_task(self._read(channel), name=f"websocket-hub-{channel}")
+        try:
+            yield queue
+        finally:
+            queues = self.queues.get(channel, set())
+            queues.discard(queue)
+            if not queues:
+                self.queues.pop(channel, None)
+                if reader := self.readers.pop(channel, None):
+                    reader.cancel()
+
+    async def _read(self, channel: str) -> None:
+        try:
+            async with self.broadcast.subscriber(channel) as subscriber:
+                logger.debug("Websocket hub subscribed to channel", channel=channel)
+                async for raw in subscriber.listen():
+                    if (message := _parse_message(raw)) is not None:
+                        self._publish(channel, message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Exception in websocket hub reader", channel=channel)
+
+        # Drop the clients so they reconnect, the channel is resubscribed for the first new client
+        self.readers.pop(channel, None)
+        for queue in self.queues.pop(channel, set()):
+            _drop(queue)
+
+    def _publish(self, channel: str, message: str) -> None:
+        for queue in list(self.queues.get(channel, ())):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Drop slow websocket client", channel=channel, queue_size=self.queue_size)
+                self.queues[channel].discard(queue)
+                _drop(queue)
+
+    async def close(self) -> None:
+        readers = list(self.readers.values())
+        self.readers.clear()
+        for reader in readers:
+            reader.cancel()
+        for reader in readers:
+            with suppress(asyncio.CancelledError):
+                await reader
+
+
 class BroadcastWebsocketManager:
     def __init__(self, broadcast_url: str):
         self.connected: list[WebSocket] = []
         self.broadcast_url = broadcast_url
         self.broadcast = RedisBroadcast(broadcast_url)
+        self.hub = WebsocketHub(self.broadcast, app_settings.WEBSOCKET_CLIENT_QUEUE_SIZE)
 
     async def connect_redis(self) -> None:
         await self.broadcast.connect()
 
     async def disconnect_redis(self) -> None:
+        await self.hub.close()
         await self.broadcast.disconnect()
 
     async def connect(self, websocket: WebSocket, channel: str) -> None:
@@ -86,29 +181,17 @@ class BroadcastWebsocketManager:
                 break
 
     async def sender(self, websocket: WebSocket, channel: str) -> None:
-        """Read messages from redis channel and send to websocket client."""
+        """Send the messages of the channel to the websocket client until it is dropped by the hub."""
         log = _make_logger(websocket, channel)
 
-        def parse_message(raw_message: Any) -> str | None:
-            match raw_message:
-                case {"type": "message", "data": bytes() as data}:
-                    return data.decode()
-                case None:
-                    return None
-                case _:
-                    log.info("Drop unrecognized message", raw=raw_message)
-                    return None
-
         try:
-            async with self.broadcast.subscriber(channel) as subscriber:
+            async with self.hub.subscribe(channel) as queue:
                 log.debug("Websocket client subscribed to channel")
-                while True:
-                    raw = await subscriber.get_message(timeout=1)
-                    if (message := parse_message(raw)) is None:
-                        continue
-
+                while (message := await queue.get()) is not _DROPPED:
                     log.debug("Send websocket message", message=message)
                     await websocket.send_text(message)
+
+            await websocket.close(status.WS_1013_TRY_AGAIN_LATER)
         except Exception:
             log.exception("Exception in sender loop")
 
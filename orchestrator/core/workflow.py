@@ -1566,6 +1566,9 @@ def capture_workflow_failure(err: Any) -> None:
 
 def _exec_steps(steps: StepList, starting_process: Process, dblogstep: StepLogFuncInternal) -> Process:
     """Execute the workflow steps one by one until a Process state other than Success or Skipped is reached."""
+    # Imported here, the metrics package imports this module
+    from orchestrator.core.metrics.workflows import STEP_DURATION, STEP_LOG_WRITE_DURATION, observe_duration
+
     consolelogger = cond_bind(logger, starting_process.unwrap(), "reporter", "created_by")
     process = starting_process
     for step in steps:
@@ -1577,6 +1580,7 @@ def _exec_steps(steps: StepList, starting_process: Process, dblogstep: StepLogFu
 
         # Debug logging of step information
         mutationlogger = log_mutations(process.unwrap())
+        workflow_name = str(process.unwrap().get("workflow_name", ""))
 
         # Execute step
         try:
@@ -1590,7 +1594,8 @@ def _exec_steps(steps: StepList, starting_process: Process, dblogstep: StepLogFu
                     return process
 
             process = process.map(lambda s: s | {"__last_step_started_at": nowtz().timestamp()})
-            step_result_process = process.execute_step(step)
+            with observe_duration(STEP_DURATION, workflow_name, step.name):
+                step_result_process = process.execute_step(step)
         except Exception as e:
             consolelogger.error("An exception occurred while executing the workflow step.", exc_info=e)
             step_result_process = Failed(e)
@@ -1604,7 +1609,7 @@ def _exec_steps(steps: StepList, starting_process: Process, dblogstep: StepLogFu
         # Capture the original exception that caused the workflow to fail
         step_result_process.on_failed(capture_workflow_failure)
 
-        with transactional(db, logger):
+        with observe_duration(STEP_LOG_WRITE_DURATION, workflow_name), transactional(db, logger):
             process = dblogstep(step, result_to_log)
         # If database logging failed, the workflow should fail. When it was successful just continue with the
         # result of the executed step.
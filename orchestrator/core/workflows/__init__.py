@@ -59,10 +59,12 @@ class LazyWorkflowInstance:
 
     package: str
     function: str
+    _workflow: Workflow | None
 
     def __init__(self, package: str, name: str) -> None:
         self.package = package
         self.function = name
+        self._workflow = None
         ALL_WORKFLOWS[name] = self
 
     def instantiate(self) -> Workflow:
@@ -71,10 +73,20 @@ class LazyWorkflowInstance:
         This can be as simple as merely importing a workflow function. However, if it concerns a workflow generating
         function, that function will be called with or without arguments as specified.
 
+        The workflow is only imported on the first call, subsequent calls return the same instance.
+
         Returns:
             A workflow function.
 
         """
+        if self._workflow is None:
+            self._workflow = self._import_workflow()
+
+        # Set workflow name here to make them complete
+        self._workflow.name = self.function
+        return self._workflow
+
+    def _import_workflow(self) -> Workflow:
         try:
             if self.package.startswith("."):
                 # relative import, hence `package` should be set
@@ -85,11 +97,7 @@ class LazyWorkflowInstance:
             module_name = f"{DEFAULT_PKG}{self.package}" if self.package.startswith(".") else self.package
             raise ValueError(f"Invalid workflow: module {module_name} does not exist or has invalid imports")
 
-        wf = getattr(mod, self.function)
-
-        # Set workflow name here to make them complete
-        wf.name = self.function
-        return wf
+        return getattr(mod, self.function)
 
     def __str__(self) -> str:
         return f"{self.package}.{self.function}"
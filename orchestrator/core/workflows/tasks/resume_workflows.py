@@ -17,6 +17,7 @@ from sqlalchemy import select
 
 from orchestrator.core.db import ProcessTable, db
 from orchestrator.core.services import processes
+from orchestrator.core.services.process_resumer import resume_processes_concurrently
 from orchestrator.core.settings import get_authorizers
 from orchestrator.core.targets import Target
 from orchestrator.core.workflow import ProcessStatus, StepList, done, init, step, workflow
@@ -60,53 +61,21 @@ def resume_found_workflows(
 ) -> State:
     resume_processes = waiting_process_ids + resumed_state_process_ids
 
-    resumed_process_ids: list = []
-    for process_id in resume_processes:
-        try:
-            process = db.session.get(ProcessTable, process_id)
-            if not process:
-                continue
-
-            # Enable commit to be able to start/resume the process as normal
-            db.session.enable_commit()
-
-            processes.resume_process(process)
-            resumed_process_ids.append(process_id)
-        except Exception as exc:
-            logger.warning("Could not resume process", process_id=process_id, error=str(exc))
-        finally:
-            # Make sure to disable commit again
-            db.session.disable_commit()
+    resumed_process_ids = resume_processes_concurrently(resume_processes, processes.resume_process)
 
     return {
         "number_of_resumed_process_ids": len(resumed_process_ids),
-        "resumed_process_ids": resumed_process_ids,
+        "resumed_process_ids": [str(process_id) for process_id in resumed_process_ids],
     }
 
 
 @step("Restart found CREATED workflows")
 def restart_created_workflows(created_state_process_ids: list[UUIDstr]) -> State:
-    started_process_ids = []
-    for process_id in created_state_process_ids:
-        try:
-            process = db.session.get(ProcessTable, process_id)
-            if not process:
-                continue
-
-            # Enable commit to be able to restart the process as normal
-            db.session.enable_commit()
-
-            processes.restart_process(process)
-            started_process_ids.append(process_id)
-        except Exception as exc:
-            logger.warning("Could not resume process", process_id=process_id, error=str(exc))
-        finally:
-            # Make sure to disable commit again
-            db.session.disable_commit()
+    started_process_ids = resume_processes_concurrently(created_state_process_ids, processes.restart_process)
 
     return {
         "number_of_started_process_ids": len(started_process_ids),
-        "started_process_ids": started_process_ids,
+        "started_process_ids": [str(process_id) for process_id in started_process_ids],
     }
 
 
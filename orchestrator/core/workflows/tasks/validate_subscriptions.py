@@ -12,7 +12,9 @@
 # limitations under the License.
 
 
+from collections import defaultdict
 from threading import BoundedSemaphore
+from uuid import UUID
 
 import structlog
 
@@ -20,14 +22,18 @@ from orchestrator.core.services.subscriptions import (
     get_subscriptions_on_product_table,
     get_subscriptions_on_product_table_in_sync,
 )
+from orchestrator.core.services.validation_runner import run_subscription_validations, store_validation_results
 from orchestrator.core.services.workflows import (
+    SubscriptionValidations,
     get_subscription_validations,
-    start_subscription_validations,
+    start_subscription_validations_in_bulk,
 )
 from orchestrator.core.settings import app_settings, get_authorizers
 from orchestrator.core.targets import Target
+from orchestrator.core.utils.datetime import nowtz
 from orchestrator.core.workflow import StepList, done, init, step, workflow
 from orchestrator.core.workflows.predicates import no_uncompleted_instance
+from pydantic_forms.types import State
 
 logger = structlog.get_logger(__name__)
 
@@ -37,8 +43,42 @@ task_semaphore = BoundedSemaphore(value=2)
 authorizers = get_authorizers()
 
 
+def _run_validations(validations: list[SubscriptionValidations]) -> State:
+    """Validate the subscriptions in bulk and only start validate processes for the failed validations.
+
+    Workflows that can not be run in bulk are started as a process as well, they are not counted as failed.
+    """
+    validated_at = nowtz()
+    results = list(run_subscription_validations(validations))
+    store_validation_results(results, validated_at)
+
+    to_start: dict[UUID, list[str]] = defaultdict(list)
+    for result in results:
+        if not result.passed:
+            to_start[result.subscription_id].append(result.workflow_name)
+
+    failed_validations = [
+        info._replace(workflows=workflow_names)
+        for info in validations
+        if (workflow_names := to_start.get(info.subscription_id))
+    ]
+    logger.info("Starting failed subscription validation workflows", count=len(failed_validations))
+    start_subscription_validations_in_bulk(failed_validations)
+
+    failed = [result for result in results if result.passed is False]
+    return {
+        "validation_summary": {
+            "validated_at": validated_at,
+            "passed": sum(1 for result in results if result.passed),
+            "failed": len(failed),
+            "started_as_process": sum(1 for result in results if result.passed is None),
+            "failed_subscriptions": list(dict.fromkeys(str(result.subscription_id) for result in failed)),
+        }
+    }
+
+
 @step("Validate subscriptions")
-def validate_subscriptions() -> None:
+def validate_subscriptions() -> State | None:
     if app_settings.VALIDATE_OUT_OF_SYNC_SUBSCRIPTIONS:
         # Automatically re-validate out-of-sync subscriptions. This is not recommended for production.
         subscriptions = get_subscriptions_on_product_table()
@@ -49,9 +89,12 @@ def validate_subscriptions() -> None:
     validations = list(get_subscription_validations(subscriptions))
 
     # Not possible to use SubscriptionTable objects past this point, as the original DB session will be closed
-    for info in validations:
-        logger.info("Starting subscription validation workflows", info=info)
-        start_subscription_validations(info=info)
+    if app_settings.VALIDATION_RUNNER_ENABLED:
+        return _run_validations(validations)
+
+    logger.info("Starting subscription validation workflows", count=len(validations))
+    start_subscription_validations_in_bulk(validations)
+    return None
 
 
 @workflow(
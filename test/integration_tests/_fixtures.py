@@ -49,6 +49,7 @@ from typing import Any, cast
 from unittest.mock import patch
 from uuid import uuid4
 
+import anyio
 import pytest
 import redis
 import requests
@@ -91,12 +92,13 @@ from orchestrator.core.services.tasks import (
     initialise_celery,
     register_custom_serializer,
 )
-from orchestrator.core.services.workflows import get_workflow_by_name
+from orchestrator.core.services.workflows import clear_workflow_registry_cache, get_workflow_by_name
 from orchestrator.core.settings import AppSettings, SecretPostgresDsn, app_settings
 from orchestrator.core.targets import Target
 from orchestrator.core.types import SubscriptionLifecycle
 from orchestrator.core.utils.json import json_dumps
 from orchestrator.core.utils.redis_client import create_redis_client
+from orchestrator.core.websocket import broadcast_bridge
 from orchestrator.core.workflow import ProcessStatus
 from test.integration_tests.fixtures.processes import (  # noqa: F401
     mocked_processes,
@@ -369,6 +371,20 @@ def responses(request):
         yield responses_mock
 
 
+@pytest.fixture(autouse=True)
+def inline_broadcast_bridge():
+    """Send the broadcasts of sync callers before they return.
+
+    The broadcasts of processes query the database, and the test database connection can't be shared between threads.
+    """
+    with (
+        patch.object(broadcast_bridge, "submit", side_effect=lambda fn, *args: anyio.run(fn, *args)),
+        # The timers of coalesced broadcasts would not outlive the event loop of anyio.run
+        patch.object(app_settings, "PROCESS_BROADCAST_COALESCE_WINDOW", 0),
+    ):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def db_session(database):
     """Ensure tests are run in a transaction with automatic rollback.
@@ -400,6 +416,8 @@ def db_session(database):
                 logger.exception("Closing wrapped db connections failed, test teardown may fail")
             if not trans._deactivated_from_connection:
                 trans.rollback()
+            # Workflows created in the test are gone after the rollback
+            clear_workflow_registry_cache()
 
 
 @contextmanager
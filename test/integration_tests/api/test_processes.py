@@ -43,6 +43,7 @@ from orchestrator.core.services.tasks import RESUME_WORKFLOW
 from orchestrator.core.settings import app_settings
 from orchestrator.core.targets import Target
 from orchestrator.core.utils.auth import AuthContext
+from orchestrator.core.utils.response_cache import ResponseCache, invalidate_response_cache
 from orchestrator.core.workflow import (
     CALLBACK_TOKEN_KEY,
     ProcessStatus,
@@ -1245,6 +1246,23 @@ def test_status_counts_with_processes(test_client, mocked_processes):
     )
 
 
+def test_status_counts_evicted_by_process_events(test_client):
+    counts = [
+        {"process_counts": {"running": 1}, "task_counts": {}},
+        {"process_counts": {"completed": 1}, "task_counts": {}},
+    ]
+    with (
+        mock.patch("orchestrator.core.utils.response_cache._response_cache", ResponseCache(maxsize=10, ttl=60)),
+        mock.patch("orchestrator.core.api.api_v1.endpoints.processes.get_process_status_counts", side_effect=counts),
+    ):
+        assert test_client.get("/api/processes/status-counts").json() == counts[0]
+        assert test_client.get("/api/processes/status-counts").json() == counts[0]
+
+        # Completing a process only sends `processes` events
+        invalidate_response_cache({"type": "processes", "id": "LIST"})
+        assert test_client.get("/api/processes/status-counts").json() == counts[1]
+
+
 # ---------------------------------------------------------------------------
 # check_global_lock – direct function call raises HTTPException on lock
 # ---------------------------------------------------------------------------
@@ -0,0 +1,145 @@
+# Copyright 2019-2026 ESnet, GÉANT, SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from orchestrator.core.cli.benchmark.domain_models import run_domain_model_benchmark
+from orchestrator.core.cli.benchmark.hierarchy import HierarchySpec, build_subscription, create_product
+from orchestrator.core.db import SubscriptionInstanceTable, db
+from orchestrator.core.domain import SUBSCRIPTION_MODEL_REGISTRY, SubscriptionModel
+from orchestrator.core.domain.base import ProductBlockModel
+from orchestrator.core.services.subscriptions import build_extended_domain_model
+from orchestrator.core.settings import SubscriptionSaveStrategy
+from orchestrator.core.types import SubscriptionLifecycle
+
+SPECS = [
+    HierarchySpec(depth=4, fan_out=1, list_size=1),
+    HierarchySpec(depth=2, fan_out=4, list_size=10),
+    HierarchySpec(depth=3, fan_out=2, list_size=3, shared=2),
+]
+
+
+@pytest.fixture(autouse=True)
+def registries():
+    # Don't leak the generated models to other tests, the domain model migration would try to create them
+    with patch.dict(ProductBlockModel.registry), patch.dict(SUBSCRIPTION_MODEL_REGISTRY):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def query_counters():
+    # The benchmark monitors the queries, don't leak its counters on the shared test connection to other tests
+    info = db.session.connection().info
+    keys = {"queries_started", "queries_completed", "query_start_time", "query_time_spent"}
+    before = {key: info[key] for key in keys if key in info}
+    yield
+    for key in keys:
+        info.pop(key, None)
+    info.update(before)
+
+
+def test_build_subscription():
+    spec = HierarchySpec(depth=3, fan_out=2, list_size=3, shared=2)
+    product = create_product(spec)
+    shared_with = build_subscription(product, str(uuid4()))
+    shared_with.save()
+    subscription = build_subscription(product, str(uuid4()), shared_with=shared_with)
+    subscription.save()
+    db.session.flush()
+
+    instance_count = db.session.scalar(
+        select(func.count())
+        .select_from(SubscriptionInstanceTable)
+        .filter(SubscriptionInstanceTable.subscription_id == subscription.subscription_id)
+    )
+    assert instance_count == spec.block_count
+
+    db.session.expunge_all()
+    loaded = SubscriptionModel.from_subscription(subscription.subscription_id)
+    assert len(loaded.block.child_0.child_1.leaves) == spec.list_size
+    assert loaded.block.shared_leaves == shared_with.block.leaves[: spec.shared]
+
+    active = SubscriptionModel.from_other_lifecycle(loaded, SubscriptionLifecycle.ACTIVE)
+    assert active.status == SubscriptionLifecycle.ACTIVE
+
+    shared_leaf = build_extended_domain_model(SubscriptionModel.from_subscription(shared_with.subscription_id))[
+        "block"
+    ]["leaves"][0]
+    # Used by the root block of its own subscription and the root block of the other subscription
+    assert set(shared_leaf["in_use_by_ids"]) == {
+        shared_with.block.subscription_instance_id,
+        loaded.block.subscription_instance_id,
+    }
+
+
+def test_create_product_is_idempotent():
+    spec = HierarchySpec(depth=2, fan_out=1, list_size=1)
+    assert create_product(spec).product_id == create_product(spec).product_id
+
+
+@pytest.mark.parametrize("strategy", list(SubscriptionSaveStrategy))
+def test_run_domain_model_benchmark(strategy):
+    spec = HierarchySpec(depth=2, fan_out=2, list_size=2, shared=1)
+
+    results = run_domain_model_benchmark(spec, subscriptions=3, strategy=strategy)
+
+    assert [result.operation for result in results] == [
+        "save",
+        "from_subscription",
+        "from_other_lifecycle",
+        "get_subscription_dict",
+    ]
+    for result in results:
+        assert len(result.durations) == 3
+        assert result.peak_memory > 0
+    assert all(queries > 0 for queries in results[0].queries)
+    assert all(queries > 0 for queries in results[1].queries)
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=lambda spec: spec.name)
+def test_from_subscription_performance(benchmark, spec):
+    product = create_product(spec)
+    shared_with = build_subscription(product, str(uuid4())) if spec.shared else None
+    if shared_with:
+        shared_with.save()
+    subscription = build_subscription(product, str(uuid4()), shared_with=shared_with)
+    subscription.save()
+    db.session.flush()
+
+    def setup():
+        db.session.expunge_all()
+        return (subscription.subscription_id,), {}
+
+    loaded = benchmark.pedantic(SubscriptionModel.from_subscription, setup=setup)
+    assert loaded.subscription_id == subscription.subscription_id
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=lambda spec: spec.name)
+def test_save_performance(benchmark, spec):
+    product = create_product(spec)
+    shared_with = build_subscription(product, str(uuid4())) if spec.shared else None
+    if shared_with:
+        shared_with.save()
+
+    def setup():
+        return (build_subscription(product, str(uuid4()), shared_with=shared_with),), {}
+
+    def save(subscription):
+        subscription.save()
+        db.session.flush()
+
+    benchmark.pedantic(save, setup=setup)
@@ -0,0 +1,76 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from sqlalchemy import not_, select, text
+
+from orchestrator.core.db import SubscriptionTable, db
+from orchestrator.core.db.filters.subscription import SUBSCRIPTION_TABLE_COLUMN_CLAUSES
+
+
+def _explain(stmt) -> str:
+    compiled = stmt.compile(dialect=db.session.bind.dialect, compile_kwargs={"literal_binds": True})
+    return "\n".join(db.session.execute(text(f"EXPLAIN {compiled}")).scalars())
+
+
+@pytest.mark.parametrize(
+    "field,index_name",
+    [
+        ("description", "ix_subscriptions_description_trgm"),
+        ("note", "ix_subscriptions_note_trgm"),
+    ],
+)
+def test_substring_filter_uses_trigram_index(field, index_name):
+    stmt = select(SubscriptionTable.subscription_id).where(SUBSCRIPTION_TABLE_COLUMN_CLAUSES[field](("Word", "abcd")))
+
+    # The test tables are too small for the planner to prefer an index. Columns that are also in a b-tree index get a
+    # full scan of that index instead, these are left out.
+    db.session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    assert f"Bitmap Index Scan on {index_name}" in _explain(stmt)
+
+
+def test_trigram_indexes_match_filter_expressions():
+    indexes = dict(
+        db.session.execute(
+            text(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'subscriptions' AND indexname LIKE '%_trgm'"
+            )
+        ).all()
+    )
+
+    assert "((subscription_id)::character varying) gin_trgm_ops" in indexes["ix_subscriptions_subscription_id_trgm"]
+    assert "customer_id gin_trgm_ops" in indexes["ix_subscriptions_customer_id_trgm"]
+
+
+def test_no_trigram_indexes_on_columns_updated_by_every_step():
+    indexes = db.session.scalars(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = 'processes' AND indexname LIKE '%_trgm'")
+    ).all()
+
+    assert sorted(indexes) == [
+        "ix_processes_assignee_trgm",
+        "ix_processes_created_by_trgm",
+        "ix_processes_note_trgm",
+        "ix_processes_pid_trgm",
+    ]
+
+
+def test_negated_filter_on_nullable_column(product_type_1_subscription_factory):
+    subscription_id = product_type_1_subscription_factory()
+    note_filter = SUBSCRIPTION_TABLE_COLUMN_CLAUSES["note"](("Word", "abcd"))
+
+    stmt = select(SubscriptionTable.subscription_id).where(SubscriptionTable.subscription_id == subscription_id)
+
+    assert db.session.scalars(stmt.where(note_filter)).all() == []
+    assert [str(s) for s in db.session.scalars(stmt.where(not_(note_filter)))] == [subscription_id]
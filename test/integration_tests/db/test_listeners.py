@@ -15,7 +15,7 @@ from dirty_equals import IsFloat
 from sqlalchemy import text
 
 from orchestrator.core.db import db
-from orchestrator.core.db.listeners import disable_listeners, monitor_sqlalchemy_queries
+from orchestrator.core.db.listeners import add_query_observer, disable_listeners, monitor_sqlalchemy_queries
 
 
 def test_monitor_sqlalchemy_queries():
@@ -33,3 +33,22 @@ def test_monitor_sqlalchemy_queries():
         }
     finally:
         disable_listeners()
+
+
+def test_monitor_sqlalchemy_queries_twice_counts_queries_once():
+    durations = []
+
+    # Like two app instances that both enable the resolver stats
+    for _ in range(2):
+        monitor_sqlalchemy_queries()
+        add_query_observer(durations.append)
+
+    try:
+        info = db.session.connection().info
+        completed = info.get("queries_completed", 0)
+        db.session.execute(text("select 1"))
+
+        assert info["queries_completed"] == completed + 1
+        assert durations == [IsFloat]
+    finally:
+        disable_listeners()
@@ -1312,3 +1312,28 @@ def test_subscription_save_bool_list_with_false_values(
 
     subscription = ProductTypeOneForTest.from_subscription(product_one_subscription_1)
     assert subscription.block.list_field == [False, False, True, True]
+
+
+def test_from_subscription_partial(test_product_type_one, product_one_subscription_1):
+    _, _, ProductTypeOneForTest = test_product_type_one
+
+    subscription = SubscriptionModel.from_subscription(
+        product_one_subscription_1, include=["description", "block.intField", "block.subBlock2.strField"]
+    )
+
+    assert isinstance(subscription, ProductTypeOneForTest)
+    assert subscription.description == "product one sub description"
+    assert subscription.block.int_field == 1
+    assert subscription.block.sub_block_2.str_field == "test"
+    assert subscription.block.sub_block is None
+    assert subscription.block.sub_block_list == []
+
+    with pytest.raises(ValueError, match="partially loaded"):
+        subscription.save()
+
+
+def test_from_subscription_partial_excludes_root_block(test_product_type_one, product_one_subscription_1):
+    subscription = SubscriptionModel.from_subscription(product_one_subscription_1, include=["description"])
+
+    assert subscription.block is None
+    assert SubscriptionModel.from_subscription(product_one_subscription_1).block.int_field == 1
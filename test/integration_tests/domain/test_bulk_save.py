@@ -0,0 +1,175 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from orchestrator.core.db import (
+    SubscriptionInstanceRelationTable,
+    SubscriptionInstanceTable,
+    SubscriptionInstanceValueTable,
+    db,
+)
+from orchestrator.core.db.listeners import disable_listeners, monitor_sqlalchemy_queries
+from orchestrator.core.domain import SubscriptionModel
+from orchestrator.core.settings import SubscriptionSaveStrategy
+from orchestrator.core.types import SubscriptionLifecycle
+from test.integration_tests.fixtures.products.product_blocks.product_block_one import DummyEnum
+
+
+def _count(table, *clauses):
+    return db.session.scalar(select(func.count()).select_from(table).where(*clauses))
+
+
+def _instance_counts(subscription_id):
+    instance_ids = select(SubscriptionInstanceTable.subscription_instance_id).where(
+        SubscriptionInstanceTable.subscription_id == subscription_id
+    )
+    return (
+        _count(SubscriptionInstanceTable, SubscriptionInstanceTable.subscription_id == subscription_id),
+        _count(
+            SubscriptionInstanceValueTable, SubscriptionInstanceValueTable.subscription_instance_id.in_(instance_ids)
+        ),
+        _count(SubscriptionInstanceRelationTable, SubscriptionInstanceRelationTable.in_use_by_id.in_(instance_ids)),
+    )
+
+
+@pytest.fixture
+def make_horizontal_model(
+    test_product_model, test_product_type_one, test_product_block_one, test_product_sub_block_one
+):
+    ProductTypeOneForTestInactive, _, _ = test_product_type_one
+    ProductBlockOneForTestInactive, _, _ = test_product_block_one
+    SubBlockOneForTestInactive, _, _ = test_product_sub_block_one
+
+    def make(size: int):
+        model = ProductTypeOneForTestInactive.from_product_id(
+            product_id=test_product_model.product_id, customer_id=str(uuid4()), insync=True
+        )
+
+        def create_subblock(value):
+            return SubBlockOneForTestInactive.new(model.subscription_id, int_field=value, str_field=str(value))
+
+        model.block = ProductBlockOneForTestInactive.new(
+            subscription_id=model.subscription_id,
+            int_field=123,
+            str_field="abc",
+            list_field=[1, 2, 3],
+            sub_block=create_subblock(1),
+            sub_block_2=create_subblock(2),
+            sub_block_list=[create_subblock(n) for n in range(10, 10 + size)],
+            enum_field=DummyEnum.FOO,
+        )
+        return SubscriptionModel.from_other_lifecycle(model, SubscriptionLifecycle.ACTIVE)
+
+    return make
+
+
+def test_bulk_save_stores_same_rows_as_orm_save(make_horizontal_model, test_product_type_one):
+    _, _, ProductTypeOneForTest = test_product_type_one
+
+    orm_model = make_horizontal_model(5)
+    orm_model.save(strategy=SubscriptionSaveStrategy.ORM)
+    bulk_model = make_horizontal_model(5)
+    bulk_model.save(strategy=SubscriptionSaveStrategy.BULK)
+    db.session.commit()
+
+    assert _instance_counts(bulk_model.subscription_id) == _instance_counts(orm_model.subscription_id) == (8, 20, 7)
+
+    loaded = ProductTypeOneForTest.from_subscription(bulk_model.subscription_id)
+    assert loaded.model_dump() == bulk_model.model_dump() | {"version": bulk_model.version + 1}
+
+
+def test_bulk_save_updates_and_removes(make_horizontal_model, test_product_type_one):
+    _, _, ProductTypeOneForTest = test_product_type_one
+
+    model = make_horizontal_model(5)
+    model.save(strategy=SubscriptionSaveStrategy.BULK)
+    db.session.commit()
+
+    model = ProductTypeOneForTest.from_subscription(model.subscription_id)
+    removed_block_ids = [block.subscription_instance_id for block in model.block.sub_block_list[2:]]
+    model.block.sub_block_list = model.block.sub_block_list[:2]
+    model.block.sub_block_list[0].str_field = "changed"
+    model.block.list_field = [4]
+    model.block.label = "label"
+    model.save(strategy=SubscriptionSaveStrategy.BULK)
+    db.session.commit()
+
+    assert _instance_counts(model.subscription_id) == (5, 12, 4)
+    assert not _count(
+        SubscriptionInstanceTable, SubscriptionInstanceTable.subscription_instance_id.in_(removed_block_ids)
+    )
+
+    assert db.session.get(SubscriptionInstanceTable, model.block.subscription_instance_id).label == "label"
+
+    loaded = ProductTypeOneForTest.from_subscription(model.subscription_id)
+    assert loaded.block.sub_block_list == model.block.sub_block_list
+    assert loaded.block.sub_block_list[0].str_field == "changed"
+    assert loaded.block.list_field == [4]
+
+
+def test_bulk_save_foreign_instance(
+    test_product_model_nested, test_product_type_one_nested, test_product_block_one_nested
+):
+    ProductTypeOneNestedForTestInactive, _, _ = test_product_type_one_nested
+    ProductBlockOneNestedForTestInactive, _, _ = test_product_block_one_nested
+
+    def create(sub_block=None):
+        model = ProductTypeOneNestedForTestInactive.from_product_id(
+            product_id=test_product_model_nested.product_id, customer_id=str(uuid4()), insync=True
+        )
+        model.block = ProductBlockOneNestedForTestInactive.new(
+            subscription_id=model.subscription_id, int_field=1, sub_block=sub_block
+        )
+        model.save(strategy=SubscriptionSaveStrategy.BULK)
+        return model
+
+    foreign = create()
+    model = create(sub_block=ProductTypeOneNestedForTestInactive.from_subscription(foreign.subscription_id).block)
+    db.session.commit()
+
+    # Only the relation to the foreign instance is stored
+    assert _instance_counts(model.subscription_id) == (1, 1, 1)
+    assert _instance_counts(foreign.subscription_id) == (1, 1, 0)
+
+    loaded = ProductTypeOneNestedForTestInactive.from_subscription(model.subscription_id)
+    assert loaded.block.sub_block.subscription_instance_id == foreign.block.subscription_instance_id
+    assert loaded.block.sub_block.owner_subscription_id == foreign.subscription_id
+
+
+def test_bulk_save_foreign_instance_below_subscription(make_horizontal_model):
+    foreign = make_horizontal_model(1)
+    foreign.save(strategy=SubscriptionSaveStrategy.BULK)
+
+    model = make_horizontal_model(1)
+    model.block = foreign.block
+    with pytest.raises(ValueError, match="Attempting to save a Foreign `Subscription Instance` directly below"):
+        model.save(strategy=SubscriptionSaveStrategy.BULK)
+
+
+def test_bulk_save_query_count_does_not_grow_with_size(make_horizontal_model):
+    def count_queries(size):
+        model = make_horizontal_model(size)
+        db.session.flush()
+        monitor_sqlalchemy_queries()
+        try:
+            before = db.session.connection().info.get("queries_completed", 0)
+            model.save(strategy=SubscriptionSaveStrategy.BULK)
+            return db.session.connection().info["queries_completed"] - before
+        finally:
+            disable_listeners()
+
+    assert count_queries(100) == count_queries(10)
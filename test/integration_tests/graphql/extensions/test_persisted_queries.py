@@ -0,0 +1,72 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from orchestrator.core.graphql.extensions.persisted_queries import persisted_query_hash
+from test.integration_tests.config import GRAPHQL_ENDPOINT
+
+QUERY = """query MyQuery {
+  workflows(first: 1) {
+    page {
+      name
+    }
+  }
+}"""
+OTHER_QUERY = "query OtherQuery { workflows(first: 1) { pageInfo { totalItems } } }"
+
+
+def _persisted_query(query_hash):
+    return {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}}
+
+
+@pytest.fixture
+def register_persisted_queries(fastapi_app_graphql):
+    def register(only_persisted_queries):
+        fastapi_app_graphql.register_graphql(
+            persisted_queries=[QUERY], only_persisted_queries=only_persisted_queries, query_cache_size=10
+        )
+
+    return register
+
+
+def test_persisted_query(register_persisted_queries, test_client_graphql):
+    register_persisted_queries(only_persisted_queries=False)
+
+    response = test_client_graphql.post(GRAPHQL_ENDPOINT, json=_persisted_query(persisted_query_hash(QUERY)))
+    full_response = test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": QUERY})
+    other_response = test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": OTHER_QUERY})
+
+    assert response.json()["data"]["workflows"]["page"]
+    assert response.json() == full_response.json()
+    assert "errors" not in other_response.json()
+
+
+def test_persisted_query_not_found(register_persisted_queries, test_client_graphql):
+    register_persisted_queries(only_persisted_queries=False)
+
+    response = test_client_graphql.post(GRAPHQL_ENDPOINT, json=_persisted_query(persisted_query_hash(OTHER_QUERY)))
+
+    [error] = response.json()["errors"]
+    assert error["message"] == "PersistedQueryNotFound"
+
+
+def test_only_persisted_queries(register_persisted_queries, test_client_graphql):
+    register_persisted_queries(only_persisted_queries=True)
+
+    response = test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": QUERY})
+    other_response = test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": OTHER_QUERY})
+
+    assert "errors" not in response.json()
+    [error] = other_response.json()["errors"]
+    assert error["message"] == "Only persisted queries are allowed"
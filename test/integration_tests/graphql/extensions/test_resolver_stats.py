@@ -0,0 +1,85 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+from dirty_equals import IsFloat, IsPositiveInt
+
+from orchestrator.core.db.listeners import add_query_observer, disable_listeners, monitor_sqlalchemy_queries
+from orchestrator.core.graphql.extensions.resolver_stats import record_resolver_query
+from orchestrator.core.settings import app_settings
+from test.integration_tests.config import GRAPHQL_ENDPOINT
+
+QUERY = """query MyQuery {
+  processes(first: 10) {
+    page {
+      processId
+      product {
+        name
+      }
+    }
+  }
+}"""
+
+
+def _post_query(fastapi_app_graphql, test_client_graphql, sample_rate, query=QUERY):
+    try:
+        monitor_sqlalchemy_queries()
+        add_query_observer(record_resolver_query)
+        with patch.multiple(
+            app_settings,
+            ENABLE_GRAPHQL_RESOLVER_STATS_EXTENSION=True,
+            GRAPHQL_RESOLVER_STATS_SAMPLE_RATE=sample_rate,
+        ):
+            fastapi_app_graphql.register_graphql()
+            return test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": query})
+    finally:
+        disable_listeners()
+
+
+def test_resolver_stats_extension(fastapi_app_graphql, test_client_graphql, mocked_processes):
+    response = _post_query(fastapi_app_graphql, test_client_graphql, sample_rate=1.0)
+
+    result = response.json()
+    page_size = len(result["data"]["processes"]["page"])
+    resolver_stats = result["extensions"]["resolver_stats"]
+    assert resolver_stats["fields"]["Query.processes"] == {
+        "calls": 1,
+        "time": IsFloat,
+        "db_queries": IsPositiveInt,
+        "db_time": IsFloat,
+    }
+    assert resolver_stats["fields"]["ProcessType.product"]["calls"] == page_size
+    assert resolver_stats["loaders"]["core_product_loader"] == {
+        "batches": 1,
+        "keys": IsPositiveInt,
+        "max_batch_size": IsPositiveInt,
+    }
+
+
+def test_resolver_stats_extension_ignores_aliases(fastapi_app_graphql, test_client_graphql, mocked_processes):
+    query = """query MyQuery {
+      first: processes(first: 1) { page { processId } }
+      second: processes(first: 2) { page { processId } }
+    }"""
+    response = _post_query(fastapi_app_graphql, test_client_graphql, sample_rate=1.0, query=query)
+
+    fields = response.json()["extensions"]["resolver_stats"]["fields"]
+    assert fields["Query.processes"]["calls"] == 2
+    assert fields.keys() == {"Query.processes", "ProcessTypeConnection.page", "ProcessType.processId"}
+
+
+def test_resolver_stats_extension_not_sampled(fastapi_app_graphql, test_client_graphql, mocked_processes):
+    response = _post_query(fastapi_app_graphql, test_client_graphql, sample_rate=0.0)
+
+    assert "resolver_stats" not in response.json().get("extensions", {})
@@ -0,0 +1,94 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+from orchestrator.core.db import db
+from orchestrator.core.settings import app_settings
+from orchestrator.core.utils.response_cache import ResponseCache, invalidate_response_cache
+from test.integration_tests.config import GRAPHQL_ENDPOINT
+
+QUERY = """query ProductsQuery($filterBy: [GraphqlFilter!]) {
+  products(filterBy: $filterBy) {
+    page {
+      description
+    }
+  }
+}"""
+
+
+@pytest.fixture
+def response_cache(fastapi_app_graphql):
+    response_cache = ResponseCache(maxsize=10, ttl=60)
+    with (
+        mock.patch.object(app_settings, "RESPONSE_CACHE_ENABLED", True),
+        mock.patch("orchestrator.core.utils.response_cache._response_cache", response_cache),
+    ):
+        fastapi_app_graphql.register_graphql()
+        yield response_cache
+
+
+def _descriptions(test_client_graphql):
+    variables = {"filterBy": [{"field": "name", "value": "Product 1"}]}
+    response = test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": QUERY, "variables": variables})
+    return [product["description"] for product in response.json()["data"]["products"]["page"]]
+
+
+def test_response_cache(response_cache, test_client_graphql, generic_product_1):
+    assert _descriptions(test_client_graphql) == ["Generic Product One"]
+
+    generic_product_1.description = "Changed"
+    db.session.commit()
+    assert _descriptions(test_client_graphql) == ["Generic Product One"]
+
+    invalidate_response_cache({"type": "products"})
+    assert _descriptions(test_client_graphql) == ["Changed"]
+
+
+def test_response_cache_skips_other_queries(response_cache, test_client_graphql, generic_product_1):
+    query = "query { products { page { name } } processes { page { processId } } }"
+
+    test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": query})
+    generic_product_1.name = "Changed"
+    db.session.commit()
+    response = test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": query})
+
+    assert "Changed" in [product["name"] for product in response.json()["data"]["products"]["page"]]
+
+
+def test_response_cache_tags_nested_selections(response_cache, test_client_graphql):
+    query = "query { subscriptions { page { subscriptionId processes { page { processId } } } } }"
+
+    with mock.patch.object(response_cache, "versioned_key", wraps=response_cache.versioned_key) as versioned_key:
+        response = test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": query})
+
+    assert "errors" not in response.json()
+    assert set(versioned_key.call_args.args[0]) == {"subscriptions", "processes"}
+
+
+def test_response_cache_tags_fragments(response_cache, test_client_graphql):
+    query = """query {
+  products { page { ...product } }
+}
+
+fragment product on ProductType {
+  name
+  workflows { name }
+}"""
+
+    with mock.patch.object(response_cache, "versioned_key", wraps=response_cache.versioned_key) as versioned_key:
+        test_client_graphql.post(GRAPHQL_ENDPOINT, json={"query": query})
+
+    assert set(versioned_key.call_args.args[0]) == {"products", "workflows"}
@@ -12,9 +12,12 @@
 # limitations under the License.
 
 import json
+import pickle
 from http import HTTPStatus
+from unittest import mock
 from uuid import uuid4
 
+from orchestrator.core.services.workflows import get_workflow_by_name
 from test.integration_tests.config import GRAPHQL_ENDPOINT
 
 
@@ -318,3 +321,49 @@ def test_scheduled_tasks_invalid_sort(
     assert len(result["errors"]) == 1
     assert result["errors"][0]["message"] == expected_error_msg
     assert len(scheduled_tasks) == 4
+
+
+def test_scheduled_tasks_sort_by_next_run_time_in_database(
+    test_client_graphql, scheduler_with_jobs, clear_all_scheduler_jobs, create_schedules_via_api
+):
+    clear_all_scheduler_jobs()
+
+    scheduler_with_jobs(job_name="Not linked", trigger_kwargs={"minutes": 1}, schedule_id=f"{uuid4()}")
+    create_schedules_via_api(job_name="In 3 hours", trigger_kwargs={"hours": 3}, schedule_id=f"{uuid4()}")
+    create_schedules_via_api(job_name="In 1 hour", trigger_kwargs={"hours": 1}, schedule_id=f"{uuid4()}")
+    create_schedules_via_api(job_name="In 2 hours", trigger_kwargs={"hours": 2}, schedule_id=f"{uuid4()}")
+
+    data = get_scheduled_tasks_query(first=1, after=1, sort_by=[{"field": "nextRunTime", "order": "DESC"}])
+    with mock.patch("orchestrator.core.schedules.scheduler.pickle.loads", wraps=pickle.loads) as loads:
+        response = test_client_graphql.post(
+            GRAPHQL_ENDPOINT, content=data, headers={"Content-Type": "application/json"}
+        )
+
+    assert HTTPStatus.OK == response.status_code, response.text
+    result = response.json()
+    assert "errors" not in result
+    scheduled_tasks_data = result["data"]["scheduledTasks"]
+    assert [job["name"] for job in scheduled_tasks_data["page"]] == ["In 2 hours"]
+    assert scheduled_tasks_data["pageInfo"]["totalItems"] == 3
+    assert scheduled_tasks_data["pageInfo"]["hasNextPage"] is True
+    # Only the job states of the page, and the one that tells whether there is a next page, are unpickled
+    assert loads.call_count == 2
+
+
+def test_scheduled_tasks_filter_by_workflow_id_in_database(
+    test_client_graphql, clear_all_scheduler_jobs, create_schedules_via_api
+):
+    clear_all_scheduler_jobs()
+
+    create_schedules_via_api(job_name="Resume", workflow_name="task_resume_workflows", schedule_id=f"{uuid4()}")
+    create_schedules_via_api(job_name="Clean up", workflow_name="task_clean_up_tasks", schedule_id=f"{uuid4()}")
+    workflow_id = str(get_workflow_by_name("task_clean_up_tasks").workflow_id)
+
+    data = get_scheduled_tasks_query(filter_by=[{"field": "workflowId", "value": workflow_id.upper()}])
+    response = test_client_graphql.post(GRAPHQL_ENDPOINT, content=data, headers={"Content-Type": "application/json"})
+
+    assert HTTPStatus.OK == response.status_code, response.text
+    result = response.json()
+    assert "errors" not in result
+    scheduled_tasks = result["data"]["scheduledTasks"]["page"]
+    assert [(job["name"], job["workflowId"]) for job in scheduled_tasks] == [("Clean up", workflow_id)]
@@ -12,8 +12,10 @@
 # limitations under the License.
 import json
 from http import HTTPStatus
+from unittest import mock
 from uuid import uuid4
 
+from orchestrator.core.settings import app_settings
 from test.integration_tests.config import GRAPHQL_ENDPOINT
 
 
@@ -79,6 +81,23 @@ def build_last_validation_query(subscription_id):
     ).encode("utf-8")
 
 
+def build_available_workflows_query(subscription_id):
+    q = """query AvailableWorkflowsQuery($id: UUID!) {
+        subscription(id: $id) {
+            availableWorkflows
+        }
+    }"""
+    return json.dumps(
+        {
+            "operationName": "AvailableWorkflowsQuery",
+            "query": q,
+            "variables": {
+                "id": str(subscription_id),
+            },
+        }
+    ).encode("utf-8")
+
+
 def test_last_validation_query(test_client_graphql, validation_workflow_process_instance, benchmark):
     process, process_subscription = validation_workflow_process_instance
     test_query = build_last_validation_query(process_subscription.subscription_id)
@@ -131,6 +150,29 @@ def test_single_complex_subscription(
     }
 
 
+@mock.patch.object(app_settings, "ENABLE_GRAPHQL_PARTIAL_SUBSCRIPTION_LOADING", True)
+def test_single_complex_subscription_partially_loaded(test_client_graphql, product_sub_list_union_subscription_1):
+    test_query = build_complex_query(subscription_id=product_sub_list_union_subscription_1)
+
+    with mock.patch("orchestrator.core.graphql.resolvers.subscription.get_subscription_dict") as get_subscription_dict:
+        response = test_client_graphql.post(
+            GRAPHQL_ENDPOINT, content=test_query, headers={"Content-Type": "application/json"}
+        )
+
+    get_subscription_dict.assert_not_called()
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "data": {
+            "subscription": {
+                "__typename": "ProductSubListUnionSubscription",
+                "insync": True,
+                "product": {"status": "ACTIVE"},
+                "testBlock": {"intField": 1},
+            }
+        }
+    }
+
+
 def test_subscription_does_not_exist(test_client_graphql, benchmark):
     test_query = build_simple_query(uuid4())
 
@@ -142,3 +184,27 @@ def test_subscription_does_not_exist(test_client_graphql, benchmark):
 
     assert response.status_code == HTTPStatus.OK
     assert response.json() == {"data": {"subscription": None}}
+
+
+def test_available_workflows_query(
+    test_client_graphql, sub_one_subscription_1, sub_two_subscription_1, product_sub_list_union_subscription_1
+):
+    # The sub subscriptions are created with insync=False, which locks the subscription using them
+    test_query = build_available_workflows_query(product_sub_list_union_subscription_1)
+
+    response = test_client_graphql.post(
+        GRAPHQL_ENDPOINT, content=test_query, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    available_workflows = response.json()["data"]["subscription"]["availableWorkflows"]
+    assert available_workflows["reason"] == "subscription.relations_not_in_sync"
+    assert sorted(available_workflows["locked_relations"]) == sorted(
+        [str(sub_one_subscription_1.subscription_id), str(sub_two_subscription_1.subscription_id)]
+    )
+    assert {target: available_workflows[target] for target in ["create", "modify", "terminate", "system"]} == {
+        "create": [],
+        "modify": [],
+        "terminate": [],
+        "system": [],
+    }
@@ -37,4 +37,5 @@ def assume_empty_metrics_at_start(test_client) -> None:
     """Assert that at the start of every unit test in this module, the metrics endpoint only contains empty data."""
     response = test_client.get("/api/metrics")
     assert HTTPStatus.OK == response.status_code
-    assert response.text == EMPTY_METRICS
+    # The workflow engine histograms follow, these keep the observations of earlier tests
+    assert response.text.startswith(EMPTY_METRICS)
@@ -11,7 +11,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from orchestrator.core.metrics.workflows import PROCESS_QUEUE_WAIT
+from orchestrator.core.services.processes import _run_process_async
+from orchestrator.core.settings import ExecutorType, app_settings
+from orchestrator.core.workflow import Success, done, init, step, workflow
 from test.integration_tests.metrics.conftest import EMPTY_METRICS
+from test.integration_tests.workflows import WorkflowInstanceForTests, run_workflow
+
+
+@step("Step for engine metrics")
+def step_for_engine_metrics() -> dict:
+    return {}
+
+
+@workflow("Workflow for engine metrics")
+def workflow_for_engine_metrics():
+    return init >> step_for_engine_metrics >> done
 
 
 def test_engine_metrics_success(test_client) -> None:
@@ -28,4 +48,40 @@ def test_engine_metrics_success(test_client) -> None:
 
     test_client.put("/api/settings/status", json={"global_lock": False})
     response = test_client.get("/api/metrics")
-    assert response.text == EMPTY_METRICS
+    assert response.text.startswith(EMPTY_METRICS)
+
+
+def test_step_latency_metrics(test_client) -> None:
+    with WorkflowInstanceForTests(workflow_for_engine_metrics, "workflow_for_engine_metrics"):
+        run_workflow("workflow_for_engine_metrics", {})
+
+    response = test_client.get("/api/metrics")
+    expected_metric_lines = [
+        "# TYPE wfo_step_duration_seconds histogram",
+        'wfo_step_duration_seconds_count{step_name="Step for engine metrics",workflow_name="workflow_for_engine_metrics"} 1.0',
+        "# TYPE wfo_step_log_write_duration_seconds histogram",
+        'wfo_step_log_write_duration_seconds_count{workflow_name="workflow_for_engine_metrics"} 3.0',
+    ]
+    assert all(line in response.text for line in expected_metric_lines)
+
+
+def _queue_wait_count(workflow_name: str) -> float:
+    [metric] = PROCESS_QUEUE_WAIT.collect()
+    counts = [
+        sample.value
+        for sample in metric.samples
+        if sample.name.endswith("_count") and sample.labels == {"workflow_name": workflow_name}
+    ]
+    return counts[0] if counts else 0
+
+
+@pytest.mark.parametrize(
+    "executor,expected_count", [(ExecutorType.THREADPOOL, 1), (ExecutorType.WORKER, 0)], ids=["threadpool", "worker"]
+)
+def test_queue_wait_is_only_observed_for_the_threadpool(executor, expected_count) -> None:
+    workflow_name = f"queue_wait_{executor}"
+
+    with mock.patch.object(app_settings, "EXECUTOR", executor):
+        _run_process_async(uuid4(), lambda: Success({}), workflow_name=workflow_name)
+
+    assert _queue_wait_count(workflow_name) == expected_count
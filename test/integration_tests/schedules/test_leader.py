@@ -0,0 +1,93 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from unittest import mock
+
+from sqlalchemy.exc import DBAPIError
+from typer.testing import CliRunner
+
+from orchestrator.core.cli.scheduler import app
+from orchestrator.core.db import db
+from orchestrator.core.schedules import scheduler as scheduler_module
+from orchestrator.core.schedules.leader import SchedulerLeaderLock
+from orchestrator.core.settings import app_settings
+
+executed_in_terms: list[int] = []
+
+
+def record_execution(term: int) -> None:
+    executed_in_terms.append(term)
+
+
+def test_one_scheduler_is_leader():
+    leader = SchedulerLeaderLock(db.engine)
+    standby = SchedulerLeaderLock(db.engine)
+    try:
+        assert leader.acquire()
+        assert not standby.acquire()
+        assert leader.check()
+        assert not standby.check()
+
+        leader.release()
+        assert not leader.held
+        assert standby.acquire()
+        assert not leader.acquire()
+    finally:
+        leader.release()
+        standby.release()
+
+
+def test_lost_connection_releases_leadership():
+    leader = SchedulerLeaderLock(db.engine)
+    standby = SchedulerLeaderLock(db.engine)
+    try:
+        assert leader.acquire()
+        with mock.patch.object(leader._connection, "execute", side_effect=DBAPIError("SELECT 1", {}, Exception())):
+            assert not leader.check()
+
+        assert not leader.held
+        # The connection was closed instead of returned to the pool, which released the lock
+        assert standby.acquire()
+    finally:
+        leader.release()
+        standby.release()
+
+
+def test_scheduler_runs_tasks_after_regaining_leadership():
+    executed_in_terms.clear()
+    terms = iter(range(2))
+
+    def run_task_and_lose_leadership():
+        term = next(terms)
+        scheduler_module.scheduler.add_job(record_execution, "date", args=[term], id=f"leadership-term-{term}")
+        deadline = time.monotonic() + 5
+        while term not in executed_in_terms and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return False
+
+    leader_lock = mock.MagicMock()
+    leader_lock.acquire.side_effect = [True, True, KeyboardInterrupt]
+    leader_lock.check.side_effect = run_task_and_lose_leadership
+    redis_connection = mock.MagicMock()
+    redis_connection.brpop.return_value = None
+    with (
+        mock.patch("orchestrator.core.cli.scheduler.SchedulerLeaderLock", return_value=leader_lock),
+        mock.patch("orchestrator.core.cli.scheduler.create_redis_client", return_value=redis_connection),
+        mock.patch.object(app_settings, "SCHEDULER_LEADER_CHECK_INTERVAL", 0.001),
+    ):
+        result = CliRunner().invoke(app, ["run"])
+
+    assert result.exit_code == 130
+    assert result.output.count("Lost the scheduler leader lock") == 2
+    assert executed_in_terms == [0, 1]
@@ -23,19 +23,20 @@ from orchestrator.core.services.executors.celery import (
     _celery_resume_process,
     _celery_set_process_status_resumed,
     _celery_start_process,
+    _celery_start_processes,
 )
 from orchestrator.core.services.processes import RESUMABLE_STATUSES
-from orchestrator.core.services.tasks import NEW_TASK, RESUME_WORKFLOW
+from orchestrator.core.services.tasks import NEW_TASK, NEW_WORKFLOW, RESUME_WORKFLOW
 from orchestrator.core.targets import Target
 from orchestrator.core.workflow import ProcessStatus
 
 
 @mock.patch("orchestrator.core.services.tasks.get_celery_task")
-@mock.patch("orchestrator.core.services.executors.celery.get_workflow_by_name")
+@mock.patch("orchestrator.core.services.executors.celery.get_workflow_registry_entry")
 @mock.patch("orchestrator.core.services.executors.celery.delete_process")
-def test_celery_start_process(mock_delete_process, mock_get_workflow_by_name, mock_get_celery_task):
+def test_celery_start_process(mock_delete_process, mock_get_workflow_registry_entry, mock_get_celery_task):
     pstat = MagicMock()
-    mock_get_workflow_by_name.return_value.target = Target.SYSTEM
+    mock_get_workflow_registry_entry.return_value.target = Target.SYSTEM
 
     trigger_task = MagicMock()
     trigger_task.apply_async.get.return_value = uuid4()
@@ -46,18 +47,18 @@ def test_celery_start_process(mock_delete_process, mock_get_workflow_by_name, mo
     assert process_id == pstat.process_id
     mock_get_celery_task.assert_called_once_with(NEW_TASK)
     trigger_task.apply_async.assert_called_once()
-    mock_get_workflow_by_name.assert_called_once()
+    mock_get_workflow_registry_entry.assert_called_once()
     mock_delete_process.assert_not_called()
 
 
 @mock.patch("orchestrator.core.services.tasks.get_celery_task")
-@mock.patch("orchestrator.core.services.executors.celery.get_workflow_by_name")
+@mock.patch("orchestrator.core.services.executors.celery.get_workflow_registry_entry")
 @mock.patch("orchestrator.core.services.executors.celery.delete_process")
 def test_celery_start_process_connection_error_should_delete_process(
-    mock_delete_process, mock_get_workflow_by_name, mock_get_celery_task
+    mock_delete_process, mock_get_workflow_registry_entry, mock_get_celery_task
 ):
     pstat = MagicMock()
-    mock_get_workflow_by_name.return_value.target = Target.SYSTEM
+    mock_get_workflow_registry_entry.return_value.target = Target.SYSTEM
     trigger_task = MagicMock()
 
     def raise_connection_error(args, **options):
@@ -70,7 +71,7 @@ def test_celery_start_process_connection_error_should_delete_process(
         _celery_start_process(pstat)
 
     mock_delete_process.assert_called_once_with(pstat.process_id)
-    mock_get_workflow_by_name.assert_called_once()
+    mock_get_workflow_registry_entry.assert_called_once()
 
 
 @mock.patch("orchestrator.core.services.tasks.get_celery_task")
@@ -151,3 +152,51 @@ def test_celery_set_process_status_resumed_invalid_statuses(mock_db, status):
         _celery_set_process_status_resumed(process)
 
     assert process.last_status == status
+
+
+@mock.patch("orchestrator.core.services.tasks.get_celery_producer")
+@mock.patch("orchestrator.core.services.tasks.get_celery_task")
+@mock.patch("orchestrator.core.services.executors.celery.get_workflow_registry_entry")
+@mock.patch("orchestrator.core.services.executors.celery.db")
+def test_celery_start_processes(mock_db, mock_get_workflow_registry_entry, mock_get_celery_task, mock_get_producer):
+    pstats = [MagicMock() for _ in range(3)]
+    for pstat in pstats:
+        pstat.workflow.name = "validate_something"
+    mock_get_workflow_registry_entry.return_value.is_task = False
+    mock_get_workflow_registry_entry.return_value.target = Target.VALIDATE
+    producer = mock_get_producer.return_value.__enter__.return_value
+
+    trigger_task = MagicMock()
+    trigger_task.apply_async.return_value.get.return_value = uuid4()
+    mock_get_celery_task.return_value = trigger_task
+
+    process_ids = _celery_start_processes(pstats, user="test")
+
+    assert process_ids == [pstat.process_id for pstat in pstats]
+    mock_get_workflow_registry_entry.assert_called_once_with("validate_something")
+    mock_get_celery_task.assert_called_once_with(NEW_WORKFLOW)
+    mock_get_producer.assert_called_once()
+    assert trigger_task.apply_async.call_args_list == [
+        mock.call((pstat.process_id, "test"), producer=producer) for pstat in pstats
+    ]
+
+
+@mock.patch("orchestrator.core.services.tasks.get_celery_producer")
+@mock.patch("orchestrator.core.services.tasks.get_celery_task")
+@mock.patch("orchestrator.core.services.executors.celery.get_workflow_registry_entry")
+@mock.patch("orchestrator.core.services.executors.celery.delete_processes")
+@mock.patch("orchestrator.core.services.executors.celery.db")
+def test_celery_start_processes_connection_error_should_delete_unpublished_processes(
+    mock_db, mock_delete_processes, mock_get_workflow_registry_entry, mock_get_celery_task, mock_get_producer
+):
+    pstats = [MagicMock() for _ in range(3)]
+    mock_get_workflow_registry_entry.return_value.target = Target.SYSTEM
+
+    trigger_task = MagicMock()
+    trigger_task.apply_async.side_effect = [MagicMock(), ConnectionError("network down")]
+    mock_get_celery_task.return_value = trigger_task
+
+    with pytest.raises(ConnectionError):
+        _celery_start_processes(pstats)
+
+    mock_delete_processes.assert_called_once_with([pstats[1].process_id, pstats[2].process_id])
@@ -0,0 +1,190 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from celery import Celery
+from sqlalchemy import select
+
+from orchestrator.core.config.assignee import Assignee
+from orchestrator.core.db import ProcessTable, db
+from orchestrator.core.services import tasks
+from orchestrator.core.services.processes import (
+    _get_process,
+    create_process,
+    resume_process,
+    safe_logstep,
+    start_process,
+)
+from orchestrator.core.settings import ExecutorType, app_settings
+from orchestrator.core.utils.state import _build_arguments, inject_args
+from orchestrator.core.workflow import ProcessStatus, StepList, Workflow, done, init, inputstep, runwf, step, workflow
+from pydantic_forms.core import FormPage
+from test.integration_tests.workflows import WorkflowInstanceForTests
+
+# Synthetic workflows: a step that fills the state with `state_size` keys, followed by `step_count` steps that each
+# read the payload and update a counter. Parametrized over both to see how the engine scales with either.
+STEP_COUNTS = [10, 100]
+STATE_SIZES = [10, 1000]
+
+
+def initial_input_form():
+    class BenchmarkForm(FormPage):
+        state_size: int = 10
+
+    user_input = yield BenchmarkForm
+    return user_input.model_dump()
+
+
+@step("Generate payload")
+def generate_payload(state_size):
+    return {"payload": {f"key_{n}": f"value_{n}" for n in range(state_size)}, "counter": 0}
+
+
+def increment_counter(counter, payload):
+    return {"counter": counter + 1}
+
+
+@inputstep("Confirm", assignee=Assignee.SYSTEM)
+def confirm():
+    class ConfirmForm(FormPage):
+        confirmed: bool = True
+
+    user_input = yield ConfirmForm
+    return user_input.model_dump()
+
+
+def make_benchmark_workflow(step_count: int, *, suspend: bool = False) -> Workflow:
+    counter_steps = StepList([step(f"Increment counter {n}")(increment_counter) for n in range(step_count)])
+
+    @workflow(initial_input_form=initial_input_form)
+    def benchmark_workflow():
+        steps = init >> generate_payload
+        if suspend:
+            steps >>= confirm
+        return steps >> counter_steps >> done
+
+    return benchmark_workflow
+
+
+def make_state(state_size: int) -> dict:
+    payload = {f"key_{n}": f"value_{n}" for n in range(state_size)}
+    return {"counter": 0, "payload": payload} | payload
+
+
+@pytest.fixture
+def step_count():
+    return 1
+
+
+@pytest.fixture
+def suspend():
+    return False
+
+
+@pytest.fixture
+def benchmark_workflow(step_count, suspend):
+    name = f"benchmark_workflow_{step_count}"
+    with WorkflowInstanceForTests(make_benchmark_workflow(step_count, suspend=suspend), name):
+        # The engine runs the steps in a database scope of its own, which would roll back the test transaction
+        with mock.patch.object(db.session, "rollback"):
+            yield name
+
+
+@pytest.fixture
+def celery_eager(monkeypatch):
+    """Run the Celery tasks in the calling thread, to measure the overhead of the executor without a broker."""
+    celery = Celery("benchmark", broker="memory://", backend="cache+memory://")
+    celery.conf.update(task_always_eager=True, task_eager_propagates=True)
+
+    monkeypatch.setattr(tasks, "_celery", None)
+    tasks.initialise_celery(celery)
+    with mock.patch.object(app_settings, "EXECUTOR", ExecutorType.WORKER):
+        yield
+
+
+@pytest.fixture(params=[ExecutorType.THREADPOOL, ExecutorType.WORKER])
+def executor(request):
+    if request.param == ExecutorType.WORKER:
+        request.getfixturevalue("celery_eager")
+    return request.param
+
+
+def _assert_completed(process_id, step_count):
+    process = _get_process(process_id)
+    assert process.last_status == ProcessStatus.COMPLETED
+    assert process.steps[-1].state["counter"] == step_count
+
+
+@pytest.mark.parametrize("state_size", STATE_SIZES)
+@pytest.mark.parametrize("step_count", STEP_COUNTS)
+def test_exec_steps_with_db_logging(benchmark_workflow, step_count, state_size, benchmark, monitor_sqlalchemy):
+    # Only running the steps is measured, every round gets a new process
+    def setup():
+        return (create_process(benchmark_workflow, [{"state_size": state_size}]),), {}
+
+    def run(pstat):
+        with monitor_sqlalchemy():
+            return runwf(pstat, safe_logstep)
+
+    result = benchmark.pedantic(run, setup=setup)
+
+    assert result.iscomplete()
+    assert result.unwrap()["counter"] == step_count
+
+
+@pytest.mark.parametrize("state_size", STATE_SIZES)
+def test_build_arguments(state_size, benchmark):
+    state = make_state(state_size)
+
+    arguments = benchmark(_build_arguments, increment_counter, state)
+
+    assert arguments == [0, state["payload"]]
+
+
+@pytest.mark.parametrize("state_size", STATE_SIZES)
+def test_inject_args(state_size, benchmark):
+    state = make_state(state_size)
+    step_func = inject_args(increment_counter)
+
+    new_state = benchmark(step_func, state)
+
+    assert new_state["counter"] == 1
+
+
+@pytest.mark.benchmark
+def test_start_process_executor_overhead(benchmark_workflow, executor):
+    # when
+    process_id = start_process(benchmark_workflow, [{"state_size": 10}])
+
+    # then
+    _assert_completed(process_id, 1)
+
+
+@pytest.mark.parametrize("suspend", [True])
+@pytest.mark.parametrize("step_count", [10])
+def test_resume_process_latency(benchmark_workflow, executor, benchmark):
+    # Only resuming is measured, every round gets a new suspended process
+    def setup():
+        process_id = start_process(benchmark_workflow, [{"state_size": 100}])
+        process = db.session.scalar(select(ProcessTable).where(ProcessTable.process_id == process_id))
+        assert process.last_status == ProcessStatus.SUSPENDED
+        return (process,), {}
+
+    def resume(process):
+        return resume_process(process, user_inputs=[{"confirmed": True}])
+
+    process_id = benchmark.pedantic(resume, setup=setup)
+
+    _assert_completed(process_id, 10)
@@ -0,0 +1,98 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from orchestrator.core.config.assignee import Assignee
+from orchestrator.core.db import EngineSettingsTable, ProcessTable, WorkflowTable, db
+from orchestrator.core.services.process_resumer import (
+    ResumeProgress,
+    get_resume_progress,
+    resume_processes_concurrently,
+)
+from orchestrator.core.services.processes import SYSTEM_USER, marshall_processes
+from orchestrator.core.targets import Target
+from orchestrator.core.workflow import ProcessStatus
+
+
+@pytest.fixture
+def make_process():
+    workflow = WorkflowTable(workflow_id=uuid4(), name="Resumer workflow", target=Target.SYSTEM, description="")
+    db.session.add(workflow)
+
+    def _make_process(status):
+        process = ProcessTable(
+            process_id=uuid4(),
+            workflow_id=workflow.workflow_id,
+            last_status=status,
+            assignee=Assignee.SYSTEM,
+            created_by="Fredje",
+        )
+        db.session.add(process)
+        db.session.commit()
+        return process.process_id
+
+    return _make_process
+
+
+def test_resume_processes_concurrently(make_process):
+    process_ids = [make_process(ProcessStatus.WAITING) for _ in range(3)]
+    missing_id = uuid4()
+
+    def handoff(process):
+        if process.process_id == process_ids[1]:
+            raise ValueError("Can not resume")
+        return process.process_id
+
+    progress = ResumeProgress(total=4)
+
+    # One thread, the test database connection can't be shared between threads
+    resumed = resume_processes_concurrently(
+        [*process_ids, missing_id], handoff, concurrency=1, batch_size=2, progress=progress
+    )
+
+    assert resumed == [process_ids[0], process_ids[2]]
+    assert (progress.resumed, progress.failed) == (2, 2)
+    assert not progress.to_schema().in_progress
+
+
+@mock.patch("orchestrator.core.services.processes.resume_process")
+def test_marshall_processes_resumes_running_processes_on_unlock(mock_resume_process, make_process):
+    running = make_process(ProcessStatus.RUNNING)
+    suspended = make_process(ProcessStatus.SUSPENDED)
+    engine_settings = db.session.scalar(select(EngineSettingsTable))
+    engine_settings.global_lock = True
+    db.session.commit()
+
+    with mock.patch("orchestrator.core.services.processes.get_thread_pool") as get_thread_pool:
+        assert marshall_processes(engine_settings, False)
+
+    # The threads of the workflow executor are left to run the resumed processes
+    get_thread_pool.assert_not_called()
+
+    assert engine_settings.global_lock is False
+    mock_resume_process.assert_called_once()
+    assert mock_resume_process.call_args.args[0].process_id == running
+    assert mock_resume_process.call_args.kwargs == {"user": SYSTEM_USER}
+    assert db.session.get(ProcessTable, running).last_status == ProcessStatus.RESUMED
+    assert db.session.get(ProcessTable, suspended).last_status == ProcessStatus.SUSPENDED
+    progress = get_resume_progress()
+    assert (progress.total, progress.resumed, progress.failed) == (1, 1, 0)
+
+    # Resuming processes for another reason does not change the progress of the unlock
+    resume_processes_concurrently([running], mock_resume_process, concurrency=1)
+    assert get_resume_progress().total == 1
@@ -12,23 +12,36 @@
 # limitations under the License.
 
 import asyncio
+from contextlib import closing
 from http import HTTPStatus
-from threading import Event
+from threading import Event, current_thread
 from time import sleep
 from unittest import mock
 from unittest.mock import MagicMock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic_i18n import PydanticI18n
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.orm import sessionmaker
 
+from orchestrator.core.api.api_v1.endpoints.processes import (
+    get_steps_to_evaluate_for_rbac,
+    get_steps_to_evaluate_for_rbac_by_progress,
+)
 from orchestrator.core.api.error_handling import ProblemDetailException
 from orchestrator.core.config.assignee import Assignee
-from orchestrator.core.db import ProcessStepTable, ProcessSubscriptionTable, ProcessTable, db
-from orchestrator.core.db.database import transactional
+from orchestrator.core.db import (
+    ProcessStatusCountsTable,
+    ProcessStepTable,
+    ProcessSubscriptionTable,
+    ProcessTable,
+    db,
+)
+from orchestrator.core.db.database import SESSION_ARGUMENTS, transactional
 from orchestrator.core.domain.base import SubscriptionModel
 from orchestrator.core.services.executors.threadpool import thread_start_process
+from orchestrator.core.services.process_broadcast_thread import _broadcast_ws_fn
 from orchestrator.core.services.processes import (
     RESUME_WORKFLOW_REMOVED_ERROR_MSG,
     SYSTEM_USER,
@@ -38,14 +51,19 @@ from orchestrator.core.services.processes import (
     _db_log_step,
     _get_process,
     _run_process_async,
+    get_process_status_counts,
+    get_processes_progress,
     load_process,
+    rebuild_process_status_counts,
     resume_process,
     safe_logstep,
     start_process,
+    start_processes,
 )
 from orchestrator.core.services.settings import generate_engine_settings_schema, get_engine_settings_table
 from orchestrator.core.settings import app_settings
 from orchestrator.core.targets import Target
+from orchestrator.core.utils.async_bridge import AsyncBridge
 from orchestrator.core.utils.errors import ApiException, error_state_to_dict
 from orchestrator.core.workflow import (
     Abort,
@@ -712,6 +730,53 @@ def test_run_process_async_swallows_final_broadcast_exception(simple_workflow):
     _run_process_async(process_id, run_func, broadcast_func=MagicMock(side_effect=RuntimeError("websocket failed")))
 
 
+@pytest.fixture
+def isolated_thread_sessions():
+    """Give the sessions of other threads a connection of their own, so they only see committed changes."""
+    test_thread = current_thread()
+    registry = db.wrapped_database.scoped_session.registry
+    test_session_factory = registry.createfunc
+
+    with closing(db.wrapped_database.engine.connect()) as connection:
+        thread_session_factory = sessionmaker(**SESSION_ARGUMENTS, bind=connection)
+
+        def create_session():
+            if current_thread() is test_thread:
+                return test_session_factory()
+            return thread_session_factory()
+
+        with mock.patch.object(registry, "createfunc", create_session):
+            yield
+
+
+def test_db_log_step_broadcast_invalidates_subscriptions_before_commit(
+    process_with_subscription, isolated_thread_sessions
+):
+    """The bridge runs the broadcast in a thread of its own, possibly before the step is committed.
+
+    The workflow must read the terminal status itself, a session of the bridge would still see the process running.
+    """
+    process_id, subscription_id = process_with_subscription
+    bridge = AsyncBridge("test-broadcast", max_pending=10, concurrency=1)
+    pstat = ProcessStat(process_id, None, None, None, current_user="user")
+    step = make_step_function(lambda: None, "step", None, "assignee")
+
+    with (
+        mock.patch("orchestrator.core.websocket.broadcast_bridge", bridge),
+        mock.patch("orchestrator.core.websocket.websocket_manager") as mock_websocket_manager,
+        mock.patch("orchestrator.core.websocket.broadcast_invalidate_cache") as mock_invalidate_cache,
+        mock.patch("orchestrator.core.websocket.invalidate_subscription_cache_by_id") as mock_invalidate_subscription,
+    ):
+        mock_websocket_manager.enabled = True
+        with transactional(db, MagicMock()):
+            _db_log_step(pstat, step, Complete({"foo": "bar"}), broadcast_func=_broadcast_ws_fn)
+            # Wait for the bridge thread while the status is not committed
+            bridge.stop()
+
+    mock_invalidate_cache.assert_any_await({"type": "processes", "id": str(process_id)})
+    mock_invalidate_subscription.assert_awaited_once_with(UUID(subscription_id))
+
+
 @pytest.mark.parametrize(
     "terminal_status",
     [
@@ -1117,6 +1182,26 @@ def test_start_process(
     assert mock_get_workflow.call_count == 1
 
 
+@mock.patch(
+    "orchestrator.core.services.executors.threadpool._run_process_async",
+    side_effect=lambda process_id, *args, **kwargs: process_id,
+)
+def test_start_processes(mock_run_process_async):
+    @workflow("Bulk started workflow", target=Target.SYSTEM)
+    def bulk_started_workflow():
+        return init >> done
+
+    with WorkflowInstanceForTests(bulk_started_workflow, "bulk_started_workflow"):
+        process_ids = start_processes("bulk_started_workflow", [[{}], [{}], [{}]], user="bulk")
+        processes = db.session.scalars(select(ProcessTable).where(ProcessTable.process_id.in_(process_ids))).all()
+
+    assert len(set(process_ids)) == 3
+    assert mock_run_process_async.call_count == 3
+    assert len(processes) == 3
+    assert {process.last_status for process in processes} == {ProcessStatus.RUNNING}
+    assert {process.created_by for process in processes} == {"bulk"}
+
+
 @mock.patch("orchestrator.core.services.processes.post_form")
 @mock.patch("orchestrator.core.services.processes.get_workflow")
 def test_start_process_form_error(mock_get_workflow, mock_post_form):
@@ -1282,6 +1367,64 @@ def test_load_process_with_altered_steps(num_steps_finished, step_names):
         assert get_step_names(process) == step_names[2]
 
 
+@pytest.mark.parametrize(
+    "step_statuses,cleared_steps,is_complete",
+    [
+        ([], 0, False),
+        (["success"], 1, False),
+        (["success", "suspend"], 1, False),
+        (["success", "skipped", "failed"], 2, False),
+        (["success", "success", "waiting", "waiting"], 2, False),
+        (["success", "success", "success", "complete"], 4, True),
+    ],
+)
+def test_get_processes_progress(step_statuses, cleared_steps, is_complete):
+    test_wf = workflow(initial_input_form=initial_input_form)(lambda: init >> step1 >> step2 >> done)
+    with WorkflowInstanceForTests(test_wf, "test_wf") as wf_table:
+        process_id = uuid4()
+        process = ProcessTable(process_id=process_id, workflow_id=wf_table.workflow_id, last_status="running")
+        db.session.add(process)
+        db.session.add_all(
+            ProcessStepTable(process_id=process_id, name=f"Step {i}", status=status, state={})
+            for i, status in enumerate(step_statuses)
+        )
+        db.session.commit()
+
+        progress = get_processes_progress([process_id])[process_id]
+        assert progress == (cleared_steps, is_complete)
+
+        # The steps to evaluate for RBAC are the same as when the whole step log is restored
+        pstat = load_process(process)
+        assert get_steps_to_evaluate_for_rbac_by_progress(test_wf, progress) == get_steps_to_evaluate_for_rbac(pstat)
+
+
+def test_process_status_counts_follow_process_changes(mocked_processes):
+    expected = {
+        "process_counts": {"failed": 1, "completed": 2, "suspended": 1, "resumed": 1},
+        "task_counts": {"completed": 1, "suspended": 1, "resumed": 1, "running": 1},
+    }
+    assert get_process_status_counts() == expected
+
+    failed = db.session.scalar(select(ProcessTable).where(ProcessTable.last_status == "failed"))
+    failed.last_status = "running"
+    db.session.commit()
+    assert get_process_status_counts()["process_counts"] == {"running": 1, "completed": 2, "suspended": 1, "resumed": 1}
+
+    db.session.execute(delete(ProcessTable).where(ProcessTable.is_task.is_(True)))
+    db.session.commit()
+    assert get_process_status_counts()["task_counts"] == {}
+
+
+def test_rebuild_process_status_counts(mocked_processes):
+    expected = get_process_status_counts()
+    db.session.execute(delete(ProcessStatusCountsTable))
+
+    with mock.patch.object(db.session, "commit"):
+        rebuild_process_status_counts()
+
+    assert get_process_status_counts() == expected
+
+
 def run_sync(process_id, fn):
     fn()
     return process_id
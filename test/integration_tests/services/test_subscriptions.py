@@ -19,13 +19,17 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.exc import MultipleResultsFound
 
-from orchestrator.core.db import ProductTable, db
+from orchestrator.core.db import ProductTable, SubscriptionTable, db
 from orchestrator.core.domain import SubscriptionModel
 from orchestrator.core.services.subscriptions import (
     build_extended_domain_model,
     format_extended_domain_model,
     get_subscription,
     retrieve_subscription_by_subscription_instance_value,
+    status_relations,
+    status_relations_for_subscriptions,
+    subscription_workflows,
+    subscriptions_workflows,
 )
 from orchestrator.core.utils.json import json_dumps, json_loads
 from test.integration_tests import fixtures
@@ -171,3 +175,49 @@ def test_format_extended_domain_model(generic_subscription_1, generic_product_1)
     # With filtering we should not see the instance_id from the owner subscription
     formatted_with_filter = format_extended_domain_model(deepcopy(extended_model), filter_owner_relations=True)
     assert sorted(formatted_with_filter["pb_1"]["in_use_by_ids"]) == [other_instance_id]
+
+
+@pytest.fixture
+def related_subscription_ids(
+    sub_one_subscription_1,
+    sub_two_subscription_1,
+    product_sub_list_union_subscription_1,
+    sub_list_union_overlap_subscription_1,
+):
+    db.session.get(SubscriptionTable, sub_two_subscription_1.subscription_id).insync = False
+    db.session.get(SubscriptionTable, sub_list_union_overlap_subscription_1.subscription_id).status = "terminated"
+    db.session.commit()
+    return [
+        sub_one_subscription_1.subscription_id,
+        sub_two_subscription_1.subscription_id,
+        product_sub_list_union_subscription_1,
+        sub_list_union_overlap_subscription_1.subscription_id,
+    ]
+
+
+def test_status_relations_for_subscriptions(related_subscription_ids):
+    def sort_relations(relations):
+        return {key: sorted(value, key=lambda r: r.subscription_id) for key, value in relations.items()}
+
+    result = status_relations_for_subscriptions(related_subscription_ids + [uuid4()])
+
+    for subscription_id in related_subscription_ids:
+        expected = status_relations(db.session.get(SubscriptionTable, subscription_id))
+        assert sort_relations(result[subscription_id]) == sort_relations(expected)
+    assert result[related_subscription_ids[0]]["unterminated_in_use_by_subscriptions"]
+    assert result[related_subscription_ids[2]]["locked_relations"]
+
+
+def test_subscriptions_workflows(related_subscription_ids):
+    def sort_relations(workflows):
+        return {
+            key: sorted(value, key=str) if key.startswith("locked_relations") else value
+            for key, value in workflows.items()
+        }
+
+    result = subscriptions_workflows(related_subscription_ids + [uuid4()])
+
+    assert result.keys() == set(related_subscription_ids)
+    for subscription_id in related_subscription_ids:
+        expected = subscription_workflows(db.session.get(SubscriptionTable, subscription_id))
+        assert sort_relations(result[subscription_id]) == sort_relations(expected)
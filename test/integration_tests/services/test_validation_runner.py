@@ -0,0 +1,243 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+from uuid import UUID, uuid4
+
+import pytest
+import structlog
+from sqlalchemy import select
+
+from orchestrator.core.db import SubscriptionTable, SubscriptionValidationResultTable, db
+from orchestrator.core.db.database import WrappedSession, disable_commit
+from orchestrator.core.services.executors.types import ExecutorFunction
+from orchestrator.core.services.subscription_relations import get_last_validation_datetimes
+from orchestrator.core.services.validation_runner import (
+    ValidationResult,
+    get_validation_steps,
+    run_subscription_validations,
+    store_validation_results,
+)
+from orchestrator.core.services.workflows import get_subscription_validations, start_subscription_validations_in_bulk
+from orchestrator.core.settings import app_settings
+from orchestrator.core.types import SubscriptionLifecycle
+from orchestrator.core.utils.datetime import nowtz
+from orchestrator.core.workflow import StepList, begin, done, init, step, workflow
+from orchestrator.core.workflows.tasks.validate_subscriptions import validate_subscriptions
+from orchestrator.core.workflows.utils import validate_workflow
+from test.integration_tests.fixtures.products.product_blocks.product_block_one import DummyEnum
+from test.integration_tests.workflows import WorkflowInstanceForTests
+
+validated = []
+
+
+@pytest.fixture
+def runner_validation_workflow(test_product_type_one):
+    _, _, ProductTypeOneForTest = test_product_type_one
+
+    @step("Check subscription")
+    def check_subscription(subscription: ProductTypeOneForTest):
+        validated.append(subscription.subscription_id)
+        if subscription.description == "fail":
+            raise ValueError("Validation failed")
+
+    @validate_workflow()
+    def runner_validation_workflow() -> StepList:
+        return begin >> check_subscription
+
+    return runner_validation_workflow
+
+
+@pytest.fixture
+def product_one_subscription_factory(test_product_one, test_product_type_one, test_product_sub_block_one):
+    ProductTypeOneForTestInactive, _, ProductTypeOneForTest = test_product_type_one
+    _, _, SubBlockOneForTest = test_product_sub_block_one
+
+    def create(description: str) -> str:
+        model = ProductTypeOneForTestInactive.from_product_id(
+            product_id=test_product_one, customer_id=str(uuid4()), insync=True, description=description
+        )
+        model.block.str_field = "A"
+        model.block.int_field = 1
+        model.block.list_field = [10]
+        model.block.enum_field = DummyEnum.BAR
+        model.block.sub_block.str_field = "B"
+        model.block.sub_block.int_field = 2
+        model.block.sub_block_2 = SubBlockOneForTest.new(
+            subscription_id=model.subscription_id, int_field=3, str_field="test"
+        )
+        model = ProductTypeOneForTest.from_other_lifecycle(model, SubscriptionLifecycle.ACTIVE)
+        model.save()
+        return str(model.subscription_id)
+
+    return create
+
+
+@pytest.fixture
+def subscriptions(runner_validation_workflow, product_one_subscription_factory):
+    validated.clear()
+    with WorkflowInstanceForTests(runner_validation_workflow, "runner_validation_workflow") as wf:
+        passing = product_one_subscription_factory("pass")
+        failing = product_one_subscription_factory("fail")
+        # Keep a reference, the append event needs the product to be alive
+        product = db.session.get(SubscriptionTable, passing).product
+        product.workflows.append(wf)
+        db.session.commit()
+        # The failing step rolls back the session of the runner thread, which would roll back the test transaction
+        with mock.patch.object(WrappedSession, "rollback"):
+            yield passing, failing
+
+
+def _validations(*subscription_ids):
+    return get_subscription_validations(
+        [db.session.get(SubscriptionTable, subscription_id) for subscription_id in subscription_ids]
+    )
+
+
+def test_get_validation_steps(runner_validation_workflow):
+    [check_subscription] = get_validation_steps(runner_validation_workflow)
+
+    @workflow()
+    def plain_workflow():
+        return init >> check_subscription >> done
+
+    assert check_subscription.name == "Check subscription"
+    assert get_validation_steps(plain_workflow) is None
+
+
+def test_run_subscription_validations(subscriptions):
+    passing, failing = subscriptions
+    validations = _validations(passing, failing)
+
+    # One thread, the test database connection can't be shared between threads
+    results = list(run_subscription_validations(validations, concurrency=1, batch_size=1))
+
+    assert results == [
+        ValidationResult(UUID(passing), "runner_validation_workflow", True),
+        ValidationResult(UUID(failing), "runner_validation_workflow", False),
+    ]
+    assert validated == [UUID(passing), UUID(failing)]
+    # The runner does not lock the subscriptions
+    assert db.session.get(SubscriptionTable, passing).insync
+
+
+def test_validate_subscriptions_starts_processes_for_failures(subscriptions):
+    passing, failing = subscriptions
+    validations = _validations(passing, failing)
+
+    with (
+        mock.patch.multiple(app_settings, VALIDATION_RUNNER_ENABLED=True, VALIDATION_RUNNER_CONCURRENCY=1),
+        mock.patch(
+            "orchestrator.core.workflows.tasks.validate_subscriptions.get_subscription_validations",
+            return_value=validations,
+        ),
+        mock.patch(
+            "orchestrator.core.workflows.tasks.validate_subscriptions.start_subscription_validations_in_bulk"
+        ) as start_subscription_validations_in_bulk,
+    ):
+        state = validate_subscriptions({})
+
+    start_subscription_validations_in_bulk.assert_called_once()
+    [info] = start_subscription_validations_in_bulk.call_args.args[0]
+    assert info.subscription_id == UUID(failing)
+    assert info.workflows == ["runner_validation_workflow"]
+
+    summary = state.unwrap()["validation_summary"]
+    assert summary["passed"] == 1
+    assert summary["failed"] == 1
+    assert summary["started_as_process"] == 0
+    assert summary["failed_subscriptions"] == [failing]
+
+    results = {
+        result.subscription_id: result for result in db.session.scalars(select(SubscriptionValidationResultTable))
+    }
+    assert results.keys() == {UUID(passing), UUID(failing)}
+    assert results[UUID(passing)].passed
+    assert not results[UUID(failing)].passed
+    assert results[UUID(passing)].validated_at == summary["validated_at"]
+
+
+async def test_last_validation_includes_validation_runner(subscriptions):
+    passing, failing = subscriptions
+    validated_at = nowtz()
+
+    store_validation_results([ValidationResult(UUID(passing), "runner_validation_workflow", True)], validated_at)
+    # Running it again replaces the outcome of the workflow
+    validated_again_at = nowtz()
+    store_validation_results(
+        [
+            ValidationResult(UUID(passing), "runner_validation_workflow", False),
+            ValidationResult(UUID(failing), "runner_validation_workflow", None),
+        ],
+        validated_again_at,
+    )
+
+    [result] = db.session.scalars(select(SubscriptionValidationResultTable)).all()
+    assert not result.passed
+    # Workflows that were started as a process are validated by the process
+    assert await get_last_validation_datetimes([UUID(passing), UUID(failing)]) == [validated_again_at, None]
+
+
+def test_validate_subscriptions_counts_process_only_workflows_separately(subscriptions):
+    passing, _ = subscriptions
+    validations = _validations(passing)
+
+    with (
+        mock.patch.multiple(app_settings, VALIDATION_RUNNER_ENABLED=True, VALIDATION_RUNNER_CONCURRENCY=1),
+        mock.patch(
+            "orchestrator.core.workflows.tasks.validate_subscriptions.get_subscription_validations",
+            return_value=validations,
+        ),
+        mock.patch("orchestrator.core.services.validation_runner.get_validation_steps", return_value=None),
+        mock.patch(
+            "orchestrator.core.workflows.tasks.validate_subscriptions.start_subscription_validations_in_bulk"
+        ) as start_subscription_validations_in_bulk,
+    ):
+        state = validate_subscriptions({})
+
+    [info] = start_subscription_validations_in_bulk.call_args.args[0]
+    assert info.subscription_id == UUID(passing)
+
+    summary = state.unwrap()["validation_summary"]
+    assert summary["passed"] == 0
+    assert summary["failed"] == 0
+    assert summary["started_as_process"] == 1
+    assert summary["failed_subscriptions"] == []
+    assert not db.session.scalars(select(SubscriptionValidationResultTable)).all()
+
+
+def test_start_subscription_validations_in_bulk_skips_subscriptions_that_cannot_start(subscriptions):
+    passing, _ = subscriptions
+    [valid] = _validations(passing)
+    missing = valid._replace(subscription_id=uuid4())
+    start_many = mock.MagicMock()
+
+    # Called from a step, like the validation task does
+    with (
+        disable_commit(db, structlog.get_logger()),
+        mock.patch(
+            "orchestrator.core.services.processes.get_execution_context",
+            return_value={ExecutorFunction.START_MANY: start_many},
+        ),
+    ):
+        result = start_subscription_validations_in_bulk([valid, missing])
+
+    assert result == [
+        {
+            "workflow_name": "runner_validation_workflow",
+            "subscription_id": valid.subscription_id,
+            "product_type": valid.product_type,
+        }
+    ]
+    [pstats] = start_many.call_args.args
+    assert [pstat.state.unwrap()["subscription_id"] for pstat in pstats] == [passing]
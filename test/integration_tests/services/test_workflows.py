@@ -0,0 +1,81 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from sqlalchemy import text
+
+from orchestrator.core.db import WorkflowTable, db
+from orchestrator.core.services import workflows
+from orchestrator.core.services.workflows import WorkflowRegistryEntry, get_workflow_registry_entry
+from orchestrator.core.settings import app_settings
+from orchestrator.core.targets import Target
+
+
+def test_get_workflow_registry_entry_is_cached():
+    workflow = WorkflowTable(name="registry_workflow", target=Target.CREATE, is_task=False, description="desc")
+    db.session.add(workflow)
+    db.session.commit()
+
+    entry = get_workflow_registry_entry("registry_workflow")
+    assert entry == WorkflowRegistryEntry(workflow.workflow_id, "registry_workflow", Target.CREATE, False)
+
+    with mock.patch.object(workflows, "get_workflow_by_name") as get_workflow_by_name:
+        assert get_workflow_registry_entry("registry_workflow") is entry
+    get_workflow_by_name.assert_not_called()
+
+
+def test_get_workflow_registry_entry_is_invalidated_on_change():
+    assert get_workflow_registry_entry("registry_workflow") is None
+
+    workflow = WorkflowTable(name="registry_workflow", target=Target.CREATE, is_task=False, description="desc")
+    db.session.add(workflow)
+    db.session.commit()
+    assert get_workflow_registry_entry("registry_workflow").is_task is False
+
+    workflow.is_task = True
+    db.session.commit()
+    assert get_workflow_registry_entry("registry_workflow").is_task is True
+
+    db.session.delete(workflow)
+    db.session.commit()
+    assert get_workflow_registry_entry("registry_workflow") is None
+
+
+def test_get_workflow_registry_entry_is_invalidated_on_commit():
+    workflow = WorkflowTable(name="registry_workflow", target=Target.CREATE, is_task=False, description="desc")
+    db.session.add(workflow)
+    db.session.commit()
+    assert get_workflow_registry_entry("registry_workflow").is_task is False
+
+    # Until the change is committed, other sessions still read the old row
+    workflow.is_task = True
+    db.session.flush()
+    assert get_workflow_registry_entry("registry_workflow").is_task is False
+
+    db.session.commit()
+    assert get_workflow_registry_entry("registry_workflow").is_task is True
+
+
+def test_get_workflow_registry_entry_expires():
+    workflow = WorkflowTable(name="registry_workflow", target=Target.CREATE, is_task=False, description="desc")
+    db.session.add(workflow)
+    db.session.commit()
+
+    with mock.patch.object(app_settings, "WORKFLOW_REGISTRY_CACHE_TTL", 0):
+        assert get_workflow_registry_entry("registry_workflow").is_task is False
+
+        # Like a change made by another process
+        db.session.execute(text("UPDATE workflows SET is_task = true WHERE name = 'registry_workflow'"))
+        db.session.commit()
+        assert get_workflow_registry_entry("registry_workflow").is_task is True
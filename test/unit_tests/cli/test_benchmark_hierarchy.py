@@ -0,0 +1,41 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from orchestrator.core.cli.benchmark.hierarchy import HierarchySpec
+
+
+@pytest.mark.parametrize(
+    "spec,block_count",
+    [
+        (HierarchySpec(depth=1, fan_out=0, list_size=0), 1),
+        (HierarchySpec(depth=3, fan_out=2, list_size=3), 28),
+        (HierarchySpec(depth=2, fan_out=4, list_size=10, shared=5), 55),
+    ],
+)
+def test_block_count(spec, block_count):
+    assert spec.block_count == block_count
+
+
+def test_name():
+    assert HierarchySpec(depth=3, fan_out=2, list_size=5, shared=1).name == "Benchmark_d3_f2_l5_s1"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"depth": 0}, {"fan_out": -1}, {"list_size": -1}, {"shared": -1}, {"list_size": 2, "shared": 3}],
+)
+def test_invalid_spec(kwargs):
+    with pytest.raises(ValueError):
+        HierarchySpec(**kwargs)
@@ -21,6 +21,7 @@ from unittest import mock
 from typer.testing import CliRunner
 
 from orchestrator.core.cli.scheduler import app
+from orchestrator.core.settings import app_settings
 
 runner = CliRunner()
 
@@ -45,14 +46,69 @@ def _make_task(task_id: str = "task-1", name: str = "My Task", args=None, kwargs
 # --- run ---
 
 
+def _patch_run_dependencies(leader_lock: mock.MagicMock):
+    return (
+        mock.patch("orchestrator.core.cli.scheduler.SchedulerLeaderLock", return_value=leader_lock),
+        mock.patch("orchestrator.core.cli.scheduler.create_redis_client", **{"return_value.brpop.return_value": None}),
+        mock.patch("orchestrator.core.cli.scheduler.db"),
+    )
+
+
 def test_run_keyboard_interrupt_exits_130():
     """KeyboardInterrupt during scheduler startup results in exit code 130."""
     cm = mock.MagicMock()
     cm.__enter__ = mock.MagicMock(side_effect=KeyboardInterrupt)
     cm.__exit__ = mock.MagicMock(return_value=False)
-    with mock.patch("orchestrator.core.cli.scheduler.get_scheduler", return_value=cm):
+    leader_lock = mock.MagicMock()
+    leader_lock.acquire.return_value = True
+    patch_lock, patch_redis, patch_db = _patch_run_dependencies(leader_lock)
+    with (
+        patch_lock,
+        patch_redis,
+        patch_db,
+        mock.patch("orchestrator.core.cli.scheduler.get_scheduler", return_value=cm),
+    ):
         result = runner.invoke(app, ["run"])
     assert result.exit_code == 130
+    leader_lock.release.assert_called_once()
+
+
+def test_run_stands_by_while_another_scheduler_is_leader():
+    leader_lock = mock.MagicMock()
+    leader_lock.acquire.return_value = False
+    patch_lock, patch_redis, patch_db = _patch_run_dependencies(leader_lock)
+    with (
+        patch_lock,
+        patch_redis,
+        patch_db,
+        mock.patch("orchestrator.core.cli.scheduler.get_scheduler") as get_scheduler,
+        mock.patch("orchestrator.core.cli.scheduler.time.sleep", side_effect=[None, KeyboardInterrupt]),
+    ):
+        result = runner.invoke(app, ["run"])
+
+    assert result.exit_code == 130
+    assert leader_lock.acquire.call_count == 2
+    get_scheduler.assert_not_called()
+    assert result.output.count("standing by") == 1
+
+
+def test_run_stops_scheduler_when_leader_lock_is_lost():
+    leader_lock = mock.MagicMock()
+    leader_lock.acquire.side_effect = [True, KeyboardInterrupt]
+    leader_lock.check.return_value = False
+    patch_lock, patch_redis, patch_db = _patch_run_dependencies(leader_lock)
+    with (
+        patch_lock,
+        patch_redis,
+        patch_db,
+        mock.patch("orchestrator.core.cli.scheduler.get_scheduler") as get_scheduler,
+        mock.patch.object(app_settings, "SCHEDULER_LEADER_CHECK_INTERVAL", 0.001),
+    ):
+        result = runner.invoke(app, ["run"])
+
+    assert result.exit_code == 130
+    get_scheduler.return_value.__exit__.assert_called_once()
+    assert "Lost the scheduler leader lock" in result.output
 
 
 # --- force ---
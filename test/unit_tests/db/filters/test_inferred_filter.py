@@ -173,3 +173,19 @@ def test_filter_uuid_exact_non_uuid_column_raises() -> None:
     col = _make_table_column("name", sqlalchemy.String)
     with pytest.raises(AssertionError):
         filter_uuid_exact(col)
+
+
+# --- string filter ---
+
+
+def test_string_filter_does_not_coalesce_nullable_column() -> None:
+    col = _make_table_column("note", sqlalchemy.String, nullable=True)
+    clause = str(inferred_filter(col)(("Word", "foo")))
+    assert "coalesce" not in clause
+    assert clause == "test_tbl.note IS NOT NULL AND lower(test_tbl.note) LIKE lower(:note_1)"
+
+
+def test_string_filter_not_null_column() -> None:
+    col = _make_table_column("description", sqlalchemy.String)
+    clause = str(inferred_filter(col)(("Word", "foo")))
+    assert clause == "lower(test_tbl.description) LIKE lower(:description_1)"
@@ -17,7 +17,9 @@ from orchestrator.core.distlock.managers.memory_distlock_manager import MemoryDi
 
 @pytest.fixture(autouse=True)
 def clear_memory_locks():
-    """Clear the class-level shared locks dict before and after each test."""
+    """Clear the class-level shared locks and fencing tokens before and after each test."""
     MemoryDistLockManager.locks.clear()
+    MemoryDistLockManager.fencing_tokens.clear()
     yield
     MemoryDistLockManager.locks.clear()
+    MemoryDistLockManager.fencing_tokens.clear()
@@ -13,11 +13,13 @@
 
 """Tests for DistLockManager (backend selection, connect/disconnect idempotency) and WrappedDistLockManager (delegation, disabled mode, update)."""
 
+import asyncio
+from time import monotonic
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from orchestrator.core.distlock import WrappedDistLockManager, empty_fn
+from orchestrator.core.distlock import WrappedDistLockManager, empty_fn, empty_lease
 from orchestrator.core.distlock.distlock_manager import DistLockManager
 from orchestrator.core.distlock.managers.memory_distlock_manager import MemoryDistLockManager
 from orchestrator.core.distlock.managers.redis_distlock_manager import RedisDistLockManager
@@ -93,6 +95,13 @@ def test_wrapped_disabled_returns_empty_fn() -> None:
     assert wrapped.get_lock is empty_fn
 
 
+async def test_wrapped_disabled_lease_yields_none() -> None:
+    wrapped = WrappedDistLockManager(wrappee=DistLockManager(enabled=False))
+    assert wrapped.lease is empty_lease
+    async with wrapped.lease("resource", 30) as lease:
+        assert lease is None
+
+
 def test_wrapped_enabled_delegates() -> None:
     inner = DistLockManager(enabled=True)
     inner._backend = AsyncMock()
@@ -137,3 +146,77 @@ def test_init_distlock_manager_redis_backend() -> None:
     mgr = wrapped_distlock_manager.wrapped_distlock_manager
     assert mgr is not None
     assert isinstance(mgr._backend, RedisDistLockManager)
+
+
+# --- acquire_lock / lease ---
+
+
+async def test_acquire_lock_waits_for_release() -> None:
+    mgr = DistLockManager(enabled=True)
+    lock = await mgr.get_lock("resource", 60)
+    assert lock is not None
+
+    async def release_later():
+        await asyncio.sleep(0.1)
+        await mgr.release_lock(lock)
+
+    release_task = asyncio.create_task(release_later())
+    assert await mgr.acquire_lock("resource", 60, blocking_timeout=5) is not None
+    await release_task
+
+
+async def test_acquire_lock_times_out() -> None:
+    mgr = DistLockManager(enabled=True)
+    await mgr.get_lock("resource", 60)
+
+    start = monotonic()
+    assert await mgr.acquire_lock("resource", 60, blocking_timeout=0.2) is None
+    assert 0.2 <= monotonic() - start < 1
+
+
+async def test_lease_renews_and_releases() -> None:
+    mgr = DistLockManager(enabled=True)
+
+    async with mgr.lease("resource", 1) as lease:
+        assert lease is not None
+        assert lease.fencing_token == 1
+        # Outlive the expiration, the background renewal keeps the lock
+        await asyncio.sleep(1.5)
+        assert "resource" in MemoryDistLockManager.locks
+        assert not lease.lost
+
+    assert "resource" not in MemoryDistLockManager.locks
+    async with mgr.lease("resource", 1) as lease:
+        assert lease is not None
+        assert lease.fencing_token == 2
+
+
+async def test_lease_not_acquired_yields_none() -> None:
+    mgr = DistLockManager(enabled=True)
+    await mgr.get_lock("resource", 60)
+
+    async with mgr.lease("resource", 60) as lease:
+        assert lease is None
+
+
+async def test_lease_lost_when_renewal_fails() -> None:
+    mgr = DistLockManager(enabled=True)
+    mgr.extend_lock = AsyncMock(return_value=False)  # type: ignore[method-assign]
+
+    async with mgr.lease("resource", 0) as lease:
+        assert lease is not None
+        await asyncio.sleep(0.2)
+        assert lease.lost
+
+
+async def test_lease_lost_when_renewal_raises() -> None:
+    mgr = DistLockManager(enabled=True)
+    mgr.extend_lock = AsyncMock(side_effect=ConnectionError("redis is down"))  # type: ignore[method-assign]
+
+    # The error of the renewal must not replace the outcome of the critical section
+    with pytest.raises(ValueError, match="critical section"):
+        async with mgr.lease("resource", 0) as lease:
+            assert lease is not None
+            await asyncio.sleep(0.2)
+            assert lease.lost
+            raise ValueError("critical section")
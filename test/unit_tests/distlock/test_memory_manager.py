@@ -82,6 +82,45 @@ async def test_non_expired_lock_survives(manager: MemoryDistLockManager) -> None
     assert "long-lived" in MemoryDistLockManager.locks
 
 
+# --- extend_lock / get_fencing_token ---
+
+
+async def test_extend_lock_resets_expiry(manager: MemoryDistLockManager) -> None:
+    lock = await manager.get_lock("resource-k", 1)
+    assert lock is not None
+    assert await manager.extend_lock(lock, 60)
+    # Outlive the original expiration
+    await asyncio.sleep(1.2)
+    assert "resource-k" in MemoryDistLockManager.locks
+
+
+async def test_extend_released_lock_fails(manager: MemoryDistLockManager) -> None:
+    lock = await manager.get_lock("resource-l", 60)
+    assert lock is not None
+    await manager.release_lock(lock)
+    assert not await manager.extend_lock(lock, 60)
+
+
+async def test_fencing_tokens_increase_per_resource(manager: MemoryDistLockManager) -> None:
+    first = await manager.get_lock("resource-m", 60)
+    assert first is not None
+    assert await manager.get_fencing_token(first) == 1
+    await manager.release_lock(first)
+
+    second = await manager.get_lock("resource-m", 60)
+    other = await manager.get_lock("resource-n", 60)
+    assert second is not None and other is not None
+    assert await manager.get_fencing_token(second) == 2
+    assert await manager.get_fencing_token(other) == 1
+
+
+async def test_no_fencing_token_for_released_lock(manager: MemoryDistLockManager) -> None:
+    lock = await manager.get_lock("resource-o", 60)
+    assert lock is not None
+    await manager.release_lock(lock)
+    assert await manager.get_fencing_token(lock) is None
+
+
 # --- edge cases ---
 
 
@@ -16,7 +16,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from redis.exceptions import LockError
+from redis.exceptions import LockError, LockNotOwnedError
 
 from orchestrator.core.distlock.managers.redis_distlock_manager import RedisDistLockManager
 
@@ -125,9 +125,8 @@ async def test_release_lock_error_raises_attribute_error(connected_manager: Redi
 # --- release_sync ---
 
 
-def test_release_sync_creates_sync_client(connected_manager: RedisDistLockManager) -> None:
+def test_release_sync_reuses_sync_client(connected_manager: RedisDistLockManager) -> None:
     mock_redis_conn = MagicMock()
-    mock_sync_lock = MagicMock()
     mock_async_lock = MagicMock()
     mock_async_lock.name = "orchestrator:distlock:resource"
     mock_async_lock.timeout = 30.0
@@ -137,15 +136,61 @@ def test_release_sync_creates_sync_client(connected_manager: RedisDistLockManage
         patch(
             "orchestrator.core.distlock.managers.redis_distlock_manager.create_redis_client",
             return_value=mock_redis_conn,
-        ),
-        patch(
-            "orchestrator.core.distlock.managers.redis_distlock_manager.SyncLock",
-            return_value=mock_sync_lock,
-        ),
-        patch("orchestrator.core.distlock.managers.redis_distlock_manager.app_settings") as mock_settings,
+        ) as mock_create_redis_client,
+        patch("orchestrator.core.distlock.managers.redis_distlock_manager.SyncLock") as mock_sync_lock_cls,
     ):
-        mock_settings.CACHE_URI.get_secret_value.return_value = "redis://localhost:6379/0"
         connected_manager.release_sync(mock_async_lock)
+        connected_manager.release_sync(mock_async_lock)
+
+    mock_create_redis_client.assert_called_once_with("redis://localhost:6379/0")
+    assert mock_sync_lock_cls.call_args.kwargs["redis"] is mock_redis_conn
+    assert mock_sync_lock_cls.return_value.release.call_count == 2
+    mock_redis_conn.close.assert_not_called()
+
+
+async def test_disconnect_closes_sync_client(connected_manager: RedisDistLockManager) -> None:
+    mock_sync_conn = MagicMock()
+    connected_manager.sync_redis_conn = mock_sync_conn
+    await connected_manager.disconnect_redis()
+    mock_sync_conn.close.assert_called_once()
+    assert connected_manager.sync_redis_conn is None
+
+
+# --- extend_lock ---
+
+
+async def test_extend_lock(connected_manager: RedisDistLockManager) -> None:
+    mock_lock = AsyncMock()
+    mock_lock.extend = AsyncMock(return_value=True)
+    assert await connected_manager.extend_lock(mock_lock, 30)
+    mock_lock.extend.assert_awaited_once_with(30.0, replace_ttl=True)
+
+
+async def test_extend_lock_not_owned(connected_manager: RedisDistLockManager) -> None:
+    mock_lock = AsyncMock()
+    mock_lock.extend = AsyncMock(side_effect=LockNotOwnedError("expired"))
+    assert not await connected_manager.extend_lock(mock_lock, 30)
+
+
+# --- get_fencing_token ---
+
+
+async def test_get_fencing_token(connected_manager: RedisDistLockManager) -> None:
+    mock_lock = MagicMock()
+    mock_lock.name = "orchestrator:distlock:resource"
+    mock_lock.local.token = b"token"
+    script = AsyncMock(return_value=7)
+    connected_manager.redis_conn.register_script = MagicMock(return_value=script)
+
+    assert await connected_manager.get_fencing_token(mock_lock) == 7
+    script.assert_awaited_once_with(
+        keys=["orchestrator:distlock:resource", "orchestrator:distlock:resource:fencing-token"], args=[b"token"]
+    )
+
+
+async def test_get_fencing_token_lock_expired(connected_manager: RedisDistLockManager) -> None:
+    mock_lock = MagicMock()
+    mock_lock.name = "orchestrator:distlock:resource"
+    connected_manager.redis_conn.register_script = MagicMock(return_value=AsyncMock(return_value=None))
 
-    mock_sync_lock.release.assert_called_once()
-    mock_redis_conn.close.assert_called_once()
+    assert await connected_manager.get_fencing_token(mock_lock) is None
@@ -11,11 +11,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 import pytest
 from psycopg import errors as psycopg_errors
 from sqlalchemy.exc import ProgrammingError
 
-from orchestrator.core.metrics.dbutils import handle_missing_tables
+from orchestrator.core.metrics.dbutils import CachedQuery, handle_missing_tables
+from orchestrator.core.settings import app_settings
 
 
 def test_handle_missing_tables_passes_through_normally() -> None:
@@ -51,3 +57,49 @@ def test_handle_missing_tables_reraises_other_programming_errors(orig: Exception
             raise exc
 
     assert exc_info.value is exc
+
+
+def test_cached_query_without_ttl_runs_query_every_call() -> None:
+    query = mock.Mock(side_effect=[[1], [2]])
+    cached_query = CachedQuery(query)
+
+    with mock.patch.object(app_settings, "METRICS_CACHE_TTL", 0):
+        assert cached_query() == [1]
+        assert cached_query() == [2]
+
+
+def test_cached_query_reuses_result_until_expired() -> None:
+    query = mock.Mock(side_effect=[[1], [2]])
+    cached_query = CachedQuery(query)
+
+    with mock.patch.object(app_settings, "METRICS_CACHE_TTL", 60):
+        assert cached_query() == [1]
+        assert cached_query() == [1]
+        with mock.patch("orchestrator.core.metrics.dbutils.time.monotonic", return_value=time.monotonic() + 61):
+            assert cached_query() == [2]
+
+    assert query.call_count == 2
+
+
+def test_cached_query_runs_one_query_for_concurrent_calls() -> None:
+    """Calls that arrive while the result is refreshed wait for it instead of querying the database themselves."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_query() -> list[int]:
+        started.set()
+        release.wait(5)
+        return [1]
+
+    query = mock.Mock(side_effect=slow_query)
+    cached_query = CachedQuery(query)
+
+    with mock.patch.object(app_settings, "METRICS_CACHE_TTL", 60), ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cached_query)]
+        started.wait(5)
+        futures += [executor.submit(cached_query) for _ in range(3)]
+        release.set()
+
+        assert [future.result() for future in futures] == [[1]] * 4
+
+    query.assert_called_once()
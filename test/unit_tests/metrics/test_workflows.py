@@ -0,0 +1,41 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from prometheus_client import CollectorRegistry, Histogram
+
+from orchestrator.core.metrics.workflows import OTHER_LABEL_VALUE, bounded_label_values, observe_duration
+from orchestrator.core.settings import app_settings
+
+
+@pytest.fixture
+def histogram() -> Histogram:
+    return Histogram("test_duration", "Test duration", ["workflow_name", "step_name"], registry=CollectorRegistry())
+
+
+def test_bounded_label_values(histogram: Histogram) -> None:
+    with mock.patch.object(app_settings, "METRICS_MAX_LABEL_SETS", 2):
+        assert bounded_label_values(histogram, "wf", "step 1") == ("wf", "step 1")
+        assert bounded_label_values(histogram, "wf", "step 2") == ("wf", "step 2")
+        assert bounded_label_values(histogram, "wf", "step 3") == (OTHER_LABEL_VALUE, OTHER_LABEL_VALUE)
+        # Label values that were seen before keep their series
+        assert bounded_label_values(histogram, "wf", "step 1") == ("wf", "step 1")
+
+
+def test_observe_duration_observes_when_block_raises(histogram: Histogram) -> None:
+    with pytest.raises(ValueError), observe_duration(histogram, "wf", "step"):
+        raise ValueError("step failed")
+
+    assert histogram.labels("wf", "step")._sum.get() > 0
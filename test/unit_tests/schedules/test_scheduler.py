@@ -0,0 +1,58 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+from orchestrator.core.schedules.scheduler import create_scheduler
+from orchestrator.core.settings import app_settings
+
+
+def _noop() -> None:
+    pass
+
+
+@pytest.mark.parametrize(
+    "coalesce,misfire_grace_time",
+    [
+        pytest.param(True, 300, id="coalesce"),
+        pytest.param(False, None, id="no-coalesce-no-grace-limit"),
+    ],
+)
+def test_create_scheduler_job_defaults(coalesce, misfire_grace_time):
+    with mock.patch.multiple(
+        app_settings, SCHEDULER_COALESCE=coalesce, SCHEDULER_MISFIRE_GRACE_TIME=misfire_grace_time
+    ):
+        scheduler = create_scheduler()
+
+    scheduler.start(paused=True)
+    try:
+        job = scheduler.add_job(_noop, "interval", minutes=1)
+    finally:
+        scheduler.shutdown(wait=False)
+
+    assert job.coalesce is coalesce
+    assert job.misfire_grace_time == misfire_grace_time
+    assert job.max_instances == 1
+
+
+def test_create_scheduler_runs_tasks_in_thread_pool():
+    with mock.patch.object(app_settings, "SCHEDULER_MAX_WORKERS", 3):
+        scheduler = create_scheduler()
+
+    scheduler.start(paused=True)
+    try:
+        assert scheduler._lookup_executor("default")._pool._max_workers == 3
+    finally:
+        scheduler.shutdown(wait=False)
@@ -30,6 +30,7 @@ from orchestrator.core.db.models import ProcessTable
 from orchestrator.core.services.executors.celery import (
     _celery_resume_process,
     _celery_start_process,
+    _resolve_options,
     _resolve_queue,
 )
 from orchestrator.core.services.processes import SYSTEM_USER
@@ -59,15 +60,15 @@ def assert_enqueued_once(trigger_task, expected_args, expected_queue):
 
 @pytest.mark.parametrize("mapping,target,is_task,expected_queue", ROUTING_MATRIX)
 @mock.patch("orchestrator.core.services.tasks.get_celery_task")
-@mock.patch("orchestrator.core.services.executors.celery.get_workflow_by_name")
+@mock.patch("orchestrator.core.services.executors.celery.get_workflow_registry_entry")
 @mock.patch("orchestrator.core.services.executors.celery.db")
 def test_celery_start_process_routing(
-    mock_db, mock_get_workflow_by_name, mock_get_celery_task, mapping, target, is_task, expected_queue
+    mock_db, mock_get_workflow_registry_entry, mock_get_celery_task, mapping, target, is_task, expected_queue
 ):
     wf_table = MagicMock()
     wf_table.is_task = is_task
     wf_table.target = str(target)
-    mock_get_workflow_by_name.return_value = wf_table
+    mock_get_workflow_registry_entry.return_value = wf_table
 
     pstat = MagicMock()
     trigger_task = MagicMock()
@@ -130,3 +131,23 @@ def test_resolve_queue_corrupt_target_fails_loudly():
 
     with mock.patch.object(app_settings, "CELERY_TARGET_QUEUES", RECONCILE_ONLY), pytest.raises(ValueError):
         _resolve_queue(workflow)
+
+
+@pytest.mark.parametrize(
+    "queues,priorities,target,expected_options",
+    [
+        pytest.param({}, {}, Target.VALIDATE, {}, id="nothing-configured"),
+        pytest.param({}, {Target.VALIDATE: 9}, Target.VALIDATE, {"priority": 9}, id="priority-only"),
+        pytest.param({}, {Target.CREATE: 0}, Target.CREATE, {"priority": 0}, id="zero-priority-kept"),
+        pytest.param(
+            RECONCILE_ONLY, {Target.RECONCILE: 5}, Target.RECONCILE, {"queue": "reconcile", "priority": 5}, id="both"
+        ),
+        pytest.param(RECONCILE_ONLY, {Target.VALIDATE: 9}, Target.MODIFY, {}, id="unmapped-target"),
+    ],
+)
+def test_resolve_options(queues, priorities, target, expected_options):
+    workflow = MagicMock()
+    workflow.target = str(target)
+
+    with mock.patch.multiple(app_settings, CELERY_TARGET_QUEUES=queues, CELERY_TARGET_PRIORITIES=priorities):
+        assert _resolve_options(workflow) == expected_options
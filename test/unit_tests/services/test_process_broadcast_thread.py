@@ -75,12 +75,19 @@ def test_broadcast_ws_fn_swallows_exceptions():
 
 def test_broadcast_queue_put_fn_puts_process_id_on_queue():
     process_id = uuid4()
+    subscription_ids = {uuid4()}
     broadcast_queue: queue.Queue = queue.Queue()
 
-    _broadcast_queue_put_fn(broadcast_queue, process_id)
+    with patch(
+        "orchestrator.core.services.process_broadcast_thread.get_terminated_process_subscription_ids",
+        return_value=subscription_ids,
+    ) as mock_get_subscription_ids:
+        _broadcast_queue_put_fn(broadcast_queue, process_id)
 
+    # The status is read by the workflow thread, which may not have committed it yet
+    mock_get_subscription_ids.assert_called_once_with(process_id)
     assert not broadcast_queue.empty()
-    assert broadcast_queue.get_nowait() == process_id
+    assert broadcast_queue.get_nowait() == (process_id, subscription_ids)
 
 
 def test_broadcast_queue_put_fn_swallows_exceptions():
@@ -89,7 +96,11 @@ def test_broadcast_queue_put_fn_swallows_exceptions():
     bad_queue.put.side_effect = RuntimeError("queue full")
 
     # Must not raise
-    _broadcast_queue_put_fn(bad_queue, process_id)
+    with patch(
+        "orchestrator.core.services.process_broadcast_thread.get_terminated_process_subscription_ids",
+        return_value=None,
+    ):
+        _broadcast_queue_put_fn(bad_queue, process_id)
 
 
 # ---------------------------------------------------------------------------
@@ -109,8 +120,12 @@ def test_api_broadcast_process_data_returns_partial_when_broadcast_thread_presen
 
     # Verify it's bound to the right queue by calling it
     process_id = uuid4()
-    result(process_id)
-    assert mock_queue.get_nowait() == process_id
+    with patch(
+        "orchestrator.core.services.process_broadcast_thread.get_terminated_process_subscription_ids",
+        return_value=None,
+    ):
+        result(process_id)
+    assert mock_queue.get_nowait() == (process_id, None)
 
 
 def test_api_broadcast_process_data_returns_ws_fn_when_no_thread_but_ws_enabled():
@@ -180,24 +195,19 @@ def test_process_data_broadcast_thread_stop_joins_thread(mock_ws_manager):
 
 def test_process_data_broadcast_thread_processes_queue_item(mock_ws_manager):
     process_id = uuid4()
+    subscription_ids = {uuid4()}
 
-    async def _noop_coroutine():
-        return None
-
-    with patch(
-        "orchestrator.core.services.process_broadcast_thread.broadcast_process_update_to_websocket_async",
-        side_effect=lambda _pid: _noop_coroutine(),
-    ) as mock_async_broadcast:
+    with patch("orchestrator.core.services.process_broadcast_thread.sync_broadcast_process_update") as mock_broadcast:
         thread = ProcessDataBroadcastThread(mock_ws_manager, daemon=True)
         thread.start()
 
-        thread.queue.put(process_id)
+        thread.queue.put((process_id, subscription_ids))
         # Give the thread time to process the item
         time.sleep(0.2)
 
         thread.stop()
 
-    mock_async_broadcast.assert_called_with(process_id)
+    mock_broadcast.assert_called_with(process_id, subscription_ids)
 
 
 def test_process_data_broadcast_thread_queue_is_isolated_between_instances(mock_ws_manager):
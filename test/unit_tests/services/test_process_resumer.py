@@ -0,0 +1,54 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from orchestrator.core.services.process_resumer import RateLimiter, ResumeProgress
+
+
+@mock.patch("orchestrator.core.services.process_resumer.time")
+def test_rate_limiter_spaces_out_calls(mock_time):
+    mock_time.monotonic.return_value = 100.0
+    rate_limiter = RateLimiter(rate=4)
+
+    for _ in range(3):
+        rate_limiter.wait()
+
+    assert mock_time.sleep.call_args_list == [mock.call(0.25), mock.call(0.5)]
+
+
+@mock.patch("orchestrator.core.services.process_resumer.time")
+def test_rate_limiter_unlimited(mock_time):
+    rate_limiter = RateLimiter(rate=0)
+
+    for _ in range(3):
+        rate_limiter.wait()
+
+    mock_time.sleep.assert_not_called()
+
+
+def test_resume_progress():
+    progress = ResumeProgress(total=3)
+    progress.add(resumed=1)
+    progress.add(failed=1)
+
+    schema = progress.to_schema()
+    assert (schema.total, schema.resumed, schema.failed, schema.in_progress) == (3, 1, 1, True)
+    assert schema.finished_at is None
+
+    progress.add(resumed=1)
+    progress.finish()
+
+    schema = progress.to_schema()
+    assert (schema.resumed, schema.in_progress) == (2, False)
+    assert schema.finished_at is not None
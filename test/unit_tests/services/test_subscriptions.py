@@ -0,0 +1,77 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+from ipaddress import IPv4Address, IPv4Interface
+from uuid import uuid4
+
+import pytest
+
+from orchestrator.core.services.subscriptions import _generate_etag, format_extended_domain_model
+
+
+def test_generate_etag_is_stable_and_canonical():
+    subscription_id = uuid4()
+    model = {
+        "subscription_id": subscription_id,
+        "start_date": datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        "block": {"ip": IPv4Interface("10.0.0.1/24"), "values": [1, 2, 3], "owner": None},
+    }
+    reordered = {"block": {"owner": None, "values": [1, 2, 3], "ip": IPv4Interface("10.0.0.1/24")}} | {
+        "start_date": model["start_date"],
+        "subscription_id": subscription_id,
+    }
+
+    etag = _generate_etag(model)
+
+    assert len(etag) == 32
+    assert etag == _generate_etag(reordered)
+
+
+def test_generate_etag_changes_with_content():
+    model = {"subscription_id": uuid4(), "start_date": datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)}
+
+    assert _generate_etag(model) != _generate_etag(model | {"subscription_id": uuid4()})
+    assert _generate_etag(model) != _generate_etag(
+        model | {"start_date": datetime(2024, 1, 1, 12, tzinfo=timezone.utc)}
+    )
+    assert _generate_etag({"values": [1, 2]}) != _generate_etag({"values": [2, 1]})
+
+
+@pytest.mark.parametrize("filter_owner_relations", [True, False])
+def test_format_extended_domain_model(filter_owner_relations):
+    subscription_id, block_id, list_block_id, foreign_id = uuid4(), uuid4(), uuid4(), uuid4()
+    subscription = {
+        "subscription_id": subscription_id,
+        "product": {"name": "Product"},
+        "block": {
+            "subscription_instance_id": block_id,
+            "ip": IPv4Address("10.0.0.1"),
+            "in_use_by_ids": [],
+            "blocks": [
+                {
+                    "subscription_instance_id": list_block_id,
+                    "ips": [IPv4Interface("10.0.0.2/24")],
+                    "in_use_by_ids": [block_id, foreign_id],
+                }
+            ],
+        },
+    }
+
+    formatted = format_extended_domain_model(subscription, filter_owner_relations=filter_owner_relations)
+
+    assert formatted["block"]["ip"] == "10.0.0.1"
+    assert formatted["block"]["blocks"][0]["ips"] == ["10.0.0.2/24"]
+    assert formatted["block"]["in_use_by_ids"] == []
+    expected_in_use_by_ids = [foreign_id] if filter_owner_relations else [block_id, foreign_id]
+    assert formatted["block"]["blocks"][0]["in_use_by_ids"] == expected_in_use_by_ids
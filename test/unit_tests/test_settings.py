@@ -51,3 +51,15 @@ def test_celery_target_queues_rejects_invalid_env_var_at_startup(monkeypatch):
 
     with pytest.raises(ValidationError):
         AppSettings()
+
+
+def test_celery_target_priorities_env_var_json_round_trip(monkeypatch):
+    monkeypatch.setenv("CELERY_TARGET_PRIORITIES", json.dumps({"CREATE": 0, "VALIDATE": 9}))
+
+    assert AppSettings().CELERY_TARGET_PRIORITIES == {Target.CREATE: 0, Target.VALIDATE: 9}
+
+
+@pytest.mark.parametrize("priority", [-1, 10])
+def test_celery_target_priorities_rejects_out_of_range_priority(priority):
+    with pytest.raises(ValidationError):
+        AppSettings(CELERY_TARGET_PRIORITIES={"VALIDATE": priority})
@@ -0,0 +1,103 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+
+import pytest
+
+from orchestrator.core.utils.async_bridge import AsyncBridge
+
+
+@pytest.fixture
+def bridge():
+    bridge = AsyncBridge("test-bridge", max_pending=10, concurrency=2)
+    yield bridge
+    bridge.stop()
+
+
+def test_submit_runs_on_one_background_loop(bridge):
+    threads = []
+
+    async def record(value):
+        threads.append((threading.current_thread().name, value))
+
+    for value in range(5):
+        assert bridge.submit(record, value)
+    bridge.stop()
+
+    assert sorted(value for _, value in threads) == [0, 1, 2, 3, 4]
+    assert {name for name, _ in threads} == {"test-bridge"}
+
+
+def test_submit_drops_when_full(bridge):
+    started = threading.Semaphore(0)
+    release = threading.Event()
+    done = []
+
+    async def blocked():
+        started.release()
+        await asyncio.to_thread(release.wait)
+
+    async def record(value):
+        done.append(value)
+
+    # Occupy the maximum number of running coroutines so the next submissions stay pending
+    bridge.submit(blocked)
+    bridge.submit(blocked)
+    assert started.acquire(timeout=5)
+    assert started.acquire(timeout=5)
+    accepted = [bridge.submit(record, value) for value in range(12)]
+    release.set()
+    bridge.stop()
+
+    assert accepted == [True] * 10 + [False] * 2
+    assert sorted(done) == list(range(10))
+
+
+def test_exceptions_do_not_stop_the_bridge(bridge):
+    done = []
+
+    async def fail():
+        raise ValueError("broadcast failed")
+
+    async def record():
+        done.append(True)
+
+    bridge.submit(fail)
+    bridge.submit(record)
+    bridge.stop()
+
+    assert done == [True]
+
+
+def test_submissions_left_by_a_timed_out_stop_run_on_the_next_loop():
+    release = threading.Event()
+    done = []
+
+    async def blocked():
+        await asyncio.to_thread(release.wait)
+
+    async def record(value):
+        done.append(value)
+
+    single = AsyncBridge("single-bridge", max_pending=10, concurrency=1)
+    single.submit(blocked)
+    single.submit(record, 1)
+    single.stop(timeout=0.1)
+    release.set()
+
+    assert single.submit(record, 2)
+    single.stop()
+
+    assert done == [1, 2]
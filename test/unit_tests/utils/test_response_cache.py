@@ -0,0 +1,96 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from orchestrator.core.utils import response_cache as response_cache_module
+from orchestrator.core.utils.response_cache import (
+    ResponseCache,
+    cache_key,
+    cached_response,
+    invalidate_response_cache,
+)
+
+
+@pytest.fixture
+def response_cache():
+    cache = ResponseCache(maxsize=2, ttl=60)
+    with mock.patch.object(response_cache_module, "_response_cache", cache):
+        yield cache
+
+
+def test_cached_response(response_cache):
+    compute = mock.Mock(side_effect=[1, 2, 3])
+
+    assert cached_response(["subscriptions"], "key", compute) == 1
+    assert cached_response(["subscriptions"], "key", compute) == 1
+    assert cached_response(["subscriptions"], "other", compute) == 2
+    assert compute.call_count == 2
+
+
+def test_invalidate_response_cache(response_cache):
+    response_cache.set(response_cache.versioned_key(["subscriptions", "products"], "a"), "a")
+    response_cache.set(response_cache.versioned_key(["processes"], "b"), "b")
+
+    invalidate_response_cache({"type": "subscriptions", "id": "LIST"})
+
+    assert response_cache.get(response_cache.versioned_key(["subscriptions", "products"], "a")) is None
+    assert response_cache.get(response_cache.versioned_key(["processes"], "b")) == "b"
+
+
+def test_response_cache_maxsize_and_ttl(response_cache):
+    for key in ["a", "b", "c"]:
+        response_cache.set(key, key)
+
+    assert response_cache.get("a") is None
+    assert response_cache.get("c") == "c"
+
+    with mock.patch("orchestrator.core.utils.response_cache.time.monotonic", return_value=float("inf")):
+        assert response_cache.get("c") is None
+
+
+def test_response_cache_disabled():
+    compute = mock.Mock(side_effect=[1, 2])
+
+    assert cached_response(["subscriptions"], "key", compute) == 1
+    assert cached_response(["subscriptions"], "key", compute) == 2
+    invalidate_response_cache({"type": "subscriptions"})
+
+
+def test_cache_key():
+    assert cache_key("query", {"a": 1, "b": 2}) == cache_key("query", {"b": 2, "a": 1})
+    assert cache_key("query", {"a": 1}) != cache_key("query", {"a": 2})
+
+
+def test_async_redis_calls_run_in_a_thread():
+    redis = mock.MagicMock()
+    redis.mget.return_value = [None]
+    redis.get.return_value = None
+    threads = set()
+    redis.incr.side_effect = redis.set.side_effect = lambda *args, **kwargs: threads.add(threading.get_ident())
+    cache = ResponseCache(maxsize=2, ttl=60, redis=redis)
+
+    async def run():
+        versioned_key = await cache.versioned_key_async(["subscriptions"], "key")
+        assert await cache.get_async(versioned_key) is None
+        await cache.set_async(versioned_key, "value")
+        await cache.invalidate_async("subscriptions")
+
+    asyncio.run(run())
+
+    assert threads
+    assert threading.get_ident() not in threads
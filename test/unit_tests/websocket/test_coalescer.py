@@ -0,0 +1,80 @@
+# Copyright 2019-2026 SURF, GÉANT.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from orchestrator.core.websocket.coalescer import ProcessUpdateCoalescer
+
+
+async def test_updates_within_window_are_coalesced():
+    send = AsyncMock()
+    coalescer = ProcessUpdateCoalescer(send)
+    process_id = uuid4()
+
+    assert not coalescer.defer(process_id, 0.1)
+    assert coalescer.defer(process_id, 0.1)
+    assert coalescer.defer(process_id, 0.1)
+    send.assert_not_called()
+
+    await asyncio.sleep(0.2)
+    send.assert_awaited_once_with(process_id)
+
+
+async def test_processes_are_coalesced_independently():
+    send = AsyncMock()
+    coalescer = ProcessUpdateCoalescer(send)
+
+    assert not coalescer.defer(uuid4(), 0.1)
+    assert not coalescer.defer(uuid4(), 0.1)
+
+
+async def test_finish_cancels_trailing_update():
+    send = AsyncMock()
+    coalescer = ProcessUpdateCoalescer(send)
+    process_id = uuid4()
+
+    assert not coalescer.defer(process_id, 0.1)
+    assert coalescer.defer(process_id, 0.1)
+    coalescer.finish(process_id)
+
+    await asyncio.sleep(0.2)
+    send.assert_not_called()
+    # A new run of the process is sent right away
+    assert not coalescer.defer(process_id, 0.1)
+
+
+async def test_finish_forgets_process():
+    send = AsyncMock()
+    coalescer = ProcessUpdateCoalescer(send)
+    process_id = uuid4()
+
+    assert not coalescer.defer(process_id, 60)
+    coalescer.finish(process_id)
+
+    assert not coalescer._last_sent
+    assert not coalescer._trailing
+
+
+async def test_failing_trailing_update_is_logged():
+    send = AsyncMock(side_effect=RuntimeError("redis is down"))
+    coalescer = ProcessUpdateCoalescer(send)
+    process_id = uuid4()
+
+    coalescer.defer(process_id, 0.05)
+    coalescer.defer(process_id, 0.05)
+    await asyncio.sleep(0.1)
+
+    send.assert_awaited_once_with(process_id)
+    assert not coalescer._tasks
@@ -21,6 +21,8 @@ import pytest
 from orchestrator.core.websocket import (
     WS_CHANNELS,
     WrappedWebSocketManager,
+    _broadcast_trailing_process_update,
+    _coalesced_process_update,
     broadcast_invalidate_cache,
     broadcast_invalidate_status_counts,
     broadcast_invalidate_status_counts_async,
@@ -32,6 +34,7 @@ from orchestrator.core.websocket import (
     invalidate_subscription_cache_by_id,
     is_process_active,
     sync_broadcast_invalidate_cache,
+    sync_broadcast_process_update,
     sync_invalidate_subscription_cache,
 )
 from orchestrator.core.websocket.websocket_manager import WebSocketManager
@@ -229,16 +232,44 @@ def test_broadcast_invalidate_status_counts_sync(mock_sync, enabled: bool, sync_
         pytest.param(False, id="disabled"),
     ],
 )
-@patch("orchestrator.core.websocket.anyio")
-def test_broadcast_process_update_sync(mock_anyio, enabled: bool):
+@patch("orchestrator.core.websocket.broadcast_bridge")
+def test_broadcast_process_update_sync(mock_bridge, enabled: bool):
     process_id = uuid4()
-    with patch("orchestrator.core.websocket.websocket_manager") as mock_wsm:
+    subscription_ids = {uuid4()}
+    with (
+        patch("orchestrator.core.websocket.websocket_manager") as mock_wsm,
+        patch(
+            "orchestrator.core.websocket.get_terminated_process_subscription_ids", return_value=subscription_ids
+        ) as mock_get_subscription_ids,
+    ):
         mock_wsm.enabled = enabled
         broadcast_process_update_to_websocket(process_id)
         if enabled:
-            mock_anyio.run.assert_called_once_with(broadcast_process_update_to_websocket_async, process_id)
+            # The status is read by the caller, not by the bridge
+            mock_get_subscription_ids.assert_called_once_with(process_id)
+            mock_bridge.submit.assert_called_once_with(_coalesced_process_update, process_id, subscription_ids)
         else:
-            mock_anyio.run.assert_not_called()
+            mock_get_subscription_ids.assert_not_called()
+            mock_bridge.submit.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "enabled",
+    [
+        pytest.param(True, id="enabled"),
+        pytest.param(False, id="disabled"),
+    ],
+)
+@patch("orchestrator.core.websocket.broadcast_bridge")
+def test_sync_broadcast_process_update(mock_bridge, enabled: bool):
+    process_id = uuid4()
+    with patch("orchestrator.core.websocket.websocket_manager") as mock_wsm:
+        mock_wsm.enabled = enabled
+        sync_broadcast_process_update(process_id, None)
+        if enabled:
+            mock_bridge.submit.assert_called_once_with(_coalesced_process_update, process_id, None)
+        else:
+            mock_bridge.submit.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -262,18 +293,79 @@ async def test_broadcast_process_update_async(enabled: bool, expected_call_count
         assert mock_wsm.broadcast_data.await_count == expected_call_count
 
 
+@pytest.mark.parametrize(
+    "subscription_ids,expected_call_count",
+    [
+        pytest.param(None, 2, id="running"),
+        pytest.param({uuid4()}, 3, id="terminated"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_coalesced_process_update(subscription_ids, expected_call_count: int):
+    process_id = uuid4()
+    with (
+        patch("orchestrator.core.websocket.websocket_manager") as mock_wsm,
+        patch("orchestrator.core.websocket.process_update_coalescer") as mock_coalescer,
+    ):
+        mock_wsm.broadcast_data = AsyncMock()
+        mock_coalescer.defer.return_value = False
+        await _coalesced_process_update(process_id, subscription_ids)
+        assert mock_wsm.broadcast_data.await_count == expected_call_count
+
+        # Updates of running processes within the window are sent by the coalescer
+        mock_coalescer.defer.return_value = True
+        await _coalesced_process_update(process_id, subscription_ids)
+        assert mock_wsm.broadcast_data.await_count == expected_call_count * (1 if subscription_ids is None else 2)
+
+    if subscription_ids is None:
+        assert mock_coalescer.defer.call_count == 2
+    else:
+        mock_coalescer.defer.assert_not_called()
+        mock_coalescer.finish.assert_called_with(process_id)
+
+
+@pytest.mark.parametrize(
+    "subscription_ids,expected_call_count",
+    [
+        pytest.param(None, 2, id="running"),
+        pytest.param({uuid4()}, 3, id="terminated"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_broadcast_trailing_process_update(subscription_ids, expected_call_count: int):
+    """A deferred update reads the status again, the process may have finished since."""
+    process_id = uuid4()
+    with (
+        patch("orchestrator.core.websocket.websocket_manager") as mock_wsm,
+        patch("orchestrator.core.websocket.process_update_coalescer") as mock_coalescer,
+        patch(
+            "orchestrator.core.websocket._get_committed_terminated_process_subscription_ids",
+            return_value=subscription_ids,
+        ) as mock_get_subscription_ids,
+    ):
+        mock_wsm.broadcast_data = AsyncMock()
+        await _broadcast_trailing_process_update(process_id)
+
+    mock_get_subscription_ids.assert_called_once_with(process_id)
+    assert mock_wsm.broadcast_data.await_count == expected_call_count
+    if subscription_ids is None:
+        mock_coalescer.finish.assert_not_called()
+    else:
+        mock_coalescer.finish.assert_called_once_with(process_id)
+
+
 # --- sync wrappers ---
 
 
-@patch("orchestrator.core.websocket.anyio")
-def test_sync_broadcast_invalidate_cache(mock_anyio):
+@patch("orchestrator.core.websocket.broadcast_bridge")
+def test_sync_broadcast_invalidate_cache(mock_bridge):
     cache_obj = {"type": "test"}
     sync_broadcast_invalidate_cache(cache_obj)
-    mock_anyio.run.assert_called_once_with(broadcast_invalidate_cache, cache_obj)
+    mock_bridge.submit.assert_called_once_with(broadcast_invalidate_cache, cache_obj)
 
 
-@patch("orchestrator.core.websocket.anyio")
-def test_sync_invalidate_subscription_cache(mock_anyio):
+@patch("orchestrator.core.websocket.broadcast_bridge")
+def test_sync_invalidate_subscription_cache(mock_bridge):
     sub_id = uuid4()
     sync_invalidate_subscription_cache(sub_id, True)
-    mock_anyio.run.assert_called_once_with(invalidate_subscription_cache, sub_id, True)
+    mock_bridge.submit.assert_called_once_with(invalidate_subscription_cache, sub_id, True)
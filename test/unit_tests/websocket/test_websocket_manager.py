@@ -13,6 +13,7 @@
 
 """Tests for WebSocketManager: authorization, Memory/Broadcast backend connect/disconnect, data broadcasting, and channel cleanup."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,7 +21,7 @@ from fastapi import WebSocket, status
 from fastapi.exceptions import HTTPException
 from starlette.websockets import WebSocketDisconnect, WebSocketState
 
-from orchestrator.core.websocket.managers.broadcast_websocket_manager import BroadcastWebsocketManager
+from orchestrator.core.websocket.managers.broadcast_websocket_manager import BroadcastWebsocketManager, WebsocketHub
 from orchestrator.core.websocket.managers.memory_websocket_manager import MemoryWebsocketManager
 from orchestrator.core.websocket.websocket_manager import WebSocketManager
 
@@ -398,55 +399,98 @@ async def test_broadcast_receiver_normal_message_no_pong(broadcast_mgr):
 # --- BroadcastWebsocketManager sender ---
 
 
-def _mock_subscriber(messages):
-    """Create a mock subscriber context manager that yields messages then raises."""
-    subscriber = AsyncMock()
-    subscriber.get_message = AsyncMock(side_effect=messages)
+def _mock_subscriber(messages, block=False):
+    """Create a mock subscriber context manager that listens to the messages, then blocks or ends."""
+
+    async def listen():
+        for message in messages:
+            yield message
+        if block:
+            await asyncio.Event().wait()
+
+    subscriber = MagicMock()
+    subscriber.listen = listen
     ctx = AsyncMock()
     ctx.__aenter__ = AsyncMock(return_value=subscriber)
     ctx.__aexit__ = AsyncMock(return_value=False)
     return ctx
 
 
-@pytest.mark.asyncio
-async def test_broadcast_sender_valid_message(broadcast_mgr):
-    ws = _make_broadcast_ws()
-    messages = [{"type": "message", "data": b"hello"}, Exception("stop")]
-    broadcast_mgr.broadcast = MagicMock()
-    broadcast_mgr.broadcast.subscriber = MagicMock(return_value=_mock_subscriber(messages))
-    await broadcast_mgr.sender(ws, "ch1")
-    ws.send_text.assert_awaited_once_with("hello")
+def _mock_broadcast(*subscribers):
+    broadcast = MagicMock()
+    broadcast.subscriber = MagicMock(side_effect=subscribers)
+    return broadcast
 
 
 @pytest.mark.asyncio
-async def test_broadcast_sender_none_message_skipped(broadcast_mgr):
+async def test_broadcast_sender_sends_messages_until_dropped(broadcast_mgr):
     ws = _make_broadcast_ws()
-    messages = [None, {"type": "message", "data": b"after_none"}, Exception("stop")]
-    broadcast_mgr.broadcast = MagicMock()
-    broadcast_mgr.broadcast.subscriber = MagicMock(return_value=_mock_subscriber(messages))
+    messages = [{"type": "message", "data": b"hello"}, {"type": "unknown", "data": "stuff"}]
+    broadcast_mgr.hub.broadcast = _mock_broadcast(_mock_subscriber(messages))
     await broadcast_mgr.sender(ws, "ch1")
-    ws.send_text.assert_awaited_once_with("after_none")
+    ws.send_text.assert_awaited_once_with("hello")
+    # The subscription ended, the client is disconnected so it reconnects
+    ws.close.assert_awaited_once_with(status.WS_1013_TRY_AGAIN_LATER)
+    assert broadcast_mgr.hub.queues == {}
+    assert broadcast_mgr.hub.readers == {}
 
 
 @pytest.mark.asyncio
-async def test_broadcast_sender_unrecognized_message_dropped(broadcast_mgr):
+async def test_broadcast_sender_subscriber_exception(broadcast_mgr):
     ws = _make_broadcast_ws()
-    messages = [{"type": "unknown", "data": "stuff"}, Exception("stop")]
-    broadcast_mgr.broadcast = MagicMock()
-    broadcast_mgr.broadcast.subscriber = MagicMock(return_value=_mock_subscriber(messages))
+    ctx = AsyncMock()
+    ctx.__aenter__ = AsyncMock(side_effect=RuntimeError("redis down"))
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    broadcast_mgr.hub.broadcast = _mock_broadcast(ctx)
     await broadcast_mgr.sender(ws, "ch1")
     ws.send_text.assert_not_awaited()
+    ws.close.assert_awaited_once_with(status.WS_1013_TRY_AGAIN_LATER)
 
 
 @pytest.mark.asyncio
 async def test_broadcast_sender_exception_logged(broadcast_mgr):
     ws = _make_broadcast_ws()
-    ctx = AsyncMock()
-    ctx.__aenter__ = AsyncMock(side_effect=RuntimeError("redis down"))
-    ctx.__aexit__ = AsyncMock(return_value=False)
-    broadcast_mgr.broadcast = MagicMock()
-    broadcast_mgr.broadcast.subscriber = MagicMock(return_value=ctx)
+    ws.send_text.side_effect = RuntimeError("connection lost")
+    broadcast_mgr.hub.broadcast = _mock_broadcast(_mock_subscriber([{"type": "message", "data": b"hello"}]))
     await broadcast_mgr.sender(ws, "ch1")
+    ws.close.assert_not_awaited()
+
+
+# --- WebsocketHub ---
+
+
+@pytest.mark.asyncio
+async def test_hub_subscribes_once_per_channel():
+    broadcast = _mock_broadcast(_mock_subscriber([], block=True), _mock_subscriber([], block=True))
+    hub = WebsocketHub(broadcast, queue_size=10)
+
+    async with hub.subscribe("ch1") as queue1, hub.subscribe("ch1") as queue2:
+        await asyncio.sleep(0)
+        broadcast.subscriber.assert_called_once_with("ch1")
+
+        hub._publish("ch1", "hello")
+        assert queue1.get_nowait() == queue2.get_nowait() == "hello"
+
+    assert hub.queues == {}
+    assert hub.readers == {}
+
+
+@pytest.mark.asyncio
+async def test_hub_drops_slow_client():
+    hub = WebsocketHub(_mock_broadcast(_mock_subscriber([], block=True)), queue_size=1)
+
+    async with hub.subscribe("ch1") as fast, hub.subscribe("ch1") as slow:
+        hub._publish("ch1", "first")
+        assert fast.get_nowait() == "first"
+
+        hub._publish("ch1", "second")
+        assert fast.get_nowait() == "second"
+        # The pending message is discarded, the client only gets the signal that it is dropped
+        assert slow.get_nowait() is None
+        assert slow.empty()
+        assert hub.queues["ch1"] == {fast}
+
+    await hub.close()
 
 
 # --- BroadcastWebsocketManager broadcast_data ---
@@ -13,6 +13,8 @@
 
 """Tests for LazyWorkflowInstance error handling and get_workflow lookup."""
 
+from unittest import mock
+
 import pytest
 
 from orchestrator.core.workflows import ALL_WORKFLOWS, LazyWorkflowInstance, get_workflow
@@ -48,3 +50,15 @@ def test_lazy_workflow_instance_str_repr() -> None:
 
 def test_get_workflow_returns_none_for_unknown() -> None:
     assert get_workflow("nonexistent_workflow_xyz_12345") is None
+
+
+def test_lazy_workflow_instance_instantiates_once() -> None:
+    lwi = LazyWorkflowInstance(".modify_note", "modify_note")
+    workflow = lwi.instantiate()
+
+    with mock.patch("orchestrator.core.workflows.import_module") as import_module:
+        assert lwi.instantiate() is workflow
+        assert get_workflow("modify_note") is workflow
+
+    import_module.assert_not_called()
+    assert workflow.name == "modify_note"